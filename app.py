@@ -1,36 +1,30 @@
 import streamlit as st
-import os
 from types import SimpleNamespace
 from src.parsers.ingestor import IngestionFactory
-from src.eda_core.metadata_extractor import MetadataExtractor
 from src.eda_core.profiler import Profiler
+from src.eda_core.profile_cache import ProfileCache
 from src.eda_core.eda_engine import EDAEngine
-from src.utils.models import DocType
 from src.pipelines.preprocessing_pipelines import PreprocessingPipeline
 
 st.set_page_config(page_title="Auto EDA with RAG", layout="wide")
 st.title("📊 Auto EDA & Preprocessing Tool")
 
+@st.cache_resource
+def get_profile_cache() -> ProfileCache:
+    # One cache per server process, so hit/miss counters survive reruns
+    return ProfileCache("src/artifacts/profile_cache")
+
 uploaded_file = st.file_uploader(
     "Upload your dataset",
-    type=["csv", "xlsx", "json", "parquet"]
+    type=["csv", "xlsx", "json", "parquet", "gz", "bz2", "zst", "zip"]
 )
 
 if uploaded_file:
     # 1️⃣ Load data dynamically via ingestion factory
     try:
-        ext = os.path.splitext(uploaded_file.name)[1].lower()
-        if ext == ".csv":
-            file_type = DocType.CSV
-        elif ext in [".xls", ".xlsx"]:
-            file_type = DocType.XLSX
-        elif ext == ".json":
-            file_type = DocType.JSON
-        elif ext == ".parquet":
-            file_type = DocType.PARQUET
-        else:
-            st.error(f"Unsupported file type: {ext}")
-            st.stop()
+        # Compressed uploads (.csv.gz, .json.zst, zip) are typed by their inner
+        # file and decompressed by the parser while it reads them
+        file_type = IngestionFactory.detect_doc_type(uploaded_file.name, stream=uploaded_file)
 
         fake_upload_file = SimpleNamespace(
             filename=uploaded_file.name,
@@ -56,11 +50,11 @@ if uploaded_file:
             if not target_col:
                 st.error("Please select a target column first!")
             else:
-                profiler = Profiler(output_dir="src/artifacts/profiles")
-                json_path = profiler.generate_profile(df, report_name=uploaded_file.name)
+                profiler = Profiler(output_dir="src/artifacts/profiles", cache=get_profile_cache())
+                column_stats = profiler.profile_columns(df, report_name=uploaded_file.name, persist=True)
 
                 eda_engine = EDAEngine(output_dir="src/artifacts", use_llm_summary=False)
-                results = eda_engine.run(df, json_path, target_column=target_col, task_type="classification")
+                results = eda_engine.run(df, column_stats=column_stats, target_column=target_col, task_type="classification")
 
                 st.subheader("📄 Dataset Summary")
                 summary = results["summary"]
@@ -80,12 +74,10 @@ if uploaded_file:
                 st.error("Please select a target column first!")
             else:
                # 1️⃣ Generate profiling report
-                profiler = Profiler(output_dir="src/artifacts/profiles")
-                json_path = profiler.generate_profile(df, report_name=uploaded_file.name)
+                profiler = Profiler(output_dir="src/artifacts/profiles", cache=get_profile_cache())
 
-                # 2️⃣ Extract column stats
-                metadata_extractor = MetadataExtractor()
-                column_stats = metadata_extractor.extract_col_data(json_path)
+                # 2️⃣ Get column stats in memory, without the JSON round trip
+                column_stats = profiler.profile_columns(df, report_name=uploaded_file.name)
 
             # 3️⃣ Run preprocessing
                 pipeline = PreprocessingPipeline(artifacts_dir="src/artifacts")
@@ -100,3 +92,16 @@ if uploaded_file:
                     file_name="processed_dataset.csv",
                     mime="text/csv"
                 )
+
+    # The HTML report is only rendered when asked for, and cached afterwards
+    if st.button("Render HTML Report"):
+        profiler = Profiler(output_dir="src/artifacts/profiles", cache=get_profile_cache())
+        profiler.generate_profile(df, report_name=uploaded_file.name)
+        html_path = profiler.render_html(uploaded_file.name)
+        with open(html_path, "rb") as f:
+            st.download_button(
+                label="Download HTML Report",
+                data=f.read(),
+                file_name=f"{uploaded_file.name}.html",
+                mime="text/html"
+            )
@@ -0,0 +1,62 @@
+"""
+CSV Engine Benchmark
+
+Compares the pandas and pyarrow engines of `CSVParser` on synthetic wide CSV
+files of several sizes, with and without column projection.
+
+Usage:
+    python -m benchmarks.bench_csv_engines
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.parsers.csv_parser import CSVParser
+
+ROW_COUNTS = [10_000, 50_000, 200_000]
+NUMERIC_COLUMNS = 300
+CATEGORICAL_COLUMNS = 20
+PROJECTED_COLUMNS = 12
+REPEATS = 3
+
+def make_csv(path: Path, num_rows: int) -> list:
+    """Write a wide synthetic CSV and return its column names."""
+    rng = np.random.default_rng(42)
+    data = {f"num_{i}": rng.normal(size=num_rows).round(4) for i in range(NUMERIC_COLUMNS)}
+    for i in range(CATEGORICAL_COLUMNS):
+        data[f"cat_{i}"] = rng.choice(["alpha", "beta", "gamma", "delta"], size=num_rows)
+    df = pd.DataFrame(data)
+    df.to_csv(path, index=False)
+    return list(df.columns)
+
+def time_load(parser: CSVParser, path: Path) -> float:
+    """Best-of-N wall time of a full load in seconds."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        parser.load_from_path(path)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    print(f"{'rows':>10} {'size MB':>8} {'pandas s':>9} {'arrow s':>8} {'speedup':>8} {'pandas proj s':>14} {'arrow proj s':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_rows in ROW_COUNTS:
+            path = Path(tmp) / f"wide_{num_rows}.csv"
+            columns = make_csv(path, num_rows)
+            projection = columns[:PROJECTED_COLUMNS]
+
+            pandas_s = time_load(CSVParser(engine="pandas"), path)
+            arrow_s = time_load(CSVParser(engine="pyarrow"), path)
+            pandas_proj_s = time_load(CSVParser(engine="pandas", usecols=projection), path)
+            arrow_proj_s = time_load(CSVParser(engine="pyarrow", usecols=projection), path)
+
+            size_mb = path.stat().st_size / 1024**2
+            print(f"{num_rows:>10} {size_mb:>8.1f} {pandas_s:>9.3f} {arrow_s:>8.3f} {pandas_s / arrow_s:>7.1f}x {pandas_proj_s:>14.3f} {arrow_proj_s:>13.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Parallel Profiler Benchmark
+
+Measures how the native profiler scales with the number of worker processes
+on a wide synthetic dataset, with columns profiled in batches.
+
+Usage:
+    python -m benchmarks.bench_parallel_profiler
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.eda_core.native_profiler import NativeProfiler
+
+NUM_ROWS = 20_000
+NUMERIC_COLUMNS = 2_000
+CATEGORICAL_COLUMNS = 100
+BATCH_SIZE = 128
+REPEATS = 3
+
+def make_frame() -> pd.DataFrame:
+    """Build a wide synthetic dataset with numeric and categorical columns."""
+    rng = np.random.default_rng(42)
+    numeric = pd.DataFrame(rng.normal(size=(NUM_ROWS, NUMERIC_COLUMNS)), columns=[f"num_{i}" for i in range(NUMERIC_COLUMNS)])
+    categorical = pd.DataFrame(
+        {f"cat_{i}": rng.choice(["alpha", "beta", "gamma", "delta"], size=NUM_ROWS) for i in range(CATEGORICAL_COLUMNS)}
+    )
+    return pd.concat([numeric, categorical], axis=1)
+
+def time_profile(profiler: NativeProfiler, df: pd.DataFrame) -> float:
+    """Best-of-N wall time of a profile in seconds."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        profiler.profile(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    df = make_frame()
+    cpus = os.cpu_count() or 1
+    worker_counts = [n for n in (1, 2, 4, 8, 16) if n <= cpus]
+
+    print(f"{NUM_ROWS} rows x {df.shape[1]} columns, batches of {BATCH_SIZE} columns")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    baseline = None
+    for workers in worker_counts:
+        seconds = time_profile(NativeProfiler(max_workers=workers, batch_size=BATCH_SIZE), df)
+        baseline = baseline or seconds
+        print(f"{workers:>8} {seconds:>9.3f} {baseline / seconds:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Profile Format Benchmark
+
+Compares the JSON report with the binary Arrow IPC profile for write time,
+read time (through MetadataExtractor) and file size, for reports of 10, 1,000
+and 10,000 columns. The reports hold the column statistics produced by the
+native engine; full ydata-profiling JSON reports are larger still.
+
+Usage:
+    python -m benchmarks.bench_profile_formats
+"""
+
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.eda_core.metadata_extractor import MetadataExtractor
+from src.eda_core.profile_format import write_binary_profile
+from src.eda_core.profiler import Profiler
+
+COLUMN_COUNTS = [10, 1_000, 10_000]
+NUM_ROWS = 200
+REPEATS = 3
+
+def make_frame(num_columns: int) -> pd.DataFrame:
+    """Build a synthetic dataset with alternating numeric and categorical columns."""
+    rng = np.random.default_rng(42)
+    data = {}
+    for i in range(num_columns):
+        if i % 2:
+            data[f"cat_{i}"] = rng.choice(["alpha", "beta", "gamma", "delta"], size=NUM_ROWS)
+        else:
+            data[f"num_{i}"] = rng.normal(size=NUM_ROWS)
+    return pd.DataFrame(data)
+
+def best_of(func, repeats: int = REPEATS) -> float:
+    """Best-of-N wall time of a call in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def write_json(path: str, report: dict):
+    """Write the report the way `Profiler` writes JSON reports."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f)
+
+def main():
+    print(f"{'columns':>8} {'format':>7} {'write ms':>9} {'read ms':>9} {'size KB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_columns in COLUMN_COUNTS:
+            df = make_frame(num_columns)
+            column_stats = Profiler(output_dir=tmp, use_cache=False, engine="native").profile_columns(df)
+            report = Profiler._to_profile_json(len(df), column_stats)
+            writers = {
+                "json": lambda path: write_json(path, report),
+                "arrow": lambda path: write_binary_profile(path, column_stats, table=report["table"]),
+            }
+            for report_format, write in writers.items():
+                path = os.path.join(tmp, f"bench.{report_format}")
+                write_s = best_of(lambda: write(path))
+                read_s = best_of(lambda: MetadataExtractor().extract_col_data(path))
+                size_kb = os.path.getsize(path) / 1024
+                print(f"{num_columns:>8} {report_format:>7} {write_s * 1e3:>9.2f} {read_s * 1e3:>9.2f} {size_kb:>9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Profiler Engine Benchmark
+
+Compares the ydata-profiling and native engines of `Profiler` on synthetic
+mixed-type datasets of several sizes. Caching is disabled so every run
+profiles the data.
+
+Usage:
+    python -m benchmarks.bench_profiler_engines
+"""
+
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.eda_core.profiler import Profiler
+
+ROW_COUNTS = [10_000, 100_000]
+NUMERIC_COLUMNS = 20
+CATEGORICAL_COLUMNS = 5
+REPEATS = 3
+
+def make_frame(num_rows: int) -> pd.DataFrame:
+    """Build a synthetic dataset with numeric, categorical and boolean columns and some missing values."""
+    rng = np.random.default_rng(42)
+    data = {f"num_{i}": rng.normal(size=num_rows) for i in range(NUMERIC_COLUMNS)}
+    for i in range(CATEGORICAL_COLUMNS):
+        data[f"cat_{i}"] = rng.choice(["alpha", "beta", "gamma", "delta"], size=num_rows)
+    data["flag"] = rng.random(num_rows) > 0.5
+    df = pd.DataFrame(data)
+    df.loc[df.sample(frac=0.05, random_state=0).index, "num_0"] = np.nan
+    return df
+
+def time_profile(profiler: Profiler, df: pd.DataFrame, repeats: int = REPEATS) -> float:
+    """Best-of-N wall time of a profile in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        profiler.generate_profile(df, report_name="bench")
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    print(f"{'rows':>10} {'columns':>8} {'ydata s':>9} {'native s':>9} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_rows in ROW_COUNTS:
+            df = make_frame(num_rows)
+            # ydata-profiling takes long enough that a single run is representative
+            ydata_s = time_profile(Profiler(output_dir=tmp, use_cache=False, engine="ydata"), df, repeats=1)
+            native_s = time_profile(Profiler(output_dir=tmp, use_cache=False, engine="native"), df)
+            print(f"{num_rows:>10} {df.shape[1]:>8} {ydata_s:>9.3f} {native_s:>9.3f} {ydata_s / native_s:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Columnar Column Statistics
+
+Holds the statistics of every column of a dataset in NumPy arrays, one
+array per ColumnSchema field plus a name index, instead of one pydantic
+object per column. Rules can select columns with vectorized masks, e.g.
+all numeric columns with more than half of their values missing, while the
+table still behaves as a read-only mapping of column names to ColumnSchema
+for existing callers.
+"""
+
+#Import libraries
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Import utils
+from src.utils.logging import get_logger
+from src.utils.models import ColType, ColumnSchema
+
+logger = get_logger(__name__)
+
+# Type codes index this tuple
+COL_TYPES = tuple(ColType)
+_TYPE_CODES = {col_type.value: code for code, col_type in enumerate(COL_TYPES)}
+
+class ColumnStatsTable(Mapping):
+    """
+    Column statistics stored column-wise in NumPy arrays.
+
+    Missing numeric statistics are stored as NaN and read back as None.
+    Indexing by column name returns a ColumnSchema view of that column.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        type_codes: np.ndarray,
+        missing_pct: np.ndarray,
+        unique: np.ndarray,
+        mean: np.ndarray,
+        std: np.ndarray,
+        min: np.ndarray,
+        max: np.ndarray,
+        mode: np.ndarray,
+        is_estimate: np.ndarray,
+        confidence_intervals: Optional[Dict[str, Dict[str, Tuple[float, float]]]] = None,
+    ):
+        """
+        Args:
+            names (Sequence[str]): Column names.
+            type_codes (np.ndarray): Index of each column's type in COL_TYPES.
+            missing_pct (np.ndarray): Missing fraction of each column, NaN if unknown.
+            unique (np.ndarray): Distinct count of each column, NaN if unknown.
+            mean, std, min, max (np.ndarray): Numeric statistics, NaN if not available.
+            mode (np.ndarray): Most frequent value of each column, None if not available.
+            is_estimate (np.ndarray): Whether the column statistics were estimated from a sample.
+            confidence_intervals (Optional[Dict]): Intervals of the estimated columns, by column name.
+        """
+        self.names = np.empty(len(names), dtype=object)
+        self.names[:] = list(names)
+        self.type_codes = np.asarray(type_codes, dtype=np.int8)
+        self.missing_pct = np.asarray(missing_pct, dtype=np.float64)
+        self.unique = np.asarray(unique, dtype=np.float64)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.std = np.asarray(std, dtype=np.float64)
+        self.min = np.asarray(min, dtype=np.float64)
+        self.max = np.asarray(max, dtype=np.float64)
+        self.mode = np.asarray(mode, dtype=object)
+        self.is_estimate = np.asarray(is_estimate, dtype=bool)
+        self.confidence_intervals = confidence_intervals or {}
+        self._index: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_columns(cls, names: Sequence[str], types: Sequence[Union[str, ColType]], **fields: Any) -> "ColumnStatsTable":
+        """
+        Build a table from per-field sequences, with None for missing values.
+
+        Args:
+            names (Sequence[str]): Column names.
+            types (Sequence[str | ColType]): Column types, as ColType or profile type names.
+            **fields: Sequences for missing_pct, unique, mean, std, min, max, mode and
+                is_estimate, and an optional confidence_intervals dict by column name.
+
+        Returns:
+            ColumnStatsTable: The table.
+        """
+        num_columns = len(names)
+        codes = {raw: _type_code(raw) for raw in set(types)}
+
+        def numbers(field: str) -> np.ndarray:
+            values = fields.get(field)
+            if values is None:
+                return np.full(num_columns, np.nan)
+            return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+        mode = np.empty(num_columns, dtype=object)
+        mode[:] = fields.get("mode", [None] * num_columns)
+        return cls(
+            names=names,
+            type_codes=np.array([codes[raw] for raw in types], dtype=np.int8),
+            missing_pct=numbers("missing_pct"),
+            unique=numbers("unique"),
+            mean=numbers("mean"),
+            std=numbers("std"),
+            min=numbers("min"),
+            max=numbers("max"),
+            mode=mode,
+            is_estimate=np.array([bool(v) for v in fields.get("is_estimate", [False] * num_columns)], dtype=bool),
+            confidence_intervals=fields.get("confidence_intervals"),
+        )
+
+    @classmethod
+    def from_column_stats(cls, column_stats: Mapping) -> "ColumnStatsTable":
+        """Build a table from a mapping of column names to ColumnSchema."""
+        if isinstance(column_stats, cls):
+            return column_stats
+        stats = list(column_stats.values())
+        return cls.from_columns(
+            names=list(column_stats),
+            types=[s.type for s in stats],
+            missing_pct=[s.missing_pct for s in stats],
+            unique=[s.unique for s in stats],
+            mean=[s.mean for s in stats],
+            std=[s.std for s in stats],
+            min=[s.min for s in stats],
+            max=[s.max for s in stats],
+            mode=[s.mode for s in stats],
+            is_estimate=[s.is_estimate for s in stats],
+            confidence_intervals={name: dict(s.confidence_intervals) for name, s in column_stats.items() if s.confidence_intervals},
+        )
+
+    @classmethod
+    def from_variables(cls, variables: Iterable[Tuple[str, Dict[str, Any]]]) -> "ColumnStatsTable":
+        """
+        Build a table from the column entries of a profile's 'variables' section.
+
+        Args:
+            variables (Iterable[Tuple[str, Dict[str, Any]]]): Column names and their profile entries,
+                e.g. `profile["variables"].items()` or `iter_profile_variables(path)`.
+
+        Returns:
+            ColumnStatsTable: The table.
+        """
+        names, entries = [], []
+        for name, stats in variables:
+            names.append(name)
+            entries.append(stats)
+        return cls.from_columns(
+            names=names,
+            types=[(stats.get("type") or "").lower() for stats in entries],
+            missing_pct=[stats.get("p_missing", 0.0) for stats in entries],
+            unique=[stats.get("n_unique", 0) for stats in entries],
+            mean=[stats.get("mean") for stats in entries],
+            std=[stats.get("std") for stats in entries],
+            min=[stats.get("min") for stats in entries],
+            max=[stats.get("max") for stats in entries],
+            mode=[stats.get("mode") for stats in entries],
+            is_estimate=[stats.get("is_estimate", False) for stats in entries],
+            confidence_intervals={
+                name: {stat: tuple(bounds) for stat, bounds in stats["confidence_intervals"].items()}
+                for name, stats in zip(names, entries) if stats.get("confidence_intervals")
+            },
+        )
+
+    @property
+    def types(self) -> np.ndarray:
+        """ColType of each column."""
+        return np.array(COL_TYPES, dtype=object)[self.type_codes]
+
+    def is_type(self, *col_types: ColType) -> np.ndarray:
+        """
+        Mask of the columns of the given types.
+
+        Args:
+            *col_types (ColType): Column types to select.
+
+        Returns:
+            np.ndarray: Boolean mask aligned with `names`.
+        """
+        return np.isin(self.type_codes, [_TYPE_CODES[ColType(t).value] for t in col_types])
+
+    def present_in(self, columns: Iterable[str]) -> np.ndarray:
+        """
+        Mask of the columns found in `columns`, e.g. the columns of a DataFrame.
+
+        Args:
+            columns (Iterable[str]): Column names to look up.
+
+        Returns:
+            np.ndarray: Boolean mask aligned with `names`.
+        """
+        # A hash lookup; np.isin compares object arrays pairwise
+        return pd.Index(self.names).isin(columns)
+
+    def filter(self, mask: np.ndarray) -> "ColumnStatsTable":
+        """
+        Select columns with a boolean mask, e.g.
+        `stats.filter(stats.is_type(ColType.NUMERIC) & (stats.missing_pct > 0.5))`.
+
+        Args:
+            mask (np.ndarray): Boolean mask aligned with `names`.
+
+        Returns:
+            ColumnStatsTable: Table of the selected columns.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        names = self.names[mask]
+        return ColumnStatsTable(
+            names=names,
+            type_codes=self.type_codes[mask],
+            missing_pct=self.missing_pct[mask],
+            unique=self.unique[mask],
+            mean=self.mean[mask],
+            std=self.std[mask],
+            min=self.min[mask],
+            max=self.max[mask],
+            mode=self.mode[mask],
+            is_estimate=self.is_estimate[mask],
+            confidence_intervals={name: self.confidence_intervals[name] for name in names if name in self.confidence_intervals},
+        )
+
+    def to_dict(self) -> Dict[str, ColumnSchema]:
+        """Materialise the table as a dict of ColumnSchema."""
+        return {name: self._schema(i) for i, name in enumerate(self.names)}
+
+    def __getitem__(self, name: str) -> ColumnSchema:
+        if self._index is None:
+            self._index = {col: i for i, col in enumerate(self.names)}
+        return self._schema(self._index[name])
+
+    def __contains__(self, name: object) -> bool:
+        if self._index is None:
+            self._index = {col: i for i, col in enumerate(self.names)}
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names.tolist())
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"ColumnStatsTable({len(self)} columns)"
+
+    def _schema(self, i: int) -> ColumnSchema:
+        """ColumnSchema view of the i-th column. The arrays hold validated values, so it is not validated again."""
+        name = self.names[i]
+        return ColumnSchema.model_construct(
+            name=name,
+            type=COL_TYPES[self.type_codes[i]],
+            missing_pct=_optional(self.missing_pct[i]),
+            unique=_optional(self.unique[i], int),
+            mean=_optional(self.mean[i]),
+            std=_optional(self.std[i]),
+            min=_optional(self.min[i]),
+            max=_optional(self.max[i]),
+            mode=self.mode[i],
+            is_estimate=bool(self.is_estimate[i]),
+            confidence_intervals=dict(self.confidence_intervals.get(name, {})),
+        )
+
+def as_stats_table(column_stats: Mapping) -> ColumnStatsTable:
+    """
+    Return column statistics as a ColumnStatsTable, converting a dict of ColumnSchema if needed.
+
+    Args:
+        column_stats (Mapping): ColumnStatsTable or mapping of column names to ColumnSchema.
+
+    Returns:
+        ColumnStatsTable: The statistics in columnar form.
+    """
+    return ColumnStatsTable.from_column_stats(column_stats)
+
+def _type_code(raw: Union[str, ColType]) -> int:
+    """Code of a column type, UNKNOWN for unrecognized type names."""
+    value = raw.value if isinstance(raw, ColType) else raw
+    code = _TYPE_CODES.get(value)
+    if code is None:
+        logger.warning(f"Unrecognized column type '{value}'. Defaulting to UNKNOWN.")
+        code = _TYPE_CODES[ColType.UNKNOWN.value]
+    return code
+
+def _optional(value: float, cast=float) -> Optional[Any]:
+    """Convert a stored NaN back to None."""
+    return None if np.isnan(value) else cast(value)
@@ -0,0 +1,236 @@
+"""
+Compiled Preprocessing Plan
+
+Turns a fitted PreprocessingPlan into lookup tables and constant arrays, so
+single records and micro-batches can be transformed with a handful of NumPy
+operations instead of the pandas steps of `PreprocessingPipeline.transform`:
+
+    - Numeric columns form one matrix that is filled, capped, scaled and
+      log-transformed with per-column constant arrays
+    - One-hot and target encodings are dict lookups from category to index/value
+    - Date parts are computed from datetime64 arithmetic
+
+The output matches `PreprocessingPipeline.transform` on the same rows.
+"""
+
+#Import libraries
+from typing import Any, Dict, List, Mapping, Sequence, Union
+
+import numpy as np
+
+# Import utils
+from src.utils.exceptions import PreprocessingError
+from src.utils.logging import get_logger
+from src.utils.models import PreprocessingPlan
+
+logger = get_logger(__name__)
+
+class CompiledPlan:
+    """
+    Fitted preprocessing plan compiled for low-latency transforms of records.
+
+    Build it with `CompiledPlan(plan)` or `PreprocessingPipeline.compile()`.
+    """
+
+    def __init__(self, plan: PreprocessingPlan):
+        """
+        Args:
+            plan (PreprocessingPlan): Fitted plan to compile.
+        """
+        self.plan = plan
+        self.output_columns = list(plan.output_columns)
+        dropped = set(plan.missing_values.drop_columns)
+        dropped.update(step.column for step in plan.transformations.steps if step.action == "drop")
+        fill_values = plan.missing_values.fill_values
+
+        # Numeric columns: every column with outlier bounds or scaling
+        transform_steps = {step.column: step for step in plan.transformations.steps}
+        numeric = [step.column for step in plan.outliers.steps]
+        numeric += [col for col in plan.encodings.scaling if col not in numeric]
+        numeric += [col for col, step in transform_steps.items() if step.action in ("log1p", "scale") and col not in numeric]
+        self._numeric = [col for col in numeric if col not in dropped]
+        self._numeric_fill = np.array([fill_values.get(col, np.nan) for col in self._numeric], dtype=np.float64)
+        self._numeric_has_fill = ~np.isnan(self._numeric_fill)
+
+        index = {col: i for i, col in enumerate(self._numeric)}
+        num_numeric = len(self._numeric)
+        self._cap_lower = np.full(num_numeric, -np.inf)
+        self._cap_upper = np.full(num_numeric, np.inf)
+        removals = []
+        for step in plan.outliers.steps:
+            if step.column not in index:
+                continue
+            if step.action == "cap-at-percentiles":
+                self._cap_lower[index[step.column]] = step.lower
+                self._cap_upper[index[step.column]] = step.upper
+            else:
+                removals.append((index[step.column], step.lower, step.upper))
+        self._remove_index = np.array([i for i, _, _ in removals], dtype=np.intp)
+        self._remove_lower = np.array([lower for _, lower, _ in removals], dtype=np.float64)
+        self._remove_upper = np.array([upper for _, _, upper in removals], dtype=np.float64)
+
+        # Unscaled columns get center 0 and scale 1, which leaves their values unchanged
+        self._scale_center, self._scale_scale = self._scaling_arrays(plan.encodings.scaling, index)
+        self._transform_center, self._transform_scale = self._scaling_arrays(
+            {col: step.params for col, step in transform_steps.items() if step.action == "scale"}, index,
+        )
+        self._log_index = np.array([index[col] for col, step in transform_steps.items() if step.action == "log1p" and col in index], dtype=np.intp)
+
+        self._one_hot = {
+            col: ({category: i for i, category in enumerate(categories)}, [f"{col}_{category}" for category in categories])
+            for col, categories in plan.encodings.one_hot.items() if col not in dropped
+        }
+        self._target = {
+            col: (dict(zip(encoding.categories, encoding.values)), encoding.default,
+                  encoding.default if encoding.missing is None else encoding.missing)
+            for col, encoding in plan.encodings.target.items() if col not in dropped
+        }
+        self._to_int = [col for col, step in transform_steps.items() if step.action == "to-int"]
+        self._date_parts = [col for col, step in transform_steps.items() if step.action == "date-parts"]
+
+        handled = set(self._numeric) | set(self._one_hot) | set(self._target) | set(self._to_int) | set(self._date_parts)
+        self._passthrough = [col for col in plan.input_columns if col not in handled and col not in dropped]
+        self._fill_values = fill_values
+        self._input_columns = [col for col in plan.input_columns if col not in dropped]
+
+    def transform(self, records: Union[Mapping[str, Any], Sequence[Mapping[str, Any]]], remove_outliers: bool = True) -> List[Dict[str, Any]]:
+        """
+        Transform records. Keys missing from a record are treated as missing values.
+
+        Args:
+            records (Mapping | Sequence[Mapping]): One record or a list of records, by input column name.
+            remove_outliers (bool): Whether to drop records outside the fitted outlier bounds.
+
+        Returns:
+            List[Dict[str, Any]]: Transformed records with the plan's output columns, in order.
+
+        Raises:
+            PreprocessingError: If a value cannot be transformed.
+        """
+        if isinstance(records, Mapping):
+            records = [records]
+        target = self.plan.target_column
+        columns = {
+            col: [record.get(col) for record in records]
+            for col in self._input_columns if col != target or any(target in record for record in records)
+        }
+        output = self.transform_columns(columns, remove_outliers)
+        names = list(output)
+        return [dict(zip(names, row)) for row in zip(*(values.tolist() for values in output.values()))]
+
+    def transform_columns(self, columns: Mapping[str, Sequence[Any]], remove_outliers: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Transform a batch given column-wise, e.g. `{"price": [10.5, 3.0], "city": ["a", None]}`.
+
+        Args:
+            columns (Mapping[str, Sequence[Any]]): Values of each input column. The target column may be missing.
+            remove_outliers (bool): Whether to drop rows outside the fitted outlier bounds.
+
+        Returns:
+            Dict[str, np.ndarray]: Values of each output column.
+
+        Raises:
+            PreprocessingError: If input columns are missing or a value cannot be transformed.
+        """
+        missing = [col for col in self._input_columns if col not in columns and col != self.plan.target_column]
+        if missing:
+            raise PreprocessingError(f"Columns missing from the data to transform: {missing}")
+
+        try:
+            num_rows = len(next(iter(columns.values()))) if columns else 0
+            numeric = np.empty((num_rows, len(self._numeric)))
+            for i, col in enumerate(self._numeric):
+                # An absent target column stays NaN and is left out of the output
+                numeric[:, i] = columns[col] if col in columns else np.nan
+            if numeric.size:
+                numeric = np.where(np.isnan(numeric) & self._numeric_has_fill, self._numeric_fill, numeric)
+                numeric = np.clip(numeric, self._cap_lower, self._cap_upper)
+
+            rows = None
+            if remove_outliers and len(self._remove_index):
+                values = numeric[:, self._remove_index]
+                keep = ((values >= self._remove_lower) & (values <= self._remove_upper)).all(axis=1)
+                if not keep.all():
+                    rows = np.flatnonzero(keep)
+                    numeric = numeric[rows]
+
+            if numeric.size:
+                numeric = (numeric - self._scale_center) / self._scale_scale
+                if len(self._log_index):
+                    numeric[:, self._log_index] = np.log1p(numeric[:, self._log_index])
+                numeric = (numeric - self._transform_center) / self._transform_scale
+
+            # An absent target column is left out of the output, as in `apply_encoding_plan`
+            output: Dict[str, np.ndarray] = {col: numeric[:, i] for i, col in enumerate(self._numeric) if col in columns}
+            for col, (lookup, names) in self._one_hot.items():
+                if col not in columns:
+                    continue
+                codes = np.array([lookup.get(value, -1) for value in self._filled(columns, col, rows)], dtype=np.intp)
+                indicators = np.zeros((len(codes), len(names)))
+                known = codes >= 0
+                indicators[np.flatnonzero(known), codes[known]] = 1.0
+                output.update(zip(names, indicators.T))
+            for col, (lookup, default, missing) in self._target.items():
+                if col not in columns:
+                    continue
+                output[col] = np.array([
+                    missing if value is None or value != value else lookup.get(value, default)
+                    for value in self._filled(columns, col, rows)
+                ], dtype=np.float64)
+            for col in self._to_int:
+                if col not in columns:
+                    continue
+                output[col] = np.array(self._filled(columns, col, rows), dtype=np.int64)
+            for col in self._date_parts:
+                if col not in columns:
+                    continue
+                dates = np.array(self._filled(columns, col, rows), dtype="datetime64[us]")
+                output[col] = dates
+                output.update({f"{col}_{part}": values for part, values in _date_parts(dates).items()})
+            for col in self._passthrough:
+                if col in columns:
+                    output[col] = np.array(self._filled(columns, col, rows), dtype=object)
+            return {col: output[col] for col in self.output_columns if col in output}
+
+        except Exception as e:
+            logger.error(f"Error while applying compiled preprocessing plan: {e}")
+            raise PreprocessingError(f"Failed to apply compiled preprocessing plan: {e}") from e
+
+    def _filled(self, columns: Mapping[str, Sequence[Any]], col: str, rows: Any) -> List[Any]:
+        """Values of a column at the kept rows, with missing values replaced by the fitted fill value."""
+        values = columns.get(col, ())
+        if rows is not None:
+            values = [values[i] for i in rows]
+        if col not in self._fill_values:
+            return list(values)
+        fill = self._fill_values[col]
+        return [fill if value is None or value != value else value for value in values]
+
+    def _scaling_arrays(self, scaling: Mapping[str, Any], index: Mapping[str, int]):
+        """Center and scale arrays aligned with the numeric columns."""
+        center = np.zeros(len(index))
+        scale = np.ones(len(index))
+        for col, params in scaling.items():
+            if col in index:
+                center[index[col]] = params.center
+                scale[index[col]] = params.scale
+        return center, scale
+
+def _date_parts(dates: np.ndarray) -> Dict[str, np.ndarray]:
+    """Year, month, day, weekday (Monday=0) and hour of datetime64 values. NaT gives NaN, like pandas' `.dt` accessors."""
+    years = dates.astype("datetime64[Y]")
+    months = dates.astype("datetime64[M]")
+    days = dates.astype("datetime64[D]")
+    parts = {
+        "year": years.astype(np.int64) + 1970,
+        "month": (months - years.astype("datetime64[M]")).astype(np.int64) + 1,
+        "day": (days - months.astype("datetime64[D]")).astype(np.int64) + 1,
+        # 1970-01-01 was a Thursday
+        "weekday": (days.astype(np.int64) + 3) % 7,
+        "hour": (dates - days).astype("timedelta64[h]").astype(np.int64),
+    }
+    missing = np.isnat(dates)
+    if missing.any():
+        # NaT converts to the smallest int64, which must not leak into the parts
+        parts = {part: np.where(missing, np.nan, values) for part, values in parts.items()}
+    return parts
@@ -26,14 +26,34 @@ class EDAEngine:
         self.visualizer = Visualizer(output_dir=self.output_dir / "visuals")
         logger.info(f"EDA Engine initialized. LLM Summary: {self.use_llm_summary}")
 
-    def run(self, df, profile_json_path, target_column=None, task_type=None, model=None):
+    def run(self, df, profile_json_path=None, target_column=None, task_type=None, model=None, column_stats=None, stats_cache=None):
+        """
+        Run the EDA steps on a dataset.
+
+        Args:
+            df (pd.DataFrame): Dataset to analyse.
+            profile_json_path (str): Path to the profiling JSON. Not needed when `column_stats` is given.
+            target_column (str): Target variable (optional).
+            task_type (str): 'classification' or 'regression' (optional).
+            model: Optional trained model for feature importance.
+            column_stats (Dict[str, ColumnSchema]): Column statistics handed over in memory,
+                e.g. from `Profiler.profile_columns`. Skips reading the profiling JSON.
+            stats_cache (ColumnStatsCache): Column statistics (skewness, quantiles, ...) shared with
+                other steps on the same data, e.g. `PreprocessingPipeline.run`.
+
+        Returns:
+            dict: EDA results containing summary, plots, feature importance.
+        """
         logger.info("Starting EDA Engine...")
         logger.debug(f"Parameters received - profile_json_path: {profile_json_path}, target_column: {target_column}, task_type: {task_type}, model: {type(model).__name__ if model else None}")
         logger.debug(f"DataFrame shape: {df.shape}")
 
-        metadata_extractor = MetadataExtractor()
-        logger.info("Extracting column metadata...")
-        column_stats = metadata_extractor.extract_col_data(profile_json_path)
+        if column_stats is None:
+            if profile_json_path is None:
+                raise ValueError("Either profile_json_path or column_stats is required")
+            metadata_extractor = MetadataExtractor()
+            logger.info("Extracting column metadata...")
+            column_stats = metadata_extractor.extract_col_data(profile_json_path)
         logger.debug(f"Extracted metadata for {len(column_stats)} columns")
 
         logger.info("Generating dataset summary...")
@@ -44,7 +64,7 @@ class EDAEngine:
             logger.debug(f"Generated summary text: {summary[:100]}...")
 
         logger.info("Determining visualization rules...")
-        rules = visualization_rules(df, column_stats, target_column=target_column, task_type=task_type)
+        rules = visualization_rules(df, column_stats, target_column=target_column, task_type=task_type, stats_cache=stats_cache)
         logger.debug(f"Visualization rules generated for {len(rules)} features/feature pairs")
 
         logger.info("Rendering visualizations...")
@@ -2,15 +2,20 @@
 Metadata Extractor
 
 This module extracts structured column statistics from a stored JSON
-profiling report. The extracted metadata is converted into `ColumnSchema`
-objects for use in downstream EDA and preprocessing steps.
+profiling report, or from a profile handed over in memory. The extracted
+metadata is converted into `ColumnSchema` objects for use in downstream EDA
+and preprocessing steps.
 """
 
 #Import libraries
 import json
-from typing import Dict
+from typing import Any, Dict, Optional, Union
 from pathlib import Path
 
+from src.eda_core.column_stats import ColumnStatsTable
+from src.eda_core.profile_format import BINARY_PROFILE_SUFFIX, read_column_stats, read_column_table
+from src.eda_core.profile_stream import iter_profile_variables
+
 # Import utils
 from src.utils.logging import get_logger
 from src.utils.exceptions import FileNotFoundError, RuleProcessingError
@@ -18,6 +23,9 @@ from src.utils.models import ColumnSchema, ColType
 
 logger = get_logger(__name__)
 
+# Profiling JSON files above this size are streamed instead of loaded whole
+STREAMING_THRESHOLD_BYTES = 32 * 1024 * 1024
+
 class MetadataExtractor:
     """
     Extracts structured dataset column metadata from a profiling JSON output.
@@ -26,15 +34,21 @@ class MetadataExtractor:
     which include type information, summary statistics, and missing value details.
     """
 
-    def extract_col_data(self, profile_json_path: str) -> Dict[str, ColumnSchema]:
+    def extract_col_data(self, profile_json_path: str, streaming: Optional[bool] = None, as_table: bool = False) -> Union[Dict[str, ColumnSchema], ColumnStatsTable]:
         """
         Load and parse a profiling JSON file to extract column-level statistics.
+        Binary profiles (`.arrow`, see `profile_format`) are read as well.
 
         Args:
-            profile_json_path (str): Path to the JSON file generated by the profiler.
+            profile_json_path (str): Path to the JSON or binary file generated by the profiler.
+            streaming (Optional[bool]): Walk only the 'variables' section of the file instead of
+                loading the whole document, keeping one column entry in memory at a time.
+                Defaults to streaming files larger than STREAMING_THRESHOLD_BYTES.
+            as_table (bool): Return a columnar ColumnStatsTable instead of one validated
+                ColumnSchema per column.
 
         Returns:
-            Dict[str, ColumnSchema]: Dictionary mapping column names to their schema objects.
+            Dict[str, ColumnSchema] | ColumnStatsTable: Mapping of column names to their statistics.
 
         Raises:
             FileNotFoundError: If the profiling JSON file is not found.
@@ -47,47 +61,138 @@ class MetadataExtractor:
             logger.error(f"Profiling JSON file not found: {profile_json_path}")
             raise FileNotFoundError(f"Profile file not found: {profile_json_path}")
 
+        if path.suffix == BINARY_PROFILE_SUFFIX:
+            try:
+                columns_meta = read_column_table(path) if as_table else read_column_stats(path)
+            except Exception as e:
+                logger.error(f"Failed to read binary profile: {e}")
+                raise RuleProcessingError(f"Failed to read binary profile: {e}") from e
+            logger.info(f"Metadata extraction completed. Extracted {len(columns_meta)} columns.")
+            return columns_meta
+
+        if streaming is None:
+            streaming = path.stat().st_size > STREAMING_THRESHOLD_BYTES
+        if streaming:
+            return self._extract_streaming(path, as_table)
+
         try:
             with path.open('r', encoding='utf-8') as f:
                 profile = json.load(f)
 
-            if "variables" not in profile:
-                logger.warning(f"No 'variables' key found in profiling JSON: {profile_json_path}")
-                return {}
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON format in profiling file: {e}")
+            raise RuleProcessingError(f"Invalid JSON format in profiling file: {e}") from e
 
-            columns_meta: Dict[str, ColumnSchema] = {}
-            variables = profile.get("variables", {})
+        except Exception as e:
+            logger.error(f"Unexpected error while reading profiling file: {e}")
+            raise RuleProcessingError(f"Failed to extract column metadata: {e}") from e
 
-            for col_name, stats in variables.items():
-                col_type_raw = (stats.get("type") or "").lower()
-                try:
-                    col_type = ColType(col_type_raw)
-                except ValueError:
-                    logger.warning(f"Unrecognized column type '{col_type_raw}' for column '{col_name}'. Defaulting to UNKNOWN.")
-                    col_type = ColType.UNKNOWN
-
-                column_schema = ColumnSchema(
-                    name=col_name,
-                    type=col_type,
-                    missing_pct=stats.get("p_missing", 0.0),
-                    unique=stats.get("n_unique", 0),
-                    mean=stats.get("mean"),
-                    std=stats.get("std"),
-                    min=stats.get("min"),
-                    max=stats.get("max"),
-                    mode=stats.get("mode")
-                )
+        return self.extract_from_profile(profile, source=profile_json_path, as_table=as_table)
 
-                columns_meta[col_name] = column_schema
-                logger.debug(f"Extracted metadata for column '{col_name}': {column_schema}")
+    def _extract_streaming(self, path: Path, as_table: bool = False) -> Union[Dict[str, ColumnSchema], ColumnStatsTable]:
+        """
+        Extract column-level statistics by streaming the 'variables' section of a profiling JSON file.
+
+        Args:
+            path (Path): Path to the profiling JSON file.
+            as_table (bool): Return a ColumnStatsTable.
+
+        Returns:
+            Dict[str, ColumnSchema] | ColumnStatsTable: Mapping of column names to their statistics.
+
+        Raises:
+            RuleProcessingError: If parsing fails due to invalid format or data issues.
+        """
+        logger.info(f"Streaming 'variables' section of: {path}")
+        try:
+            if as_table:
+                columns_meta = ColumnStatsTable.from_variables(iter_profile_variables(path))
+            else:
+                columns_meta = {col_name: self._to_column_schema(col_name, stats) for col_name, stats in iter_profile_variables(path)}
 
             logger.info(f"Metadata extraction completed. Extracted {len(columns_meta)} columns.")
             return columns_meta
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Invalid JSON format in profiling file: {e}")
             raise RuleProcessingError(f"Invalid JSON format in profiling file: {e}") from e
 
+        except Exception as e:
+            logger.error(f"Unexpected error while streaming profiling file: {e}")
+            raise RuleProcessingError(f"Failed to extract column metadata: {e}") from e
+
+    def extract_from_profile(self, profile: Dict[str, Any], source: str = "in-memory profile", as_table: bool = False) -> Union[Dict[str, ColumnSchema], ColumnStatsTable]:
+        """
+        Extract column-level statistics from a profile held in memory, e.g. from
+        `Profiler.profile_columns`, skipping the JSON file round trip.
+
+        Args:
+            profile (Dict[str, Any]): Profile with a 'variables' section, laid out like the profiling JSON.
+            source (str): Description of where the profile comes from, for logging.
+            as_table (bool): Return a columnar ColumnStatsTable instead of one validated
+                ColumnSchema per column.
+
+        Returns:
+            Dict[str, ColumnSchema] | ColumnStatsTable: Mapping of column names to their statistics.
+
+        Raises:
+            RuleProcessingError: If parsing fails due to invalid format or data issues.
+        """
+        try:
+            if "variables" not in profile:
+                logger.warning(f"No 'variables' key found in profile: {source}")
+                return ColumnStatsTable.from_variables([]) if as_table else {}
+
+            variables = profile.get("variables", {})
+            if as_table:
+                columns_meta = ColumnStatsTable.from_variables(variables.items())
+                logger.info(f"Metadata extraction completed. Extracted {len(columns_meta)} columns.")
+                return columns_meta
+
+            columns_meta: Dict[str, ColumnSchema] = {}
+
+            for col_name, stats in variables.items():
+                column_schema = self._to_column_schema(col_name, stats)
+                columns_meta[col_name] = column_schema
+
+            logger.info(f"Metadata extraction completed. Extracted {len(columns_meta)} columns.")
+            return columns_meta
+
         except Exception as e:
             logger.error(f"Unexpected error while extracting metadata: {e}")
             raise RuleProcessingError(f"Failed to extract column metadata: {e}") from e
+
+    def _to_column_schema(self, col_name: str, stats: Dict[str, Any]) -> ColumnSchema:
+        """
+        Build the ColumnSchema of one column from its profile entry.
+
+        Args:
+            col_name (str): Column name.
+            stats (Dict[str, Any]): Column entry from the profile's 'variables' section.
+
+        Returns:
+            ColumnSchema: Schema object for the column.
+        """
+        col_type_raw = (stats.get("type") or "").lower()
+        try:
+            col_type = ColType(col_type_raw)
+        except ValueError:
+            logger.warning(f"Unrecognized column type '{col_type_raw}' for column '{col_name}'. Defaulting to UNKNOWN.")
+            col_type = ColType.UNKNOWN
+
+        column_schema = ColumnSchema(
+            name=col_name,
+            type=col_type,
+            missing_pct=stats.get("p_missing", 0.0),
+            unique=stats.get("n_unique", 0),
+            mean=stats.get("mean"),
+            std=stats.get("std"),
+            min=stats.get("min"),
+            max=stats.get("max"),
+            mode=stats.get("mode"),
+            # Present when the profile was computed on a sample
+            is_estimate=stats.get("is_estimate", False),
+            confidence_intervals=stats.get("confidence_intervals") or {}
+        )
+        logger.debug(f"Extracted metadata for column '{col_name}': {column_schema}")
+        return column_schema
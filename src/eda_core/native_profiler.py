@@ -0,0 +1,235 @@
+"""
+Native Profiler
+
+Computes the column statistics read by the MetadataExtractor (type, missing
+fraction, unique count, mean, std, min, max and mode) directly with
+vectorized NumPy/pandas operations. Numeric columns are stacked into one
+float block and reduced column-wise in a single pass, so no full profiling
+report or HTML has to be built. Types follow the ydata-profiling conventions
+so both engines classify columns the same way.
+
+Wide frames can be profiled in parallel: columns are split into batches that
+worker processes profile independently. The numeric block is placed in shared
+memory once, so workers read their columns from it instead of receiving a
+pickled copy of the frame.
+"""
+
+#Import libraries
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Import utils
+from src.utils.logging import get_logger
+from src.utils.models import ColType, ColumnSchema
+
+logger = get_logger(__name__)
+
+# Numeric columns with at most this many distinct values are categorical (ydata's vars.num.low_categorical_threshold)
+LOW_CATEGORICAL_THRESHOLD = 5
+
+# String columns with at most this ratio of distinct values to non-null rows are categorical, others are text
+CATEGORICAL_MAX_UNIQUE_RATIO = 0.5
+
+# Default number of columns profiled per worker task
+DEFAULT_BATCH_SIZE = 256
+
+def _profile_shared_batch(profiler: "NativeProfiler", shm_name: str, shape: Tuple[int, int], start: int, stop: int, columns: List[str], missing: Dict[str, float], integer_cols: List[str]) -> Dict[str, ColumnSchema]:
+    """Profile columns `start:stop` of the numeric block in shared memory. Runs in a worker process."""
+    shm = SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+        return profiler._numeric_stats(block[:, start:stop], columns, missing, set(integer_cols))
+    finally:
+        shm.close()
+
+def _profile_other_batch(profiler: "NativeProfiler", frame: pd.DataFrame, missing: Dict[str, float]) -> Dict[str, ColumnSchema]:
+    """Profile a batch of non-numeric columns. Runs in a worker process."""
+    return {col: profiler._profile_other(col, frame[col], missing[col]) for col in frame.columns}
+
+class NativeProfiler:
+    """
+    Vectorized profiler computing `ColumnSchema` statistics for every column of a DataFrame.
+    """
+
+    def __init__(
+        self,
+        low_categorical_threshold: int = LOW_CATEGORICAL_THRESHOLD,
+        categorical_max_unique_ratio: float = CATEGORICAL_MAX_UNIQUE_RATIO,
+        max_workers: Optional[int] = 1,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """
+        Args:
+            low_categorical_threshold (int): Numeric columns with at most this many
+                distinct values are typed as categorical.
+            categorical_max_unique_ratio (float): Maximum ratio of distinct values
+                to non-null rows for a string column to be typed as categorical.
+            max_workers (Optional[int]): Worker processes used to profile column batches.
+                1 profiles in the calling process, None uses every CPU.
+            batch_size (int): Number of columns profiled per worker task.
+        """
+        self.low_categorical_threshold = low_categorical_threshold
+        self.categorical_max_unique_ratio = categorical_max_unique_ratio
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+
+    def profile(self, df: pd.DataFrame) -> Dict[str, ColumnSchema]:
+        """
+        Compute the column statistics of a DataFrame.
+
+        Args:
+            df (pd.DataFrame): Dataset to be profiled.
+
+        Returns:
+            Dict[str, ColumnSchema]: Mapping of column names to their statistics.
+        """
+        n_rows = len(df)
+        missing_pct = (df.isna().sum().to_numpy() / n_rows) if n_rows else np.zeros(df.shape[1])
+
+        numeric_cols: List[str] = []
+        other_cols: List[str] = []
+        for col, dtype in df.dtypes.items():
+            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                numeric_cols.append(col)
+            else:
+                other_cols.append(col)
+
+        missing = dict(zip(df.columns, missing_pct))
+        workers = self.max_workers or os.cpu_count() or 1
+
+        column_stats: Dict[str, ColumnSchema] = {}
+        if workers > 1 and df.shape[1] > self.batch_size:
+            column_stats = self._profile_parallel(df, numeric_cols, other_cols, missing, workers)
+        else:
+            if numeric_cols:
+                values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+                column_stats.update(self._numeric_stats(values, numeric_cols, missing, self._integer_columns(df, numeric_cols)))
+            for col in other_cols:
+                column_stats[col] = self._profile_other(col, df[col], missing[col])
+
+        logger.info(f"Native profile computed for {df.shape[1]} columns and {n_rows} rows.")
+        # Keep the column order of the frame
+        return {col: column_stats[col] for col in df.columns}
+
+    def _profile_parallel(self, df: pd.DataFrame, numeric_cols: List[str], other_cols: List[str], missing: Dict[str, float], workers: int) -> Dict[str, ColumnSchema]:
+        """Profile column batches in a process pool, reading numeric columns from shared memory."""
+        shape = (len(df), len(numeric_cols))
+        # Column-major layout keeps each batch of columns contiguous
+        shm = SharedMemory(create=True, size=max(shape[0] * shape[1] * 8, 1))
+        try:
+            block = np.ndarray(shape, dtype=np.float64, buffer=shm.buf, order="F")
+            for i, col in enumerate(numeric_cols):
+                block[:, i] = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            integer_cols = list(self._integer_columns(df, numeric_cols))
+
+            logger.info(f"Profiling {df.shape[1]} columns in batches of {self.batch_size} across {workers} workers.")
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = []
+                for start in range(0, len(numeric_cols), self.batch_size):
+                    stop = min(start + self.batch_size, len(numeric_cols))
+                    batch = numeric_cols[start:stop]
+                    futures.append(executor.submit(
+                        _profile_shared_batch, self, shm.name, shape, start, stop, batch,
+                        {col: missing[col] for col in batch}, [col for col in batch if col in integer_cols],
+                    ))
+                for start in range(0, len(other_cols), self.batch_size):
+                    # Non-numeric columns cannot live in shared memory, only the batch itself is sent
+                    batch = other_cols[start:start + self.batch_size]
+                    futures.append(executor.submit(_profile_other_batch, self, df[batch], {col: missing[col] for col in batch}))
+
+                column_stats: Dict[str, ColumnSchema] = {}
+                for future in futures:
+                    column_stats.update(future.result())
+            return column_stats
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _numeric_stats(self, values: np.ndarray, columns: List[str], missing: Dict[str, float], integer_cols: set) -> Dict[str, ColumnSchema]:
+        """Reduce a float64 block of numeric columns (rows x columns) column-wise at once."""
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=0)
+        has_values = counts > 0
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sums = np.where(valid, values, 0.0).sum(axis=0)
+            means = np.where(has_values, sums / np.maximum(counts, 1), np.nan)
+            squared = np.where(valid, (values - means) ** 2, 0.0).sum(axis=0)
+            # Sample standard deviation, like pandas and ydata-profiling
+            stds = np.where(counts > 1, np.sqrt(squared / np.maximum(counts - 1, 1)), np.nan)
+
+        minimums = np.where(has_values, np.where(valid, values, np.inf).min(axis=0), np.nan)
+        maximums = np.where(has_values, np.where(valid, values, -np.inf).max(axis=0), np.nan)
+
+        # Distinct values from the sorted block: NaNs sort last and are excluded by the count
+        ordered = np.sort(values, axis=0)
+        changes = np.diff(ordered, axis=0) != 0
+        in_range = np.arange(1, len(ordered))[:, None] < counts
+        uniques = np.where(has_values, (changes & in_range).sum(axis=0) + 1, 0)
+
+        stats: Dict[str, ColumnSchema] = {}
+        for i, col in enumerate(columns):
+            is_low_cardinality = 0 < uniques[i] <= self.low_categorical_threshold
+            stats[col] = ColumnSchema(
+                name=str(col),
+                type=ColType.CATEGORICAL if is_low_cardinality else ColType.NUMERIC,
+                missing_pct=float(missing[col]),
+                unique=int(uniques[i]),
+                mean=self._to_float(means[i]),
+                std=self._to_float(stds[i]),
+                min=self._to_float(minimums[i]),
+                max=self._to_float(maximums[i]),
+                mode=self._mode(ordered[:counts[i], i], col in integer_cols) if is_low_cardinality else None,
+            )
+        return stats
+
+    def _profile_other(self, col: str, series: pd.Series, missing_pct: float) -> ColumnSchema:
+        """Statistics of a boolean, datetime or string column."""
+        counts = series.value_counts(dropna=True)
+        # Unused categories of a categorical dtype are reported with a zero count
+        counts = counts[counts > 0]
+        n_unique = len(counts)
+        non_null = int(counts.sum())
+
+        if pd.api.types.is_bool_dtype(series.dtype) or (n_unique and set(counts.index) <= {True, False}):
+            col_type = ColType.BOOLEAN
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            col_type = ColType.DATETIME
+        elif n_unique <= self.categorical_max_unique_ratio * non_null:
+            col_type = ColType.CATEGORICAL
+        else:
+            col_type = ColType.TEXT
+
+        return ColumnSchema(
+            name=str(col),
+            type=col_type,
+            missing_pct=float(missing_pct),
+            unique=n_unique,
+            mean=None,
+            std=None,
+            min=None,
+            max=None,
+            mode=str(counts.index[0]) if n_unique else None,
+        )
+
+    @staticmethod
+    def _mode(ordered: np.ndarray, is_integer: bool) -> Optional[str]:
+        """Most frequent value of a sorted array without NaNs."""
+        if len(ordered) == 0:
+            return None
+        values, counts = np.unique(ordered, return_counts=True)
+        mode = values[np.argmax(counts)]
+        return str(int(mode)) if is_integer else str(mode)
+
+    @staticmethod
+    def _integer_columns(df: pd.DataFrame, columns: List[str]) -> set:
+        return {col for col in columns if pd.api.types.is_integer_dtype(df[col].dtype)}
+
+    @staticmethod
+    def _to_float(value: float) -> Optional[float]:
+        return None if np.isnan(value) else float(value)
@@ -7,25 +7,30 @@ Also provides an execution function to apply the encodings to a DataFrame.
 """
 
 # Import libraries
+import numpy as np
 import pandas as pd
-from typing import Dict
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from typing import Any, Dict, List, Mapping, Optional
+from sklearn.preprocessing import StandardScaler
 from category_encoders import TargetEncoder
 
 # Import utils modules
 from src.utils.logging import get_logger
 from src.utils.exceptions import RuleProcessingError, PreprocessingError
-from src.utils.models import ColumnSchema, ColType
+from src.utils.models import ColumnSchema, ColType, EncodingPlan, ScalingParams, TargetEncoding
+from src.eda_core.column_stats import as_stats_table
+from src.eda_core.stats_cache import ColumnStatsCache
+from src.eda_core.preprocessing_rules.transformations import scale_values
 
 logger = get_logger(__name__)
 
-def encoding_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> Dict[str, str]:
+def encoding_rules(df: pd.DataFrame, column_stats: Mapping[str, ColumnSchema]) -> Dict[str, str]:
     """
     Determine encoding strategy for categorical features.
 
     Args:
         df (pd.DataFrame): The dataset to evaluate.
-        column_stats (Dict[str, ColumnStats]): Profiling statistics for each column.
+        column_stats (Mapping[str, ColumnSchema]): Profiling statistics for each column,
+            as a dict of ColumnSchema or a ColumnStatsTable.
 
     Returns:
         Dict[str, str]: Mapping of column names to recommended encoding strategies.
@@ -37,11 +42,10 @@ def encoding_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> D
     strategies = {}
 
     try:
-        for col, stats in column_stats.items():
-            if stats.type != ColType.CATEGORICAL:
-                continue
-
-            cardinality = stats.unique or 0
+        stats = as_stats_table(column_stats)
+        categorical = stats.is_type(ColType.CATEGORICAL)
+        cardinalities = np.nan_to_num(stats.unique[categorical]).astype(np.int64)
+        for col, cardinality in zip(stats.names[categorical].tolist(), cardinalities.tolist()):
             logger.debug(f"Column '{col}' cardinality: {cardinality}")
 
             if cardinality <= 10:
@@ -62,14 +66,24 @@ def encoding_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> D
         raise RuleProcessingError(f"Failed to process encoding rules: {e}") from e
 
 
-def encode_and_scale(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema], target_column: str = None) -> pd.DataFrame:
+def encode_and_scale(
+    df: pd.DataFrame,
+    column_stats: Mapping[str, ColumnSchema],
+    target_column: str = None,
+    stats_cache: Optional[ColumnStatsCache] = None,
+    plan: Optional[EncodingPlan] = None,
+) -> pd.DataFrame:
     """
     Apply encoding and scaling transformations to the dataset.
 
     Args:
         df (pd.DataFrame): The dataset to transform.
-        column_stats (Dict[str, ColumnSchema]): Profiling statistics for each column.
+        column_stats (Mapping[str, ColumnSchema]): Profiling statistics for each column.
         target_column (str, optional): Target variable, required for target encoding.
+        stats_cache (Optional[ColumnStatsCache]): Column statistics shared with the other rules.
+            Entries of the encoded and scaled columns are invalidated.
+        plan (Optional[EncodingPlan]): Receives the categories, target encodings and scaling
+            parameters, to be applied to new data with `apply_encoding_plan`.
 
     Returns:
         pd.DataFrame: Transformed dataset with encoded and scaled features.
@@ -78,25 +92,34 @@ def encode_and_scale(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema], ta
         PreprocessingError: If transformation fails.
     """
     logger.info("Starting encoding & scaling process...")
+    if plan is None:
+        plan = EncodingPlan()
     try:
         strategies = encoding_rules(df, column_stats)
 
         for col, strategy in strategies.items():
             logger.debug(f"Applying {strategy} to column '{col}'...")
+            if stats_cache is not None:
+                stats_cache.invalidate(col)
 
             if strategy == "one-hot-encode":
-                encoder = OneHotEncoder(sparse=False, handle_unknown="ignore")
-                encoded = encoder.fit_transform(df[[col]])
-                encoded_df = pd.DataFrame(encoded, columns=encoder.get_feature_names_out([col]))
-                df = pd.concat([df.drop(columns=[col]), encoded_df], axis=1)
+                plan.one_hot[col] = _categories(df[col])
+                df = _one_hot_encode(df, col, plan.one_hot[col])
                 logger.info(f"One-hot encoding applied to '{col}'.")
 
             elif strategy == "target-encode":
                 if target_column is None or target_column not in df.columns:
                     logger.error(f"Target column required for target encoding '{col}' but not provided.")
                     raise PreprocessingError(f"Target column required for target encoding '{col}'")
-                encoder = TargetEncoder()
-                df[col] = encoder.fit_transform(df[col], df[target_column])
+                encoder = TargetEncoder().fit(df[col], df[target_column])
+                # The fitted mapping, read back per category and for a missing value.
+                # Unseen categories get the encoder's prior, the mean of the target.
+                categories = _categories(df[col])
+                values = encoder.transform(pd.Series(categories + [None], name=col, dtype=object))[col]
+                plan.target[col] = TargetEncoding(
+                    categories=categories, values=values.iloc[:-1].tolist(), default=float(encoder._mean), missing=float(values.iloc[-1]),
+                )
+                df[col] = _target_encode(df[col], plan.target[col])
                 logger.info(f"Target encoding applied to '{col}'.")
 
             elif strategy == "embedding-encode":
@@ -104,11 +127,17 @@ def encode_and_scale(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema], ta
                 logger.warning(f"Embedding encoding not implemented. Column '{col}' left unchanged.")
 
         # Apply scaling to numeric columns
-        numeric_cols = [col for col, stats in column_stats.items() if stats.type == ColType.NUMERIC and col in df.columns]
+        stats = as_stats_table(column_stats)
+        numeric = stats.is_type(ColType.NUMERIC) & stats.present_in(df.columns)
+        numeric_cols = stats.names[numeric].tolist()
         if numeric_cols:
             logger.debug(f"Scaling numeric columns: {numeric_cols}")
-            scaler = StandardScaler()
-            df[numeric_cols] = scaler.fit_transform(df[numeric_cols])
+            scaler = StandardScaler().fit(df[numeric_cols])
+            for col, center, scale in zip(numeric_cols, scaler.mean_.tolist(), scaler.scale_.tolist()):
+                plan.scaling[col] = ScalingParams(center=center, scale=scale)
+                df[col] = scale_values(df[col], plan.scaling[col])
+            if stats_cache is not None:
+                stats_cache.invalidate(*numeric_cols)
             logger.info("Numeric feature scaling applied.")
 
         logger.info("Encoding & scaling process completed successfully.")
@@ -117,3 +146,63 @@ def encode_and_scale(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema], ta
     except Exception as e:
         logger.error(f"Encoding & scaling process failed: {e}")
         raise PreprocessingError(f"Encoding & scaling process failed: {e}") from e
+
+
+def apply_encoding_plan(df: pd.DataFrame, plan: EncodingPlan) -> pd.DataFrame:
+    """
+    Apply fitted encodings and scaling to new data, without refitting any encoder.
+    Categories not seen during fitting are encoded as all zeros (one-hot) or the
+    target prior (target encoding).
+
+    Args:
+        df (pd.DataFrame): Input dataset.
+        plan (EncodingPlan): Parameters recorded by `encode_and_scale`.
+
+    Returns:
+        pd.DataFrame: Dataset with encoded and scaled features.
+
+    Raises:
+        PreprocessingError: If processing fails.
+    """
+    try:
+        for col, categories in plan.one_hot.items():
+            if col in df.columns:
+                df = _one_hot_encode(df, col, categories)
+        for col, encoding in plan.target.items():
+            if col in df.columns:
+                df[col] = _target_encode(df[col], encoding)
+        for col, params in plan.scaling.items():
+            if col in df.columns:
+                df[col] = scale_values(df[col], params)
+        return df
+
+    except Exception as e:
+        logger.error(f"Error while applying encoding plan: {e}")
+        raise PreprocessingError(f"Failed to apply encoding plan: {e}") from e
+
+def _categories(series: pd.Series) -> List[Any]:
+    """Sorted distinct non-null values of a column, as Python values."""
+    values = series.dropna().unique().tolist()
+    try:
+        return sorted(values)
+    except TypeError:
+        return sorted(values, key=str)
+
+def _one_hot_encode(df: pd.DataFrame, col: str, categories: List[Any]) -> pd.DataFrame:
+    """Replace a column by one indicator column '<col>_<category>' per category, aligned on the index."""
+    codes = pd.Categorical(df[col], categories=categories).codes
+    indicators = np.zeros((len(df), len(categories)))
+    known = codes >= 0
+    indicators[np.flatnonzero(known), codes[known]] = 1.0
+    encoded = pd.DataFrame(indicators, index=df.index, columns=[f"{col}_{category}" for category in categories])
+    return pd.concat([df.drop(columns=[col]), encoded], axis=1)
+
+def _target_encode(series: pd.Series, encoding: TargetEncoding) -> pd.Series:
+    """Map each category to its fitted target mean, unknown categories to the prior and missing values to their own encoding."""
+    codes = pd.Categorical(series, categories=encoding.categories).codes
+    # Code -1 (not a known category) picks the default at the end
+    lookup = np.append(np.asarray(encoding.values, dtype=np.float64), encoding.default)
+    encoded = lookup[codes]
+    if encoding.missing is not None:
+        encoded[series.isna().to_numpy()] = encoding.missing
+    return pd.Series(encoded, index=series.index, name=series.name)
@@ -7,23 +7,39 @@ strategies to the dataset.
 """
 
 # Import libraries
+import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
 
 # Import util modules
 from src.utils.logging import get_logger
 from src.utils.exceptions import RuleProcessingError, PreprocessingError
-from src.utils.models import ColumnSchema, ColType
+from src.utils.models import ColumnSchema, ColType, MissingValuePlan
+from src.eda_core.column_stats import as_stats_table
+from src.eda_core.stats_cache import ColumnStatsCache
 
 logger = get_logger(__name__)
 
-def missing_value_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> Dict[str, str]:
+# Reductions computing the fill values of all columns of an imputation strategy at once
+FILL_REDUCTIONS: Dict[str, Callable[[pd.DataFrame], pd.Series]] = {
+    "impute-mean": lambda frame: frame.mean(),
+    "impute-median": lambda frame: frame.median(),
+    # The first mode of each column, as Series.mode()[0]
+    "impute-mode": lambda frame: frame.mode().iloc[0],
+    "impute-most-frequent-date": lambda frame: frame.mode().iloc[0],
+}
+
+def missing_value_rules(df: pd.DataFrame, column_stats: Mapping[str, ColumnSchema], stats_cache: Optional[ColumnStatsCache] = None) -> Dict[str, str]:
     """
-    Determine missing value handling strategy for each column.
+    Determine missing value handling strategy for each column. Columns whose
+    missing percentage is unknown (e.g. profiled from Parquet footers without
+    null counts) get it counted from `df` first.
 
     Args:
         df (pd.DataFrame): The dataset to evaluate.
-        column_stats (Dict[str, ColumnStats]): Profiling statistics for each column.
+        column_stats (Mapping[str, ColumnSchema]): Profiling statistics for each column,
+            as a dict of ColumnSchema or a ColumnStatsTable.
+        stats_cache (Optional[ColumnStatsCache]): Column statistics shared with the other rules.
 
     Returns:
         Dict[str, str]: Mapping of column names to recommended missing value handling strategies.
@@ -32,88 +48,109 @@ def missing_value_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema])
         RuleProcessingError: If rule evaluation fails.
     """
     logger.info("Starting missing value rule evaluation...")
-    strategies = {}
 
     try:
-        for col, stats in column_stats.items():
-            if col not in df.columns:
-                logger.warning(f"Column '{col}' not found in DataFrame. Skipping.")
-                continue
-
-            missing_pct = stats.missing_pct or 0.0
-            logger.debug(f"Column '{col}' missing %: {missing_pct:.2f}")
-
-            if missing_pct == 0:
-                strategies[col] = "no-action"
-                continue
-
-            if missing_pct > 50:
-                strategies[col] = "drop-column"
-                continue
-
-            if stats.type == ColType.NUMERIC:
-                skewness = df[col].dropna().skew()
-                strategies[col] = "impute-median" if skewness > 1 else "impute-mean"
-
-            elif stats.type == ColType.CATEGORICAL:
-                strategies[col] = "impute-mode"
-
-            elif stats.type == ColType.DATETIME:
-                strategies[col] = "impute-most-frequent-date"
-
-            elif stats.type == ColType.BOOLEAN:
-                strategies[col] = "impute-mode"
-
-            else:
-                strategies[col] = "no-action"
+        stats = as_stats_table(column_stats)
+        present = stats.present_in(df.columns)
+        for col in stats.names[~present]:
+            logger.warning(f"Column '{col}' not found in DataFrame. Skipping.")
+        stats = stats.filter(present)
+
+        missing_pct = stats.missing_pct
+        unknown = np.isnan(missing_pct)
+        if unknown.any():
+            # An unknown share is neither "none missing" nor "mostly missing": count it
+            unknown_cols = stats.names[unknown].tolist()
+            missing_pct = missing_pct.copy()
+            missing_pct[unknown] = df[unknown_cols].isna().mean().to_numpy() * 100
+            logger.debug(f"Counted the missing values of {unknown_cols}, unknown in the profile.")
+        is_numeric = stats.is_type(ColType.NUMERIC)
+        strategies = np.select(
+            [
+                missing_pct == 0,
+                missing_pct > 50,
+                is_numeric,
+                stats.is_type(ColType.CATEGORICAL, ColType.BOOLEAN),
+                stats.is_type(ColType.DATETIME),
+            ],
+            ["no-action", "drop-column", "impute-mean", "impute-mode", "impute-most-frequent-date"],
+            default="no-action",
+        ).astype(object)
+
+        # Skewed numeric columns are imputed with the median, computed in one pass over the columns
+        needs_skew = is_numeric & (missing_pct != 0) & ~(missing_pct > 50)
+        if needs_skew.any():
+            cache = stats_cache if stats_cache is not None else ColumnStatsCache()
+            skewness = np.array(list(cache.skews(df, stats.names[needs_skew].tolist()).values()))
+            strategies[needs_skew] = np.where(skewness > 1, "impute-median", "impute-mean")
 
         logger.info("Missing value rule evaluation completed successfully.")
-        return strategies
+        return dict(zip(stats.names.tolist(), strategies.tolist()))
 
     except Exception as e:
         logger.error(f"Error while applying missing value rules: {e}")
         raise RuleProcessingError(f"Failed to process missing value rules: {e}") from e
 
 
-def handle_missing_values(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> pd.DataFrame:
+def handle_missing_values(
+    df: pd.DataFrame,
+    column_stats: Mapping[str, ColumnSchema],
+    stats_cache: Optional[ColumnStatsCache] = None,
+    plan: Optional[MissingValuePlan] = None,
+    inplace: bool = False,
+) -> pd.DataFrame:
     """
     Apply missing value handling to a dataset based on determined rules.
 
+    Fill values are computed with one reduction per strategy over all of its
+    columns and applied with a single bulk fill; high-missing columns are
+    dropped in one operation.
+
     Args:
         df (pd.DataFrame): Input dataset.
-        column_stats (Dict[str, ColumnSchema]): Metadata for each column.
+        column_stats (Mapping[str, ColumnSchema]): Metadata for each column.
+        stats_cache (Optional[ColumnStatsCache]): Column statistics shared with the other rules.
+            Entries of the columns changed here are invalidated.
+        plan (Optional[MissingValuePlan]): Receives the dropped columns and fill values,
+            to be applied to new data with `apply_missing_value_plan`.
+        inplace (bool): Modify `df` itself instead of returning a new DataFrame.
 
     Returns:
-        pd.DataFrame: Dataset with missing values handled.
+        pd.DataFrame: Dataset with missing values handled (`df` itself if `inplace`).
 
     Raises:
         PreprocessingError: If processing fails.
     """
     logger.info("Starting missing value handling...")
     try:
-        strategies = missing_value_rules(df, column_stats)
+        cache = stats_cache if stats_cache is not None else ColumnStatsCache()
+        strategies = missing_value_rules(df, column_stats, cache)
 
+        by_action: Dict[str, List[str]] = {}
         for col, action in strategies.items():
-            if action == "no-action":
-                continue
-            elif action == "drop-column":
-                logger.info(f"Dropping column '{col}' due to high missing percentage.")
-                df = df.drop(columns=[col])
-            elif action == "impute-mean":
-                df[col] = df[col].fillna(df[col].mean())
-                logger.info(f"Applied mean imputation for column '{col}'.")
-            elif action == "impute-median":
-                df[col] = df[col].fillna(df[col].median())
-                logger.info(f"Applied median imputation for column '{col}'.")
-            elif action == "impute-mode":
-                df[col] = df[col].fillna(df[col].mode()[0])
-                logger.info(f"Applied mode imputation for column '{col}'.")
-            elif action == "impute-most-frequent-date":
-                most_freq_date = df[col].dropna().mode()[0]
-                df[col] = df[col].fillna(most_freq_date)
-                logger.info(f"Applied most frequent date imputation for column '{col}'.")
-            else:
-                logger.warning(f"No recognized action for column '{col}'. Skipping.")
+            by_action.setdefault(action, []).append(col)
+        for action in set(by_action) - set(FILL_REDUCTIONS) - {"no-action", "drop-column"}:
+            logger.warning(f"No recognized action for columns {by_action[action]}. Skipping.")
+
+        fill_values = compute_fill_values(df, by_action)
+        drop_columns = by_action.get("drop-column", [])
+        # Every dropped or filled column changes
+        cache.invalidate(*drop_columns, *fill_values)
+
+        if inplace:
+            df.drop(columns=drop_columns, inplace=True)
+            df.fillna(fill_values, inplace=True)
+        else:
+            df = df.drop(columns=drop_columns).fillna(fill_values)
+
+        if plan is not None:
+            plan.drop_columns.extend(drop_columns)
+            plan.fill_values.update({col: _to_builtin(value) for col, value in fill_values.items()})
+        if drop_columns:
+            logger.info(f"Dropped columns {drop_columns} due to high missing percentage.")
+        for action in FILL_REDUCTIONS:
+            if by_action.get(action):
+                logger.info(f"Applied {action.removeprefix('impute-')} imputation for columns {by_action[action]}.")
 
         logger.info("Missing value handling completed successfully.")
         return df
@@ -121,3 +158,59 @@ def handle_missing_values(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema
     except Exception as e:
         logger.error(f"Error during missing value handling: {e}")
         raise PreprocessingError(f"Failed to handle missing values: {e}") from e
+
+def compute_fill_values(df: pd.DataFrame, columns_by_action: Mapping[str, Sequence[str]]) -> Dict[str, Any]:
+    """
+    Compute the fill value of every column to impute, with one reduction per imputation strategy.
+
+    Args:
+        df (pd.DataFrame): Input dataset.
+        columns_by_action (Mapping[str, Sequence[str]]): Columns of each strategy of `missing_value_rules`.
+
+    Returns:
+        Dict[str, Any]: Fill value of each imputed column.
+    """
+    fill_values: Dict[str, Any] = {}
+    for action, reduce in FILL_REDUCTIONS.items():
+        columns = list(columns_by_action.get(action, ()))
+        if columns:
+            fill_values.update(reduce(df[columns]).to_dict())
+    return fill_values
+
+def apply_missing_value_plan(df: pd.DataFrame, plan: MissingValuePlan) -> pd.DataFrame:
+    """
+    Apply fitted missing value handling to new data, without recomputing any statistic.
+
+    Args:
+        df (pd.DataFrame): Input dataset.
+        plan (MissingValuePlan): Dropped columns and fill values recorded by `handle_missing_values`.
+
+    Returns:
+        pd.DataFrame: Dataset with missing values handled.
+
+    Raises:
+        PreprocessingError: If processing fails.
+    """
+    try:
+        df = df.drop(columns=[col for col in plan.drop_columns if col in df.columns])
+        fill_values = {}
+        for col, value in plan.fill_values.items():
+            if col not in df.columns:
+                continue
+            # Dates are stored as ISO strings in a saved plan
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                value = pd.Timestamp(value)
+            fill_values[col] = value
+        return df.fillna(fill_values)
+
+    except Exception as e:
+        logger.error(f"Error while applying missing value plan: {e}")
+        raise PreprocessingError(f"Failed to apply missing value plan: {e}") from e
+
+def _to_builtin(value):
+    """Convert NumPy and pandas scalars to Python values that a plan can serialize."""
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
@@ -8,22 +8,76 @@ recommend handling strategies for outliers in numeric columns.
 #Import libraries
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, List, Mapping, Optional
 
 #Import util modules
 from src.utils.logging import get_logger
-from src.utils.exceptions import RuleProcessingError
-from src.utils.models import ColumnSchema, ColType
+from src.utils.exceptions import RuleProcessingError, PreprocessingError
+from src.utils.models import ColumnSchema, ColType, OutlierBounds, OutlierPlan, OutlierRemovalReport
+from src.eda_core.column_stats import as_stats_table
+from src.eda_core.stats_cache import ColumnStatsCache
 
 logger = get_logger(__name__)
 
-def outlier_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> Dict[str, str]:
+class _OutlierDetection:
+    """IQR bounds and outlier counts of the numeric columns, computed in one pass over the numeric block."""
+
+    def __init__(self, df: pd.DataFrame, column_stats: Mapping[str, ColumnSchema], cache: ColumnStatsCache):
+        stats = as_stats_table(column_stats)
+        numeric = stats.is_type(ColType.NUMERIC)
+        present = stats.present_in(df.columns)
+        for col in stats.names[numeric & ~present].tolist():
+            logger.warning(f"Column '{col}' not found in DataFrame. Skipping.")
+
+        self.columns: List[str] = stats.names[numeric & present].tolist()
+        quantiles = cache.column_quantiles(df, self.columns, (0.25, 0.75))
+        q1 = np.array([quantiles[col][0.25] for col in self.columns], dtype=np.float64)
+        q3 = np.array([quantiles[col][0.75] for col in self.columns], dtype=np.float64)
+        self.iqr = q3 - q1
+        self.lower = q1 - 1.5 * self.iqr
+        self.upper = q3 + 1.5 * self.iqr
+
+        # Missing values compare False on both sides: they are neither outliers nor within bounds.
+        # Columns are read one at a time into one reused mask; float columns are read without a copy.
+        # Only the columns marked for removal are folded into the single `keep` vector.
+        self.num_values = np.empty(len(self.columns), dtype=np.int64)
+        self.outlier_counts = np.empty(len(self.columns), dtype=np.int64)
+        self.removed_counts: Dict[str, int] = {}
+        self.keep: Optional[np.ndarray] = None
+        strategies = []
+        within = np.empty(len(df), dtype=bool)
+        for i, col in enumerate(self.columns):
+            values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            np.logical_and(values >= self.lower[i], values <= self.upper[i], out=within)
+            num_within = np.count_nonzero(within)
+            self.num_values[i] = len(values) - np.count_nonzero(np.isnan(values))
+            self.outlier_counts[i] = self.num_values[i] - num_within
+            strategies.append(_strategy(self.num_values[i], self.outlier_counts[i]))
+            if strategies[-1] == "remove-outliers":
+                self.removed_counts[col] = int(len(values) - num_within)
+                if self.keep is None:
+                    self.keep = within.copy()
+                else:
+                    self.keep &= within
+        self.strategies = np.array(strategies, dtype=object)
+
+def _strategy(num_values: int, outlier_count: int) -> str:
+    """Outlier handling of a column: none, capping above 20% outliers, removal otherwise."""
+    if num_values == 0 or outlier_count == 0:
+        return "no-action"
+    if outlier_count / num_values > 0.2:
+        return "cap-at-percentiles"
+    return "remove-outliers"
+
+def outlier_rules(df: pd.DataFrame, column_stats: Mapping[str, ColumnSchema], stats_cache: Optional[ColumnStatsCache] = None) -> Dict[str, str]:
     """
     Determine outlier handling strategy for each numeric column.
 
     Args:
         df (pd.DataFrame): The dataset to evaluate.
-        column_stats (Dict[str, ColumnStats]): Profiling statistics for each column.
+        column_stats (Mapping[str, ColumnSchema]): Profiling statistics for each column,
+            as a dict of ColumnSchema or a ColumnStatsTable.
+        stats_cache (Optional[ColumnStatsCache]): Column statistics shared with the other rules.
 
     Returns:
         Dict[str, str]: Mapping of column names to recommended outlier handling strategies.
@@ -32,41 +86,20 @@ def outlier_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> Di
         RuleProcessingError: If rule evaluation fails.
     """
     logger.info("Starting outlier detection rule evaluation...")
-    strategies = {}
+    cache = stats_cache if stats_cache is not None else ColumnStatsCache()
 
     try:
-        for col, stats in column_stats.items():
-            if stats.type != ColType.NUMERIC:
-                continue
-
-            if col not in df.columns:
-                logger.warning(f"Column '{col}' not found in DataFrame. Skipping.")
-                continue
-
-            col_data = df[col].dropna()
-            if col_data.empty:
-                strategies[col] = "no-action"
+        detection = _OutlierDetection(df, column_stats, cache)
+        strategies = dict(zip(detection.columns, detection.strategies.tolist()))
+        for i, (col, strategy) in enumerate(strategies.items()):
+            logger.debug(f"Column '{col}': IQR={detection.iqr[i]:.3f}, Outliers={detection.outlier_counts[i]}")
+            if detection.num_values[i] == 0:
                 logger.warning(f"Column '{col}' has no data after NA removal.")
-                continue
-
-            Q1 = col_data.quantile(0.25)
-            Q3 = col_data.quantile(0.75)
-            IQR = Q3 - Q1
-
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outlier_count = ((col_data < lower_bound) | (col_data > upper_bound)).sum()
-
-            logger.debug(f"Column '{col}': IQR={IQR:.3f}, Outliers={outlier_count}")
-
-            if outlier_count == 0:
-                strategies[col] = "no-action"
+            elif strategy == "no-action":
                 logger.info(f"Column '{col}' has no detected outliers.")
-            elif outlier_count / len(col_data) > 0.2:
-                strategies[col] = "cap-at-percentiles"
+            elif strategy == "cap-at-percentiles":
                 logger.info(f"Column '{col}' has >20% outliers. Recommended capping at percentiles.")
             else:
-                strategies[col] = "remove-outliers"
                 logger.info(f"Column '{col}' has moderate outliers. Recommended removal.")
 
         logger.info("Outlier detection rule evaluation completed successfully.")
@@ -76,13 +109,30 @@ def outlier_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> Di
         logger.error(f"Error while applying outlier detection rules: {e}")
         raise RuleProcessingError(f"Failed to process outlier rules: {e}") from e
 
-def handle_outliers(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> pd.DataFrame:
+def handle_outliers(
+    df: pd.DataFrame,
+    column_stats: Mapping[str, ColumnSchema],
+    stats_cache: Optional[ColumnStatsCache] = None,
+    plan: Optional[OutlierPlan] = None,
+    report: Optional[OutlierRemovalReport] = None,
+) -> pd.DataFrame:
     """
     Apply outlier handling to a dataset based on determined rules.
 
+    Bounds of every column are computed on the input rows in one pass. Rows
+    outside the bounds of any column marked for removal are dropped with a
+    single combined mask, so the result does not depend on column order and
+    the frame is copied once. Capped columns are clipped to their 5th and
+    95th percentiles.
+
     Args:
         df (pd.DataFrame): Input dataset.
-        column_stats (Dict[str, ColumnSchema]): Metadata for each column.
+        column_stats (Mapping[str, ColumnSchema]): Metadata for each column.
+        stats_cache (Optional[ColumnStatsCache]): Column statistics shared with the other rules.
+            Entries are invalidated when rows are removed or a column is capped.
+        plan (Optional[OutlierPlan]): Receives the bounds of each step, to be applied
+            to new data with `apply_outlier_plan`.
+        report (Optional[OutlierRemovalReport]): Receives the rows removed per column and in total.
 
     Returns:
         pd.DataFrame: Dataset with outliers handled.
@@ -90,44 +140,97 @@ def handle_outliers(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) ->
     Raises:
         PreprocessingError: If processing fails.
     """
-    from src.utils.exceptions import PreprocessingError
-
     logger.info("Starting outlier handling...")
     try:
-        strategies = outlier_rules(df, column_stats)
-
-        for col, action in strategies.items():
-            if action == "no-action":
-                continue
+        cache = stats_cache if stats_cache is not None else ColumnStatsCache()
+        detection = _OutlierDetection(df, column_stats, cache)
+        columns = np.array(detection.columns, dtype=object)
+        remove = detection.strategies == "remove-outliers"
+        cap = detection.strategies == "cap-at-percentiles"
+        report = report if report is not None else OutlierRemovalReport()
+        report.rows_before = len(df)
+
+        # Caps use the percentiles of the input rows, computed in the same pass as the bounds
+        capped = columns[cap].tolist()
+        caps = cache.column_quantiles(df, capped, (0.05, 0.95))
+
+        if remove.any():
+            removed_columns = columns[remove].tolist()
+            report.removed_per_column = dict(detection.removed_counts)
+            if not detection.keep.all():
+                # take() materializes the kept rows once, as a new frame that can be assigned to
+                df = df.take(np.flatnonzero(detection.keep))
+                cache.invalidate()
+            if plan is not None:
+                for col, lower, upper in zip(removed_columns, detection.lower[remove].tolist(), detection.upper[remove].tolist()):
+                    plan.steps.append(OutlierBounds(column=col, action="remove-outliers", lower=lower, upper=upper))
+
+        for col in capped:
+            lower_cap = caps[col][0.05]
+            upper_cap = caps[col][0.95]
+            df[col] = np.clip(df[col], lower_cap, upper_cap)
+            cache.invalidate(col)
+            if plan is not None:
+                plan.steps.append(OutlierBounds(column=col, action="cap-at-percentiles", lower=lower_cap, upper=upper_cap))
+            logger.info(f"Capped values in '{col}' between {lower_cap:.3f} and {upper_cap:.3f}.")
+
+        report.rows_after = len(df)
+        report.rows_removed = report.rows_before - report.rows_after
+        report.capped_columns = capped
+        for col, count in report.removed_per_column.items():
+            logger.info(f"Outliers in '{col}': {count} rows outside its bounds.")
+        logger.info(f"Removed {report.rows_removed} outlier rows. Rows before: {report.rows_before}, after: {report.rows_after}.")
+        logger.info("Outlier handling completed successfully.")
+        return df
 
-            if col not in df.columns:
-                logger.warning(f"Column '{col}' not found in DataFrame during outlier handling. Skipping.")
-                continue
+    except Exception as e:
+        logger.error(f"Error during outlier handling: {e}")
+        raise PreprocessingError(f"Failed to handle outliers: {e}") from e
 
-            col_data = df[col].dropna()
+def apply_outlier_plan(df: pd.DataFrame, plan: OutlierPlan, remove_outliers: bool = True) -> pd.DataFrame:
+    """
+    Apply fitted outlier handling to new data, without recomputing any quantile.
 
-            if action == "remove-outliers":
-                Q1 = col_data.quantile(0.25)
-                Q3 = col_data.quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                initial_shape = df.shape
-                df = df[(df[col] >= lower_bound) & (df[col] <= upper_bound)]
-                logger.info(f"Removed outliers from '{col}'. Rows before: {initial_shape[0]}, after: {df.shape[0]}.")
+    Rows outside the bounds of every removal step are dropped with one combined
+    mask, which keeps the same rows as removing them step by step. The input
+    frame is left unchanged.
 
-            elif action == "cap-at-percentiles":
-                lower_cap = col_data.quantile(0.05)
-                upper_cap = col_data.quantile(0.95)
-                df[col] = np.clip(df[col], lower_cap, upper_cap)
-                logger.info(f"Capped values in '{col}' between {lower_cap:.3f} and {upper_cap:.3f}.")
+    Args:
+        df (pd.DataFrame): Input dataset.
+        plan (OutlierPlan): Bounds recorded by `handle_outliers`.
+        remove_outliers (bool): Whether to drop rows outside the removal bounds. Scoring
+            usually keeps every row and only applies the caps.
 
-            else:
-                logger.warning(f"Unknown outlier handling strategy '{action}' for column '{col}'. Skipping.")
+    Returns:
+        pd.DataFrame: Dataset with outliers handled.
 
-        logger.info("Outlier handling completed successfully.")
+    Raises:
+        PreprocessingError: If processing fails.
+    """
+    try:
+        removals: List[OutlierBounds] = []
+        capped: Dict[str, pd.Series] = {}
+        for step in plan.steps:
+            if step.column not in df.columns:
+                continue
+            if step.action == "cap-at-percentiles":
+                capped[step.column] = np.clip(df[step.column], step.lower, step.upper)
+            elif remove_outliers:
+                removals.append(step)
+        if capped:
+            # assign() returns a new frame, the caller's frame keeps its values
+            df = df.assign(**capped)
+
+        if removals:
+            keep = np.ones(len(df), dtype=bool)
+            for step in removals:
+                values = df[step.column].to_numpy(dtype=np.float64, na_value=np.nan)
+                keep &= (values >= step.lower) & (values <= step.upper)
+            logger.info(f"Removed {len(df) - int(keep.sum())} outlier rows.")
+            # take() returns a new frame, which later steps can assign to
+            df = df.take(np.flatnonzero(keep))
         return df
 
     except Exception as e:
-        logger.error(f"Error during outlier handling: {e}")
-        raise PreprocessingError(f"Failed to handle outliers: {e}") from e
+        logger.error(f"Error while applying outlier plan: {e}")
+        raise PreprocessingError(f"Failed to apply outlier plan: {e}") from e
@@ -8,7 +8,7 @@ outlier handling, and encoding strategies.
 
 #Import libraries
 import pandas as pd
-from typing import Dict
+from typing import Dict, Optional
 
 #Import util modules
 from src.utils.logging import get_logger
@@ -20,16 +20,19 @@ from src.eda_core.preprocessing_rules.transformations import transformation_rule
 from src.eda_core.preprocessing_rules.missing_values import missing_value_rules
 from src.eda_core.preprocessing_rules.outliers import outlier_rules
 from src.eda_core.preprocessing_rules.encodings import encoding_rules
+from src.eda_core.stats_cache import ColumnStatsCache
 
 logger = get_logger(__name__)
 
-def run_preprocessing_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> Dict[str, Dict[str, str]]:
+def run_preprocessing_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema], stats_cache: Optional[ColumnStatsCache] = None) -> Dict[str, Dict[str, str]]:
     """
     Run all preprocessing rule modules and return consolidated results.
 
     Args:
         df (pd.DataFrame): The dataset to evaluate.
         column_stats (Dict[str, ColumnStats]): Profiling statistics for each column.
+        stats_cache (Optional[ColumnStatsCache]): Column statistics shared between the rules,
+            so each is computed once.
 
     Returns:
         Dict[str, Dict[str, str]]: Dictionary with rule category as keys and 
@@ -38,10 +41,11 @@ def run_preprocessing_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSche
     logger.info("Running preprocessing rules engine...")
 
     try:
+        stats_cache = stats_cache if stats_cache is not None else ColumnStatsCache()
         results = {
-            "transformations": transformation_rules(df, column_stats),
-            "missing_values": missing_value_rules(df, column_stats),
-            "outliers": outlier_rules(df, column_stats),
+            "transformations": transformation_rules(df, column_stats, stats_cache),
+            "missing_values": missing_value_rules(df, column_stats, stats_cache),
+            "outliers": outlier_rules(df, column_stats, stats_cache),
             "encodings": encoding_rules(df, column_stats)
         }
         logger.info("Preprocessing rules engine completed successfully.")
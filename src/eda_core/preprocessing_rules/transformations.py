@@ -10,27 +10,30 @@ This module decides scaling/transformation techniques based on:
 
 import pandas as pd
 import numpy as np
-from typing import Dict
-from scipy.stats import skew
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from sklearn.preprocessing import StandardScaler, MinMaxScaler
+from src.eda_core.column_stats import as_stats_table
+from src.eda_core.stats_cache import ColumnStatsCache
 from src.utils.logging import get_logger
 from src.utils.exceptions import PreprocessingError, RuleProcessingError
-from src.utils.models import ColumnSchema, ColType
+from src.utils.models import ColumnSchema, ColType, ScalingParams, TransformationPlan, TransformationStep
 
 logger = get_logger(__name__)
 
 # -------- Utility semantic checks --------
-def is_id_like(series: pd.Series) -> bool:
-    """Detect if a numeric column is likely an identifier."""
-    return (
-        pd.api.types.is_integer_dtype(series) and
-        series.nunique() / len(series) > 0.98 and
-        series.nunique() > 50
-    )
-
-def is_count_like(series: pd.Series) -> bool:
-    """Detect count-like small integer features."""
-    return pd.api.types.is_integer_dtype(series) and series.nunique() < 20
+def is_id_like(series: pd.Series, nunique: Optional[int] = None) -> bool:
+    """Detect if a numeric column is likely an identifier. `nunique` skips counting the distinct values again."""
+    if not pd.api.types.is_integer_dtype(series):
+        return False
+    if nunique is None:
+        nunique = series.nunique()
+    return nunique / len(series) > 0.98 and nunique > 50
+
+def is_count_like(series: pd.Series, nunique: Optional[int] = None) -> bool:
+    """Detect count-like small integer features. `nunique` skips counting the distinct values again."""
+    if not pd.api.types.is_integer_dtype(series):
+        return False
+    return (series.nunique() if nunique is None else nunique) < 20
 
 def is_age_like(name: str, series: pd.Series) -> bool:
     """Detect if column is age-like based on name and value distribution."""
@@ -50,48 +53,62 @@ def is_age_like(name: str, series: pd.Series) -> bool:
     return False
 
 
-def is_percentage_like(series: pd.Series) -> bool:
-    """Detect if column is percentage or ratio."""
-    return series.between(0, 1).all() or series.between(0, 100).all()
+def is_percentage_like(series: pd.Series, value_range: Optional[Tuple[Any, Any]] = None) -> bool:
+    """Detect if column is percentage or ratio. `value_range` is the (min, max) of a series without nulls."""
+    if value_range is None:
+        return series.between(0, 1).all() or series.between(0, 100).all()
+    low, high = value_range
+    return bool(low >= 0 and high <= 100)
 
 def is_money_like(name: str) -> bool:
     """Detect if column represents monetary values."""
     return any(keyword in name.lower() for keyword in ["price", "cost", "revenue", "income", "amount", "salary"])
 
+def scale_values(values: pd.Series, params: ScalingParams) -> pd.Series:
+    """Scale a column with fitted parameters: (x - center) / scale."""
+    return (values - params.center) / params.scale
+
+# Date parts extracted from datetime columns, as new columns '<col>_<part>'
+DATE_PARTS = ("year", "month", "day", "weekday", "hour")
+
 # -------- Transformation Rule Engine --------
-def transformation_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> Dict[str, str]:
+def transformation_rules(df: pd.DataFrame, column_stats: Mapping[str, ColumnSchema], stats_cache: Optional[ColumnStatsCache] = None) -> Dict[str, str]:
     """
     Decide scaling/transformation techniques based on advanced semantic & statistical rules.
+    Distinct counts, ranges and skewness come from `stats_cache`, shared with the other rules.
     """
     logger.info("Starting advanced transformation rule evaluation...")
     transformations = {}
+    cache = stats_cache if stats_cache is not None else ColumnStatsCache()
 
     try:
-        for col, stats in column_stats.items():
+        stats = as_stats_table(column_stats)
+        for col, col_type, known_unique in zip(stats.names.tolist(), stats.types.tolist(), stats.unique.tolist()):
             if col not in df.columns:
                 continue
 
-            col_data = df[col].dropna()
-
             # Empty column
-            if col_data.empty:
+            if cache.count(df, col) == 0:
                 transformations[col] = "drop (empty column)"
                 continue
 
             # Drop constant
-            if col_data.nunique() == 1:
+            nunique = cache.nunique(df, col)
+            if nunique == 1:
                 transformations[col] = "drop (constant feature)"
                 continue
 
             # ----- NUMERIC -----
-            if stats.type == ColType.NUMERIC:
+            if col_type == ColType.NUMERIC:
+                col_data = df[col].dropna()
+
                 # Drop ID-like
-                if is_id_like(col_data):
+                if is_id_like(col_data, nunique):
                     transformations[col] = "drop (identifier-like)"
                     continue
 
                 # Leave counts as-is
-                if is_count_like(col_data):
+                if is_count_like(col_data, nunique):
                     transformations[col] = "no-transform (count-like)"
                     continue
 
@@ -101,31 +118,32 @@ def transformation_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]
                     continue
 
                 # Percentages: keep raw
-                if is_percentage_like(col_data):
+                col_min, col_max = cache.min_max(df, col)
+                if is_percentage_like(col_data, (col_min, col_max)):
                     transformations[col] = "no-transform (percentage/ratio)"
                     continue
 
                 # Monetary: scale but avoid log unless skewed
+                col_skew = cache.skew(df, col, bias=True)
+                all_positive = col_min > 0
                 if is_money_like(col):
-                    col_skew = skew(col_data)
-                    if abs(col_skew) > 1 and (col_data > 0).all():
+                    if abs(col_skew) > 1 and all_positive:
                         transformations[col] = "log-transform"
                     else:
                         transformations[col] = "standard-scaling"
                     continue
 
                 # Skewness-driven transform
-                col_skew = skew(col_data)
-                if abs(col_skew) > 1 and (col_data > 0).all():
+                if abs(col_skew) > 1 and all_positive:
                     transformations[col] = "log-transform"
-                elif col_data.max() - col_data.min() > 1000:
+                elif col_max - col_min > 1000:
                     transformations[col] = "standard-scaling"
                 else:
                     transformations[col] = "min-max-scaling"
 
             # ----- CATEGORICAL -----
-            elif stats.type == ColType.CATEGORICAL:
-                cardinality = stats.unique or col_data.nunique()
+            elif col_type == ColType.CATEGORICAL:
+                cardinality = int(known_unique) if pd.notna(known_unique) and known_unique > 0 else nunique
                 if cardinality <= 10:
                     transformations[col] = "one-hot-encode"
                 elif cardinality <= 50:
@@ -134,11 +152,11 @@ def transformation_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]
                     transformations[col] = "embedding-encode"
 
             # ----- DATETIME -----
-            elif stats.type == ColType.DATETIME:
+            elif col_type == ColType.DATETIME:
                 transformations[col] = "extract date parts (year, month, day, weekday, hour)"
 
             # ----- BOOLEAN -----
-            elif stats.type == ColType.BOOLEAN:
+            elif col_type == ColType.BOOLEAN:
                 transformations[col] = "convert to int (0/1)"
 
             # ----- UNKNOWN -----
@@ -154,13 +172,23 @@ def transformation_rules(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]
 
 
 # -------- Apply Transformations --------
-def apply_transformations(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema]) -> pd.DataFrame:
+def apply_transformations(
+    df: pd.DataFrame,
+    column_stats: Mapping[str, ColumnSchema],
+    stats_cache: Optional[ColumnStatsCache] = None,
+    plan: Optional[TransformationPlan] = None,
+) -> pd.DataFrame:
     """
     Apply transformations to the dataset based on transformation rules.
+    Cached statistics of the transformed columns are invalidated. Each applied
+    step and its fitted parameters are recorded in `plan` when given, to be
+    applied to new data with `apply_transformation_plan`.
     """
+    steps: List[TransformationStep] = plan.steps if plan is not None else []
     logger.info("Starting transformation application...")
+    cache = stats_cache if stats_cache is not None else ColumnStatsCache()
     try:
-        rules = transformation_rules(df, column_stats)
+        rules = transformation_rules(df, column_stats, cache)
 
         for col, action in rules.items():
             if col not in df.columns:
@@ -170,6 +198,8 @@ def apply_transformations(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema
             if action.startswith("drop"):
                 logger.info(f"Dropping column {col} ({action})")
                 df = df.drop(columns=[col])
+                cache.invalidate(col)
+                steps.append(TransformationStep(column=col, action="drop"))
                 continue
 
             # 2️⃣ Skip explicitly marked no-transform or no-action
@@ -181,6 +211,8 @@ def apply_transformations(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema
             if action.startswith("log-transform"):
                 if (df[col] > 0).all():
                     df[col] = np.log1p(df[col])
+                    cache.invalidate(col)
+                    steps.append(TransformationStep(column=col, action="log1p"))
                     logger.info(f"Applied log-transform to {col}")
                 else:
                     logger.warning(f"Skipped log-transform for {col} due to non-positive values.")
@@ -188,30 +220,39 @@ def apply_transformations(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema
 
             # 4️⃣ Standard scaling
             if action.startswith("standard-scaling"):
-                df[col] = StandardScaler().fit_transform(df[[col]])
+                scaler = StandardScaler().fit(df[[col]])
+                params = ScalingParams(center=scaler.mean_[0], scale=scaler.scale_[0])
+                df[col] = scale_values(df[col], params)
+                cache.invalidate(col)
+                steps.append(TransformationStep(column=col, action="scale", params=params))
                 logger.info(f"Applied StandardScaler to {col}")
                 continue
 
             # 5️⃣ Min-Max scaling
             if action.startswith("min-max-scaling"):
-                df[col] = MinMaxScaler().fit_transform(df[[col]])
+                scaler = MinMaxScaler().fit(df[[col]])
+                # A constant column has a zero range and maps to 0, as in MinMaxScaler
+                params = ScalingParams(center=scaler.data_min_[0], scale=scaler.data_range_[0] or 1.0)
+                df[col] = scale_values(df[col], params)
+                cache.invalidate(col)
+                steps.append(TransformationStep(column=col, action="scale", params=params))
                 logger.info(f"Applied MinMaxScaler to {col}")
                 continue
 
             # 6️⃣ Convert boolean to int
             if action.startswith("convert to int"):
                 df[col] = df[col].astype(int)
+                cache.invalidate(col)
+                steps.append(TransformationStep(column=col, action="to-int"))
                 logger.info(f"Converted {col} to int")
                 continue
 
             # 7️⃣ Extract datetime parts
             if action.startswith("extract date parts"):
                 if pd.api.types.is_datetime64_any_dtype(df[col]):
-                    df[f"{col}_year"] = df[col].dt.year
-                    df[f"{col}_month"] = df[col].dt.month
-                    df[f"{col}_day"] = df[col].dt.day
-                    df[f"{col}_weekday"] = df[col].dt.weekday
-                    df[f"{col}_hour"] = df[col].dt.hour
+                    for part in DATE_PARTS:
+                        df[f"{col}_{part}"] = getattr(df[col].dt, part)
+                    steps.append(TransformationStep(column=col, action="date-parts"))
                     logger.info(f"Extracted date parts from {col}")
                 else:
                     logger.warning(f"Column {col} not datetime. Skipped extraction.")
@@ -233,3 +274,43 @@ def apply_transformations(df: pd.DataFrame, column_stats: Dict[str, ColumnSchema
     except Exception as e:
         logger.error(f"Error during transformation application: {e}")
         raise PreprocessingError(f"Failed to apply transformations: {e}") from e
+
+
+def apply_transformation_plan(df: pd.DataFrame, plan: TransformationPlan) -> pd.DataFrame:
+    """
+    Apply fitted transformations to new data, without recomputing any statistic.
+
+    Args:
+        df (pd.DataFrame): Input dataset.
+        plan (TransformationPlan): Steps recorded by `apply_transformations`.
+
+    Returns:
+        pd.DataFrame: Transformed dataset.
+
+    Raises:
+        PreprocessingError: If processing fails.
+    """
+    try:
+        drop_columns = []
+        for step in plan.steps:
+            col = step.column
+            if col not in df.columns:
+                continue
+            if step.action == "drop":
+                drop_columns.append(col)
+            elif step.action == "log1p":
+                df[col] = np.log1p(df[col])
+            elif step.action == "scale":
+                df[col] = scale_values(df[col], step.params)
+            elif step.action == "to-int":
+                df[col] = df[col].astype(int)
+            elif step.action == "date-parts":
+                dates = pd.to_datetime(df[col])
+                for part in DATE_PARTS:
+                    df[f"{col}_{part}"] = getattr(dates.dt, part)
+        # Dropped columns are not read by any other step, so they are dropped together
+        return df.drop(columns=drop_columns)
+
+    except Exception as e:
+        logger.error(f"Error while applying transformation plan: {e}")
+        raise PreprocessingError(f"Failed to apply transformation plan: {e}") from e
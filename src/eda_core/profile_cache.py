@@ -0,0 +1,154 @@
+"""
+Profile Cache
+
+Persistent on-disk cache of profiling reports. Entries are keyed by the
+dataset content fingerprint plus the profiler configuration, so profiling an
+unchanged dataset again only copies the stored reports. The cache is bounded
+in size and evicts the least recently used entries first.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+# Local imports
+from src.utils.fingerprint import frame_fingerprint, new_hash
+from src.utils.logging import get_logger
+from src.utils.models import ProfileCacheStats
+
+logger = get_logger(__name__)
+
+# Default upper bound of the cache size on disk
+DEFAULT_MAX_BYTES = 512 * 1024**2
+
+class ProfileCache:
+    """
+    Size-bounded LRU cache of profiling reports on disk. Each entry is a
+    directory named after its key, holding one file per report format.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = "artifacts/profile_cache", max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir (str | Path): Directory holding the cached reports.
+            max_bytes (int): Maximum total size of the cached reports.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(df: pd.DataFrame, config: Dict[str, Any]) -> str:
+        """
+        Build the cache key of a dataset profiled with a given configuration.
+
+        Args:
+            df (pd.DataFrame): Dataset to be profiled.
+            config (Dict[str, Any]): Profiler configuration (report options, library version).
+
+        Returns:
+            str: The cache key.
+        """
+        digest = new_hash()
+        digest.update(frame_fingerprint(df).encode())
+        digest.update(json.dumps(config, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Path]]:
+        """
+        Look up the cached reports of a key and mark the entry as recently used.
+
+        Args:
+            key (str): Cache key from `make_key`.
+
+        Returns:
+            Optional[Dict[str, Path]]: Paths of the cached reports per format
+                (e.g. 'json', 'html'), or None on a miss.
+        """
+        entry = self.cache_dir / key
+        files = self._entry_files(entry)
+        if not files:
+            self.misses += 1
+            logger.debug(f"Profile cache miss for {key}")
+            return None
+
+        os.utime(entry)
+        self.hits += 1
+        logger.debug(f"Profile cache hit for {key}")
+        return {path.suffix.lstrip("."): path for path in files}
+
+    def put(self, key: str, reports: Dict[str, Union[str, Path]]):
+        """
+        Store reports under a key, then evict least recently used entries
+        until the cache fits in `max_bytes`.
+
+        Args:
+            key (str): Cache key from `make_key`.
+            reports (Dict[str, str | Path]): Report paths per format, e.g. {'json': ..., 'html': ...}.
+        """
+        # Assemble the entry next to its final location and rename it in, so
+        # readers never see a partially written entry
+        staging = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=".staging-"))
+        try:
+            for fmt, path in reports.items():
+                shutil.copyfile(path, staging / f"report.{fmt}")
+            entry = self.cache_dir / key
+            if entry.exists():
+                shutil.rmtree(entry)
+            os.replace(staging, entry)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self._evict(keep=key)
+
+    def stats(self) -> ProfileCacheStats:
+        """Hit/miss counters and current size of the cache."""
+        entries = self._entries()
+        return ProfileCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(entries),
+            size_bytes=sum(self._entry_size(entry) for entry in entries),
+            max_bytes=self.max_bytes,
+        )
+
+    def clear(self):
+        """Remove every cached entry."""
+        for entry in self._entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+    def _evict(self, keep: str):
+        """Drop least recently used entries while the cache exceeds its size bound."""
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        sizes = {entry: self._entry_size(entry) for entry in entries}
+        total = sum(sizes.values())
+
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= sizes[entry]
+            self.evictions += 1
+            logger.info(f"Evicted profile cache entry {entry.name}")
+
+    def _entries(self) -> List[Path]:
+        return [entry for entry in self.cache_dir.iterdir() if entry.is_dir() and not entry.name.startswith(".")]
+
+    @staticmethod
+    def _entry_files(entry: Path) -> List[Path]:
+        return sorted(entry.glob("report.*")) if entry.is_dir() else []
+
+    @staticmethod
+    def _entry_size(entry: Path) -> int:
+        return sum(path.stat().st_size for path in entry.glob("report.*"))
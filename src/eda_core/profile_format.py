@@ -0,0 +1,250 @@
+"""
+Binary Profile Format
+
+Stores profile reports as a columnar statistics table in an Arrow IPC file:
+one row per dataset column and one Arrow column per statistic. Extra numeric
+statistics (quantiles, skewness, ...) are kept in a map column and the
+report's table-level summary is kept in the schema metadata, together with
+the format version. Files are much smaller and faster to write and read than
+the JSON reports, and can be exported back to JSON for humans.
+"""
+
+#Import libraries
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from src.eda_core.column_stats import ColumnStatsTable
+
+# Import utils
+from src.utils.logging import get_logger
+from src.utils.models import ColType, ColumnSchema
+
+logger = get_logger(__name__)
+
+# File extension of binary profiles
+BINARY_PROFILE_SUFFIX = ".arrow"
+
+# Version written to new files; files of newer versions are rejected
+PROFILE_FORMAT_VERSION = 1
+
+_FORMAT_KEY = b"autoeda.profile.format"
+_VERSION_KEY = b"autoeda.profile.version"
+_TABLE_KEY = b"autoeda.profile.table"
+_FORMAT_NAME = b"column-stats"
+
+PROFILE_SCHEMA = pa.schema([
+    ("name", pa.string()),
+    ("type", pa.dictionary(pa.int32(), pa.string())),
+    ("p_missing", pa.float64()),
+    ("n_unique", pa.int64()),
+    ("mean", pa.float64()),
+    ("std", pa.float64()),
+    ("min", pa.float64()),
+    ("max", pa.float64()),
+    ("mode", pa.string()),
+    ("is_estimate", pa.bool_()),
+    ("confidence_intervals", pa.map_(pa.string(), pa.list_(pa.float64(), 2))),
+    ("extra", pa.map_(pa.string(), pa.float64())),
+])
+
+def write_binary_profile(
+    path: Union[str, Path],
+    column_stats: Dict[str, ColumnSchema],
+    table: Optional[Dict[str, Any]] = None,
+    extras: Optional[Dict[str, Dict[str, float]]] = None,
+) -> str:
+    """
+    Write column statistics to a binary profile file.
+
+    Args:
+        path (str | Path): Output file path.
+        column_stats (Dict[str, ColumnSchema]): Statistics of each column.
+        table (Optional[Dict[str, Any]]): Table-level summary of the report, e.g. row count.
+        extras (Optional[Dict[str, Dict[str, float]]]): Additional numeric statistics per column.
+
+    Returns:
+        str: Path to the written file.
+    """
+    extras = extras or {}
+    stats = list(column_stats.values())
+    arrays = [
+        pa.array([s.name for s in stats], pa.string()),
+        pa.array([s.type.value for s in stats], pa.string()).dictionary_encode(),
+        pa.array([s.missing_pct for s in stats], pa.float64()),
+        pa.array([s.unique for s in stats], pa.int64()),
+        pa.array([s.mean for s in stats], pa.float64()),
+        pa.array([s.std for s in stats], pa.float64()),
+        pa.array([s.min for s in stats], pa.float64()),
+        pa.array([s.max for s in stats], pa.float64()),
+        pa.array([s.mode for s in stats], pa.string()),
+        pa.array([s.is_estimate for s in stats], pa.bool_()),
+        pa.array([list(s.confidence_intervals.items()) for s in stats], PROFILE_SCHEMA.field("confidence_intervals").type),
+        pa.array([list(extras.get(name, {}).items()) for name in column_stats], PROFILE_SCHEMA.field("extra").type),
+    ]
+    metadata = {
+        _FORMAT_KEY: _FORMAT_NAME,
+        _VERSION_KEY: str(PROFILE_FORMAT_VERSION).encode(),
+        _TABLE_KEY: json.dumps(table or {}, default=_to_builtin).encode(),
+    }
+    batch = pa.RecordBatch.from_arrays(arrays, schema=PROFILE_SCHEMA.with_metadata(metadata))
+
+    options = ipc.IpcWriteOptions(compression="zstd" if pa.Codec.is_available("zstd") else None)
+    with pa.OSFile(str(path), "wb") as sink, ipc.new_file(sink, batch.schema, options=options) as writer:
+        writer.write_batch(batch)
+    logger.debug(f"Binary profile with {len(stats)} columns saved at {path}")
+    return str(path)
+
+def read_binary_profile(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read a binary profile into the layout of the profiling JSON report.
+
+    Args:
+        path (str | Path): Path to the binary profile.
+
+    Returns:
+        Dict[str, Any]: Profile with 'format_version', 'table' and 'variables' sections.
+
+    Raises:
+        ValueError: If the file is not a binary profile or was written by a newer version.
+    """
+    version, table, columns = _read_columns(path)
+
+    variables: Dict[str, Dict[str, Any]] = {}
+    for i, name in enumerate(columns["name"]):
+        variable = {field: columns[field][i] for field in ("type", "p_missing", "n_unique", "mean", "std", "min", "max", "mode")}
+        if columns["is_estimate"][i]:
+            variable["is_estimate"] = True
+            variable["confidence_intervals"] = {stat: tuple(bounds) for stat, bounds in columns["confidence_intervals"][i]}
+        variable.update(columns["extra"][i] or ())
+        variables[name] = variable
+
+    return {"format_version": version, "table": table, "variables": variables}
+
+def read_column_stats(path: Union[str, Path]) -> Dict[str, ColumnSchema]:
+    """
+    Read the column statistics of a binary profile.
+
+    The stored columns are already typed, so the ColumnSchema objects are
+    built without validating every field again.
+
+    Args:
+        path (str | Path): Path to the binary profile.
+
+    Returns:
+        Dict[str, ColumnSchema]: Mapping of column names to their statistics.
+
+    Raises:
+        ValueError: If the file is not a binary profile or was written by a newer version.
+    """
+    _, _, columns = _read_columns(path)
+    col_types = {value: _to_col_type(value) for value in set(columns["type"])}
+
+    column_stats: Dict[str, ColumnSchema] = {}
+    rows = zip(
+        columns["name"], columns["type"], columns["p_missing"], columns["n_unique"], columns["mean"], columns["std"],
+        columns["min"], columns["max"], columns["mode"], columns["is_estimate"], columns["confidence_intervals"],
+    )
+    for name, col_type, p_missing, n_unique, mean, std, min_, max_, mode, is_estimate, intervals in rows:
+        column_stats[name] = ColumnSchema.model_construct(
+            name=name,
+            type=col_types[col_type],
+            missing_pct=p_missing,
+            unique=n_unique,
+            mean=mean,
+            std=std,
+            min=min_,
+            max=max_,
+            mode=mode,
+            is_estimate=is_estimate,
+            confidence_intervals={stat: tuple(bounds) for stat, bounds in intervals or ()},
+        )
+    return column_stats
+
+def read_column_table(path: Union[str, Path]) -> ColumnStatsTable:
+    """
+    Read the column statistics of a binary profile into a ColumnStatsTable,
+    without building a ColumnSchema per column.
+
+    Args:
+        path (str | Path): Path to the binary profile.
+
+    Returns:
+        ColumnStatsTable: Statistics of every column.
+
+    Raises:
+        ValueError: If the file is not a binary profile or was written by a newer version.
+    """
+    _, _, columns = _read_columns(path)
+    return ColumnStatsTable.from_columns(
+        names=columns["name"],
+        types=columns["type"],
+        missing_pct=columns["p_missing"],
+        unique=columns["n_unique"],
+        mean=columns["mean"],
+        std=columns["std"],
+        min=columns["min"],
+        max=columns["max"],
+        mode=columns["mode"],
+        is_estimate=columns["is_estimate"],
+        confidence_intervals={
+            name: {stat: tuple(bounds) for stat, bounds in intervals}
+            for name, intervals in zip(columns["name"], columns["confidence_intervals"]) if intervals
+        },
+    )
+
+def export_profile_json(path: Union[str, Path], json_path: Optional[Union[str, Path]] = None) -> str:
+    """
+    Export a binary profile as a human-readable JSON report.
+
+    Args:
+        path (str | Path): Path to the binary profile.
+        json_path (Optional[str | Path]): Output path. Defaults to the profile path with a '.json' suffix.
+
+    Returns:
+        str: Path to the JSON report.
+    """
+    json_path = Path(json_path) if json_path is not None else Path(path).with_suffix(".json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(read_binary_profile(path), f, indent=2)
+    logger.info(f"Binary profile {path} exported to {json_path}")
+    return str(json_path)
+
+def _to_builtin(value: Any) -> Any:
+    """JSON fallback for numpy scalars and other values in a report's table summary."""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+def _read_columns(path: Union[str, Path]) -> Tuple[int, Dict[str, Any], Dict[str, list]]:
+    """Read and check a binary profile. Returns its format version, table summary and columns as lists."""
+    with pa.memory_map(str(path), "r") as source:
+        try:
+            reader = ipc.open_file(source)
+        except pa.ArrowInvalid as e:
+            raise ValueError(f"Not a binary profile: {path}") from e
+        metadata = reader.schema.metadata or {}
+        if metadata.get(_FORMAT_KEY) != _FORMAT_NAME:
+            raise ValueError(f"Not a binary profile: {path}")
+        version = int(metadata[_VERSION_KEY])
+        if version > PROFILE_FORMAT_VERSION:
+            raise ValueError(f"Binary profile version {version} is newer than the supported version {PROFILE_FORMAT_VERSION}")
+        data = reader.read_all()
+
+    # Decoding the dictionary once is much faster than converting each entry
+    types = data.column("type").combine_chunks()
+    columns = {name: data.column(name).to_pylist() for name in data.column_names if name != "type"}
+    dictionary = types.dictionary.to_pylist()
+    columns["type"] = [dictionary[i] for i in types.indices.to_pylist()]
+    return version, json.loads(metadata.get(_TABLE_KEY, b"{}")), columns
+
+def _to_col_type(value: str) -> ColType:
+    """Map a stored type name to ColType, falling back to UNKNOWN for names this version does not know."""
+    try:
+        return ColType(value)
+    except ValueError:
+        logger.warning(f"Unrecognized column type '{value}' in binary profile. Defaulting to UNKNOWN.")
+        return ColType.UNKNOWN
@@ -0,0 +1,190 @@
+"""
+Streaming Profile Reader
+
+Incrementally reads the `variables` section of a profiling JSON report
+without loading the whole document. The file is scanned in fixed-size text
+blocks; only the requested fields of each column entry are decoded, and
+everything else (histograms, value counts, samples, other report sections)
+is skipped without being materialised. Peak memory is bounded by the read
+block and the largest requested field rather than by the report size.
+"""
+
+#Import libraries
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, TextIO, Tuple, Union
+
+# Import utils
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Number of characters read from the file at a time
+READ_BLOCK_CHARS = 1 << 16
+
+# Fields of a column entry read by the MetadataExtractor
+PROFILE_FIELDS = ("type", "p_missing", "n_unique", "mean", "std", "min", "max", "mode", "is_estimate", "confidence_intervals")
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(r"[^,\]}\s]+")
+
+class _JSONScanner:
+    """Forward-only JSON tokenizer over a text stream with a bounded buffer."""
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append the next block, dropping consumed text. Returns False at end of file."""
+        if self._eof:
+            return False
+        block = self._stream.read(READ_BLOCK_CHARS)
+        if not block:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + block
+        self._pos = 0
+        return True
+
+    def _skip_ws(self):
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or not self._fill():
+                return
+
+    def peek(self) -> str:
+        self._skip_ws()
+        if self._pos >= len(self._buffer):
+            raise ValueError("Unexpected end of JSON document")
+        return self._buffer[self._pos]
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self._pos}, found '{self._buffer[self._pos]}'")
+        self._pos += 1
+
+    def next_member(self, first: bool) -> bool:
+        """Consume the separator before the next object member or array item. Returns False at the closing bracket."""
+        char = self.peek()
+        if char in "}]":
+            self._pos += 1
+            return False
+        if not first:
+            self.expect(",")
+        return True
+
+    def read_value(self) -> Any:
+        """Decode the next value, reading more text until it is complete."""
+        self.peek()
+        while True:
+            if self._buffer[self._pos] not in '"[{':
+                # A scalar cut at the end of the buffer would decode to a wrong value
+                match = _SCALAR.match(self._buffer, self._pos)
+                if match is not None and match.end() == len(self._buffer) and self._fill():
+                    continue
+            try:
+                value, self._pos = self._decoder.raw_decode(self._buffer, self._pos)
+                return value
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+
+    def skip_value(self):
+        """Skip the next value without decoding it."""
+        char = self.peek()
+        if char == '"':
+            self._pos += 1
+            self._skip_string_tail()
+        elif char in "[{":
+            depth = 0
+            while True:
+                match = _STRUCTURAL.search(self._buffer, self._pos)
+                if match is None:
+                    self._pos = len(self._buffer)
+                    if not self._fill():
+                        raise ValueError("Unexpected end of JSON document")
+                    continue
+                self._pos = match.end()
+                token = match.group()
+                if token == '"':
+                    self._skip_string_tail()
+                elif token in "[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return
+        else:
+            self.read_value()
+
+    def _skip_string_tail(self):
+        """Skip the rest of a string whose opening quote was consumed."""
+        while True:
+            match = _STRING_TAIL.match(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.end()
+                return
+            # The closing quote is not in the buffer yet, read on from the string start
+            if not self._fill():
+                raise ValueError("Unterminated string in JSON document")
+
+def iter_profile_variables(path: Union[str, Path], fields: Iterable[str] = PROFILE_FIELDS) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream the column entries of a profiling JSON report.
+
+    Args:
+        path (str | Path): Path to the profiling JSON file.
+        fields (Iterable[str]): Fields of each column entry to decode. Others are skipped.
+
+    Yields:
+        Tuple[str, Dict[str, Any]]: Column name and its requested fields.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    wanted = set(fields)
+    with open(path, "r", encoding="utf-8") as f:
+        scanner = _JSONScanner(f)
+        scanner.expect("{")
+        first = True
+        while scanner.next_member(first):
+            first = False
+            key = scanner.read_value()
+            scanner.expect(":")
+            if key != "variables":
+                scanner.skip_value()
+                continue
+
+            yield from _iter_variables(scanner, wanted)
+            # The remaining sections are not needed
+            return
+    logger.warning(f"No 'variables' key found in profiling JSON: {path}")
+
+def _iter_variables(scanner: _JSONScanner, wanted: set) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Walk the `variables` object, decoding only the wanted fields of each column."""
+    scanner.expect("{")
+    first_column = True
+    while scanner.next_member(first_column):
+        first_column = False
+        col_name = scanner.read_value()
+        scanner.expect(":")
+        scanner.expect("{")
+
+        stats: Dict[str, Any] = {}
+        first_field = True
+        while scanner.next_member(first_field):
+            first_field = False
+            field = scanner.read_value()
+            scanner.expect(":")
+            if field in wanted:
+                stats[field] = scanner.read_value()
+            else:
+                scanner.skip_value()
+        yield col_name, stats
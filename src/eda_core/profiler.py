@@ -1,76 +1,505 @@
 """
 Profiler Module
 
-Wraps ydata-profiling to generate dataset reports (HTML + JSON).
+Wraps ydata-profiling to generate dataset reports (JSON + HTML).
 Used by the EDA Engine to extract metadata and generate visual reports.
+The JSON statistics are produced first; the HTML report is only rendered
+on demand, optionally in a background worker, and cached once rendered.
+A native vectorized engine can compute the same column statistics without
+building a full report, writing the JSON report only.
+Parquet datasets can also be profiled from their footer statistics alone.
+Reports are cached on disk by dataset fingerprint, so profiling an unchanged
+dataset again returns the stored reports. Datasets above a row threshold can
+be profiled from a sample, with the sampled statistics labelled as estimates.
+Files larger than memory are profiled chunk by chunk with mergeable sketches.
+Reports can be stored in a compact binary format instead of JSON.
 """
 
+import json
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 import pandas as pd
-from typing import Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 # Local imports
 from src.utils.logging import get_logger
 from src.utils.exceptions import HTMLProfilingError, JSONProfilingError
+from src.utils.models import ColumnSchema
+from src.parsers.parquet_parser import ParquetParser
+from src.eda_core.profile_cache import ProfileCache
+from src.eda_core.column_stats import ColumnStatsTable
+from src.eda_core.metadata_extractor import MetadataExtractor
+from src.eda_core.profile_format import write_binary_profile
+from src.eda_core.profile_stream import PROFILE_FIELDS
+from src.eda_core.native_profiler import DEFAULT_BATCH_SIZE, NativeProfiler
+from src.eda_core.sketches import ProfileSketch
+from src.eda_core.sampling import DEFAULT_CONFIDENCE, DEFAULT_SAMPLE_SIZE, ESTIMATED_FIELDS, apply_sample_estimates, draw_sample
+import ydata_profiling
 from ydata_profiling import ProfileReport
 
 logger = get_logger(__name__)
 
+# Options passed to ProfileReport. They are part of the profile cache key.
+PROFILE_CONFIG = {"title": "AutoEDA Report", "minimal": True}
+
+# Supported profiling engines
+PROFILER_ENGINES = ("ydata", "native")
+
+# Supported report formats, also used as file extensions
+REPORT_FORMATS = ("json", "arrow")
+
+# Number of reports kept in memory for rendering their HTML later. Older ones
+# can still be rendered by passing their dataset to `render_html`.
+PENDING_HTML_LIMIT = 4
+
 class Profiler:
     """
     Profiler class to generate and persist profiling reports.
     """
 
-    def __init__(self, output_dir: str = "artifacts/profiles"):
+    def __init__(
+        self,
+        output_dir: str = "artifacts/profiles",
+        cache: Optional[ProfileCache] = None,
+        use_cache: bool = True,
+        engine: str = "ydata",
+        sample_threshold: Optional[int] = None,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        stratify_by: Optional[str] = None,
+        confidence: float = DEFAULT_CONFIDENCE,
+        max_workers: Optional[int] = 1,
+        column_batch_size: int = DEFAULT_BATCH_SIZE,
+        report_format: str = "json",
+    ):
         """
         Args:
             output_dir (str): Directory to store generated reports.
+            cache (Optional[ProfileCache]): Report cache, shared between profilers.
+                Defaults to a cache in `output_dir/cache`.
+            use_cache (bool): Whether to reuse the reports of unchanged datasets.
+            engine (str): 'ydata' for the full ydata-profiling report (HTML + JSON) or
+                'native' for the vectorized column statistics (JSON only).
+            sample_threshold (Optional[int]): Datasets with more rows are profiled from a
+                sample of `sample_size` rows. Sampling is disabled if None.
+            sample_size (int): Number of rows profiled when sampling.
+            stratify_by (Optional[str]): Column to stratify the sample by. Uniform if None.
+            confidence (float): Confidence level of the intervals of sampled statistics.
+            max_workers (Optional[int]): Worker processes profiling column batches in
+                parallel (native engine only). 1 disables parallelism, None uses every CPU.
+            column_batch_size (int): Number of columns per parallel profiling task.
+            report_format (str): 'json' for the JSON report or 'arrow' for the compact
+                binary column statistics table (see `profile_format`). Both are read
+                by MetadataExtractor.
         """
+        if engine not in PROFILER_ENGINES:
+            raise ValueError(f"Unsupported profiler engine '{engine}'. Expected one of {PROFILER_ENGINES}")
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(f"Unsupported report format '{report_format}'. Expected one of {REPORT_FORMATS}")
+        if engine != "native" and max_workers != 1:
+            raise ValueError("Parallel profiling is only supported by the native engine")
+        self.engine = engine
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.profile_config = dict(PROFILE_CONFIG)
+        self.sample_threshold = sample_threshold
+        self.sample_size = sample_size
+        self.stratify_by = stratify_by
+        self.confidence = confidence
+        self.max_workers = max_workers
+        self.column_batch_size = column_batch_size
+        self.report_format = report_format
+        self.cache = (cache or ProfileCache(self.output_dir / "cache")) if use_cache else None
+        # Reports whose HTML has not been rendered yet, least recently profiled first:
+        # report name -> (ProfileReport or DataFrame, cache key)
+        self._pending_html: "OrderedDict[str, Tuple[Union[ProfileReport, pd.DataFrame], Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
         logger.info(f"Profiler output directory set to: {self.output_dir}")
 
-    def generate_profile(self, df: pd.DataFrame, report_name: str = "report") -> str:
+    def generate_profile(self, df: pd.DataFrame, report_name: str = "report", render_html: bool = False) -> str:
         """
-        Generate profiling reports (HTML + JSON) and save to disk.
+        Generate the profiling report (JSON, or binary with `report_format='arrow'`)
+        and save it to disk. The HTML report
+        is not rendered unless requested, see `render_html`.
+
+        Above `sample_threshold` rows only a sample is profiled. Row count, missing
+        fractions, min and max stay exact; mean, std, unique count and mode are
+        flagged with `is_estimate` and carry `confidence_intervals`.
 
         Args:
             df (pd.DataFrame): Dataset to be profiled.
             report_name (str): Base name for output files.
+            render_html (bool): Also render the HTML report right away.
 
         Returns:
-            str: Path to the generated JSON report.
+            str: Path to the generated report.
 
         Raises:
             HTMLProfilingError, JSONProfilingError: On profiling failure.
         """
-        try:
-            logger.info(f"Generating profile report for '{report_name}'...")
+        report_path, _ = self._run_profile(df, report_name, persist=True, render_html=render_html)
+        return str(report_path)
+
+    def profile_columns(self, df: pd.DataFrame, report_name: str = "report", persist: bool = False, as_table: bool = False) -> Union[Dict[str, ColumnSchema], ColumnStatsTable]:
+        """
+        Profile a dataset and return its column statistics directly, without the
+        JSON file round trip between the profiler and the MetadataExtractor.
+
+        Args:
+            df (pd.DataFrame): Dataset to be profiled.
+            report_name (str): Base name for output files, used when persisting
+                and for rendering the HTML report later.
+            persist (bool): Also write the report to disk. The profile cache is
+                filled either way, so an unchanged dataset is not profiled again.
+            as_table (bool): Return a columnar ColumnStatsTable instead of a dict of ColumnSchema.
+
+        Returns:
+            Dict[str, ColumnSchema] | ColumnStatsTable: Mapping of column names to their statistics.
+
+        Raises:
+            JSONProfilingError: On profiling failure.
+        """
+        report_path, report = self._run_profile(df, report_name, persist=persist)
+        extractor = MetadataExtractor()
+        if report is None:
+            # Served from the profile cache, which is stored on disk
+            return extractor.extract_col_data(str(report_path), as_table=as_table)
+        return extractor.extract_from_profile(report, as_table=as_table)
 
-            profile = ProfileReport(df, title="AutoEDA Report", minimal=True)
+    def _run_profile(self, df: pd.DataFrame, report_name: str, persist: bool, render_html: bool = False) -> Tuple[Optional[Path], Optional[Dict[str, Any]]]:
+        """
+        Profile a dataset, persisting the report if requested.
 
+        Returns:
+            Tuple[Optional[Path], Optional[Dict[str, Any]]]: Path of the report on
+                disk (None if not persisted) and the in-memory report (None when
+                copied from the cache).
+        """
+        try:
             html_path = self.output_dir / f"{report_name}.html"
-            json_path = self.output_dir / f"{report_name}.json"
+            report_path = self.output_dir / f"{report_name}.{self.report_format}"
 
-            try:
-                profile.to_file(html_path)
-                logger.debug(f"HTML report saved at {html_path}")
-            except Exception as e:
-                logger.error(f"Failed to generate HTML report: {e}")
-                raise HTMLProfilingError("Failed to generate HTML report") from e
+            # An HTML report left from an earlier dataset with the same name is stale
+            html_path.unlink(missing_ok=True)
+            with self._lock:
+                self._pending_html.pop(report_name, None)
+
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(df, self._cache_config())
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    if not persist:
+                        return cached[self.report_format], None
+                    for fmt, path in cached.items():
+                        shutil.copyfile(path, self.output_dir / f"{report_name}.{fmt}")
+                    logger.info(f"Reused cached profile report for '{report_name}'.")
+                    if "html" not in cached:
+                        self._keep_pending(report_name, (df, cache_key))
+                    if render_html:
+                        self.render_html(report_name)
+                    return report_path, None
+
+            logger.info(f"Generating profile report for '{report_name}' with the {self.engine} engine...")
+
+            sample = None
+            if self.sample_threshold is not None and len(df) > self.sample_threshold:
+                sample = draw_sample(df, self.sample_size, self.stratify_by)
+                logger.info(f"Profiling a sample of {len(sample)} out of {len(df)} rows.")
+            profile_df = df if sample is None else sample
 
             try:
-                json_data = profile.to_json()
-                with open(json_path, "w", encoding="utf-8") as f:
-                    f.write(json_data)
-                logger.debug(f"JSON report saved at {json_path}")
+                json_data = None
+                column_stats = None
+                if self.engine == "native":
+                    column_stats = NativeProfiler(max_workers=self.max_workers, batch_size=self.column_batch_size).profile(profile_df)
+                    report = self._to_profile_json(len(profile_df), column_stats)
+                    # The HTML report needs a full ProfileReport, built only when requested
+                    pending = profile_df
+                else:
+                    profile = ProfileReport(profile_df, **self.profile_config)
+                    # Hand over the computed description as is, without encoding and parsing JSON
+                    description = profile.description_set
+                    report = {"table": dict(description.table), "variables": {col: dict(stats) for col, stats in description.variables.items()}}
+                    if (persist or cache_key is not None) and self.report_format == "json":
+                        # ydata's encoder handles the numpy and pandas values of the description
+                        json_data = profile.to_json()
+                    # The report keeps its computed description, so rendering later reuses it
+                    pending = profile
+
+                if sample is not None:
+                    report = self._apply_sampling(report, df, sample)
+                    # The statistics of the sample no longer match the report
+                    column_stats = None
+                    if json_data is not None:
+                        json_data = json.dumps(self._copy_sampling(json.loads(json_data), report))
+
+                if persist:
+                    self._write_report(report_path, report, json_data, column_stats)
+                    logger.debug(f"Report saved at {report_path}")
+                elif cache_key is not None:
+                    # The report is not kept, but its cache entry spares profiling the dataset again
+                    with tempfile.TemporaryDirectory() as tmp:
+                        cached_path = Path(tmp) / f"report.{self.report_format}"
+                        self._write_report(cached_path, report, json_data, column_stats)
+                        self.cache.put(cache_key, {self.report_format: cached_path})
             except Exception as e:
                 logger.error(f"Failed to generate JSON report: {e}")
                 raise JSONProfilingError("Failed to generate JSON report") from e
 
+            if not persist:
+                # Nothing on disk under the report name for the HTML report to join in the cache
+                cache_key = None
+            elif cache_key is not None:
+                self.cache.put(cache_key, {self.report_format: report_path})
+            self._keep_pending(report_name, (pending, cache_key))
+
+            if render_html:
+                self.render_html(report_name)
+
             logger.info("Profile report generation completed successfully.")
-            return str(json_path)
+            return (report_path if persist else None), report
 
         except Exception as e:
             logger.error(f"Failed to generate profile report: {e}")
             raise
+
+    def render_html(self, report_name: str = "report", df: Optional[pd.DataFrame] = None) -> str:
+        """
+        Render the HTML report of a profiled dataset on demand. An HTML report
+        that was already rendered, by this profiler or found in the cache, is
+        returned without rendering again.
+
+        Args:
+            report_name (str): Base name used in `generate_profile`.
+            df (Optional[pd.DataFrame]): Dataset to render the report from when it
+                was not profiled by this profiler instance, or when more than
+                PENDING_HTML_LIMIT reports were profiled since.
+
+        Returns:
+            str: Path to the HTML report.
+
+        Raises:
+            HTMLProfilingError: If there is no report to render or rendering fails.
+        """
+        html_path = self.output_dir / f"{report_name}.html"
+        with self._lock:
+            pending = self._pending_html.pop(report_name, None)
+
+        if pending is None and html_path.exists():
+            logger.debug(f"HTML report already rendered at {html_path}")
+            return str(html_path)
+
+        try:
+            source, cache_key = pending if pending is not None else (df, None)
+            if source is None:
+                raise HTMLProfilingError(f"No profile report named '{report_name}' to render")
+
+            logger.info(f"Rendering HTML report for '{report_name}'...")
+            profile = source if isinstance(source, ProfileReport) else ProfileReport(source, **self.profile_config)
+            profile.to_file(html_path)
+            logger.debug(f"HTML report saved at {html_path}")
+
+            report_path = self.output_dir / f"{report_name}.{self.report_format}"
+            # Reports profiled without persisting have no cache entry to extend
+            if cache_key is not None and report_path.exists():
+                self.cache.put(cache_key, {self.report_format: report_path, "html": html_path})
+            return str(html_path)
+
+        except HTMLProfilingError:
+            raise
+        except Exception as e:
+            # Keep the report so rendering can be retried
+            if pending is not None:
+                self._keep_pending(report_name, pending, replace=False)
+            logger.error(f"Failed to generate HTML report: {e}")
+            raise HTMLProfilingError("Failed to generate HTML report") from e
+
+    def render_html_async(self, report_name: str = "report", df: Optional[pd.DataFrame] = None) -> "Future[str]":
+        """
+        Render the HTML report in a background worker thread.
+
+        Args:
+            report_name (str): Base name used in `generate_profile`.
+            df (Optional[pd.DataFrame]): See `render_html`.
+
+        Returns:
+            Future[str]: Resolves to the path of the HTML report.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-html")
+        return self._executor.submit(self.render_html, report_name, df)
+
+    def _apply_sampling(self, report: Dict[str, Any], df: pd.DataFrame, sample: pd.DataFrame) -> Dict[str, Any]:
+        """Turn the report of a sample into a report of the full dataset with labelled estimates."""
+        report["variables"] = apply_sample_estimates(report.get("variables", {}), df, sample, self.confidence)
+        report.setdefault("table", {}).update({
+            "n": len(df),
+            "sample_size": len(sample),
+            "sampling": "stratified" if self.stratify_by else "uniform",
+            "confidence": self.confidence,
+        })
+        return report
+
+    def _copy_sampling(self, report: Dict[str, Any], sampled: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the exact values and estimates of a sampled report into another encoding of the same report."""
+        variables = report.get("variables", {})
+        for col, stats in sampled["variables"].items():
+            if col in variables:
+                variables[col].update({field: stats[field] for field in ESTIMATED_FIELDS if field in stats})
+        report.setdefault("table", {}).update({key: sampled["table"][key] for key in ("n", "sample_size", "sampling", "confidence")})
+        return report
+
+    def _keep_pending(self, report_name: str, entry: Tuple[Union[ProfileReport, pd.DataFrame], Optional[str]], replace: bool = True) -> None:
+        """Keep a report for rendering its HTML later, forgetting the oldest beyond PENDING_HTML_LIMIT."""
+        with self._lock:
+            if not replace and report_name in self._pending_html:
+                return
+            self._pending_html[report_name] = entry
+            self._pending_html.move_to_end(report_name)
+            while len(self._pending_html) > PENDING_HTML_LIMIT:
+                evicted, _ = self._pending_html.popitem(last=False)
+                logger.debug(f"Dropped the in-memory report of '{evicted}', render it from its dataset instead.")
+
+    def _cache_config(self) -> Dict[str, Any]:
+        """Profiler settings that change the generated reports, used in the cache key."""
+        config: Dict[str, Any] = {"engine": self.engine}
+        if self.engine == "ydata":
+            config.update(self.profile_config, ydata_profiling=ydata_profiling.__version__)
+        if self.sample_threshold is not None:
+            config.update(
+                sample_threshold=self.sample_threshold,
+                sample_size=self.sample_size,
+                stratify_by=self.stratify_by,
+                confidence=self.confidence,
+            )
+        if self.report_format != "json":
+            config["report_format"] = self.report_format
+        return config
+
+    def generate_sketch_profile(self, source: Union[Iterable[pd.DataFrame], ProfileSketch], report_name: str = "report") -> str:
+        """
+        Generate a profile from DataFrame chunks with mergeable sketches, so
+        the dataset never has to fit in memory. Sketches built on different
+        workers can be merged with `ProfileSketch.merge` and passed in directly.
+        Distinct counts are HyperLogLog estimates and quantiles come from KLL sketches.
+
+        Args:
+            source: Chunks of the dataset (e.g. `parser.load_chunks(file)`) or a built `ProfileSketch`.
+            report_name (str): Base name for the output file.
+
+        Returns:
+            str: Path to the generated report, readable by MetadataExtractor.
+
+        Raises:
+            JSONProfilingError: If the chunks cannot be profiled or the report cannot be written.
+        """
+        try:
+            logger.info(f"Generating sketch profile for '{report_name}'...")
+            sketch = source if isinstance(source, ProfileSketch) else ProfileSketch.from_chunks(source)
+
+            column_stats = sketch.to_column_stats(self.confidence)
+            report = self._to_profile_json(sketch.num_rows, column_stats)
+            for col, variable in report["variables"].items():
+                variable.update(sketch.quantiles(col))
+
+            report_path = self.output_dir / f"{report_name}.{self.report_format}"
+            self._write_report(report_path, report, column_stats=column_stats)
+
+            logger.info(f"Sketch profile saved at {report_path}")
+            return str(report_path)
+
+        except Exception as e:
+            logger.error(f"Failed to generate sketch profile: {e}")
+            raise JSONProfilingError("Failed to generate sketch profile") from e
+
+    def generate_footer_profile(self, source, report_name: str = "report") -> str:
+        """
+        Generate a profile of a Parquet dataset from its footer statistics,
+        without scanning data pages. Row count, missing fraction, min and max are
+        filled in; unique, mean, std and mode stay null and require `generate_profile`.
+        The missing fraction of a column also stays null when any row group lacks
+        its null count, rather than being reported as complete.
+
+        Args:
+            source: Path to a Parquet file or partitioned dataset directory, or a seekable file handle.
+            report_name (str): Base name for the output file.
+
+        Returns:
+            str: Path to the generated report, readable by MetadataExtractor.
+
+        Raises:
+            JSONProfilingError: If the footers cannot be read or the report cannot be written.
+        """
+        try:
+            logger.info(f"Generating footer profile for '{report_name}'...")
+            num_rows, column_stats = ParquetParser().read_footer_stats(source)
+
+            report_path = self.output_dir / f"{report_name}.{self.report_format}"
+            self._write_report(report_path, self._to_profile_json(num_rows, column_stats), column_stats=column_stats)
+
+            logger.info(f"Footer profile saved at {report_path}")
+            return str(report_path)
+
+        except Exception as e:
+            logger.error(f"Failed to generate footer profile: {e}")
+            raise JSONProfilingError("Failed to generate footer profile") from e
+
+    def _write_report(self, path: Path, report: Dict[str, Any], json_data: Optional[str] = None, column_stats: Optional[Dict[str, ColumnSchema]] = None):
+        """
+        Write a report in the configured format.
+
+        Args:
+            path (Path): Output file path.
+            report (Dict[str, Any]): Report laid out like the profiling JSON.
+            json_data (Optional[str]): Report already encoded as JSON, written as is.
+            column_stats (Optional[Dict[str, ColumnSchema]]): Column statistics of the report,
+                extracted from it when not given.
+        """
+        if self.report_format == "arrow":
+            if column_stats is None:
+                column_stats = MetadataExtractor().extract_from_profile(report)
+            # Numeric statistics beyond the ColumnSchema fields, e.g. sketch quantiles
+            extras = {
+                col: {key: float(value) for key, value in stats.items() if key not in PROFILE_FIELDS and _is_number(value)}
+                for col, stats in report.get("variables", {}).items()
+            }
+            write_binary_profile(path, column_stats, table=report.get("table"), extras=extras)
+            return
+
+        with open(path, "w", encoding="utf-8") as f:
+            if json_data is None:
+                json.dump(report, f)
+            else:
+                f.write(json_data)
+
+    @staticmethod
+    def _to_profile_json(num_rows: int, column_stats: Dict[str, ColumnSchema]) -> Dict[str, Any]:
+        """Lay out column statistics like the ydata-profiling JSON read by MetadataExtractor."""
+        return {
+            "table": {"n": num_rows, "n_var": len(column_stats)},
+            "variables": {
+                name: {
+                    "type": stats.type.value,
+                    "p_missing": stats.missing_pct,
+                    "n_unique": stats.unique,
+                    "mean": stats.mean,
+                    "std": stats.std,
+                    "min": stats.min,
+                    "max": stats.max,
+                    "mode": stats.mode,
+                    **({"is_estimate": True, "confidence_intervals": stats.confidence_intervals} if stats.is_estimate else {}),
+                }
+                for name, stats in column_stats.items()
+            },
+        }
+
+def _is_number(value: Any) -> bool:
+    """True for int and float values, including numpy scalars, but not booleans."""
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_))
@@ -0,0 +1,152 @@
+"""
+Sampled Profiling
+
+Helpers for profiling large datasets from a sample. Rows are drawn uniformly
+or stratified by a column; statistics computed on the sample are labelled as
+estimates with confidence intervals, while quantities that are cheap to get
+exactly over the full frame (row count, null counts, min and max) are not
+estimated at all.
+"""
+
+#Import libraries
+from statistics import NormalDist
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# Import utils
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Default number of rows profiled when sampling
+DEFAULT_SAMPLE_SIZE = 100_000
+
+# Default confidence level of the reported intervals
+DEFAULT_CONFIDENCE = 0.95
+
+# Fields of a column profile that `apply_sample_estimates` sets
+ESTIMATED_FIELDS = ("p_missing", "min", "max", "n_unique", "is_estimate", "confidence_intervals")
+
+def draw_sample(df: pd.DataFrame, sample_size: int, stratify_by: Optional[str] = None, random_state: int = 0) -> pd.DataFrame:
+    """
+    Draw a uniform or stratified random sample of rows.
+
+    Args:
+        df (pd.DataFrame): The full dataset.
+        sample_size (int): Number of rows to draw.
+        stratify_by (Optional[str]): Column whose groups are sampled proportionally.
+            Every group keeps at least one row, so with many small groups the sample
+            can be slightly larger than `sample_size`. Uniform sampling if None.
+        random_state (int): Seed of the sampler.
+
+    Returns:
+        pd.DataFrame: The sampled rows.
+
+    Raises:
+        ValueError: If the stratification column does not exist.
+    """
+    if sample_size >= len(df):
+        return df
+    if stratify_by is None:
+        return df.sample(n=sample_size, random_state=random_state)
+    if stratify_by not in df.columns:
+        raise ValueError(f"Stratification column '{stratify_by}' not found in the dataset")
+
+    # Take the first rows of each group in a random order, up to the group's quota
+    order = np.random.default_rng(random_state).permutation(len(df))
+    groups = df.iloc[order].groupby(stratify_by, dropna=False, observed=True, sort=False)
+    codes = groups.ngroup().to_numpy()
+    quotas = np.maximum(1, np.round(np.bincount(codes) * (sample_size / len(df)))).astype(np.int64)
+    keep = groups.cumcount().to_numpy() < quotas[codes]
+    return df.take(np.sort(order[keep]))
+
+def apply_sample_estimates(variables: Dict[str, Dict[str, Any]], df: pd.DataFrame, sample: pd.DataFrame, confidence: float = DEFAULT_CONFIDENCE) -> Dict[str, Dict[str, Any]]:
+    """
+    Correct a profile computed on a sample for the full dataset. Missing
+    fractions, min and max are replaced by exact values; mean, std and the
+    unique count are flagged as estimates with confidence intervals.
+
+    Args:
+        variables (Dict[str, Dict[str, Any]]): The `variables` section of the sample profile.
+        df (pd.DataFrame): The full dataset.
+        sample (pd.DataFrame): The profiled sample.
+        confidence (float): Confidence level of the intervals.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The updated `variables` section.
+    """
+    n_rows = len(df)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    null_counts = df.isna().sum()
+    numeric_cols = [col for col, dtype in df.dtypes.items() if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)]
+    minimums = df[numeric_cols].min()
+    maximums = df[numeric_cols].max()
+
+    for col, stats in variables.items():
+        if col not in df.columns:
+            continue
+        non_null_total = int(n_rows - null_counts[col])
+        stats["p_missing"] = float(null_counts[col] / n_rows) if n_rows else 0.0
+        intervals: Dict[str, list] = {}
+
+        values = sample[col].dropna()
+        if col in numeric_cols:
+            stats["min"] = _to_float(minimums[col])
+            stats["max"] = _to_float(maximums[col])
+            intervals.update(_moment_intervals(values.to_numpy(dtype=np.float64), non_null_total, z))
+
+        estimate, bounds = _estimate_unique(values, non_null_total)
+        stats["n_unique"] = estimate
+        intervals["unique"] = bounds
+
+        stats["is_estimate"] = True
+        stats["confidence_intervals"] = intervals
+
+    logger.info(f"Applied sample estimates from {len(sample)} of {n_rows} rows at {confidence:.0%} confidence.")
+    return variables
+
+def _moment_intervals(values: np.ndarray, population: int, z: float) -> Dict[str, list]:
+    """Normal-approximation intervals of the mean and standard deviation."""
+    n = len(values)
+    if n < 2:
+        return {}
+    std = float(values.std(ddof=1))
+    mean = float(values.mean())
+    # Finite population correction, the sample can be a large share of the rows
+    fpc = np.sqrt(max(population - n, 0) / max(population - 1, 1))
+    mean_margin = z * std / np.sqrt(n) * fpc
+    std_margin = z * std / np.sqrt(2 * (n - 1)) * fpc
+    return {
+        "mean": [mean - mean_margin, mean + mean_margin],
+        "std": [max(std - std_margin, 0.0), std + std_margin],
+    }
+
+def _estimate_unique(values: pd.Series, population: int):
+    """
+    Distinct count estimate from a sample with the GEE estimator
+    (Charikar et al.): values seen once in the sample are scaled by
+    sqrt(N / n). The bounds are the distinct values observed in the sample
+    and the GEE upper bound, where every sampled singleton stands for N / n values.
+    """
+    n = len(values)
+    if n == 0:
+        return 0, [0, 0]
+
+    frequencies = values.value_counts()
+    distinct = len(frequencies)
+    singletons = int((frequencies == 1).sum())
+    scale = population / n
+
+    if singletons == distinct:
+        # Every sampled value is distinct, which points at a key-like column
+        estimate = population
+    else:
+        estimate = int(round(np.sqrt(scale) * singletons + (distinct - singletons)))
+    upper = int(min(population, round(scale * singletons + (distinct - singletons))))
+    estimate = min(max(estimate, distinct), upper)
+    return estimate, [distinct, upper]
+
+def _to_float(value) -> Optional[float]:
+    return None if pd.isna(value) else float(value)
@@ -0,0 +1,366 @@
+"""
+Column Sketches
+
+Mergeable summaries for incremental and out-of-core profiling. A
+`ProfileSketch` consumes DataFrame chunks one at a time with bounded memory
+per column, and sketches built from different chunks, files or workers merge
+into the sketch of their union. Each column keeps:
+
+- null and value counts, min and max, and Welford mean/variance (numeric columns)
+- a HyperLogLog distinct count
+- KLL quantiles (numeric columns)
+- Misra-Gries heavy hitters for the mode
+
+The result is converted to `ColumnSchema` with the same typing rules as the
+native profiler, so MetadataExtractor consumers see the usual statistics.
+"""
+
+#Import libraries
+from collections import Counter
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Import utils
+from src.utils.logging import get_logger
+from src.utils.models import ColType, ColumnSchema
+from src.eda_core.native_profiler import CATEGORICAL_MAX_UNIQUE_RATIO, LOW_CATEGORICAL_THRESHOLD
+
+logger = get_logger(__name__)
+
+# HyperLogLog precision: 2**14 registers, about 0.8% standard error
+HLL_PRECISION = 14
+
+# KLL accuracy parameter: about 1.5% rank error
+KLL_K = 200
+
+# Number of heavy hitter counters kept per column
+TOP_K = 64
+
+# Quantiles written to the profile, with ydata-profiling's key names
+PROFILE_QUANTILES = {"5%": 0.05, "25%": 0.25, "50%": 0.5, "75%": 0.75, "95%": 0.95}
+
+# Column kinds tracked by the sketches
+NUMERIC, BOOLEAN, DATETIME, OTHER = "numeric", "boolean", "datetime", "other"
+
+class HyperLogLog:
+    """HyperLogLog distinct counter over 64-bit hashes."""
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, hashes: np.ndarray):
+        """Add 64-bit value hashes."""
+        if len(hashes) == 0:
+            return
+        hashes = hashes.astype(np.uint64, copy=False)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        # The top 52 of the remaining bits are exact in float64, so frexp gives their bit length
+        remaining = (hashes << np.uint64(self.precision)) >> np.uint64(12)
+        bit_length = np.frexp(remaining.astype(np.float64))[1]
+        rank = (53 - bit_length).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog"):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return m * np.log(m / zeros)
+        return float(raw)
+
+    def relative_error(self) -> float:
+        return 1.04 / np.sqrt(len(self.registers))
+
+class KLLSketch:
+    """KLL quantile sketch: compactors of increasing weight holding sampled items."""
+
+    def __init__(self, k: int = KLL_K, seed: int = 0):
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray):
+        """Add numeric values, without NaNs."""
+        self.levels[0] = np.concatenate([self.levels[0], values.astype(np.float64, copy=False)])
+        self._compress()
+
+    def merge(self, other: "KLLSketch"):
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        items = np.concatenate(self.levels)
+        if len(items) == 0:
+            return None
+        weights = np.concatenate([np.full(len(level), 2.0 ** i) for i, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        position = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return float(items[order][min(position, len(items) - 1)])
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        """Halve over-full levels into the next one until every level fits its capacity."""
+        compacted = True
+        while compacted:
+            compacted = False
+            for level in range(len(self.levels)):
+                items = self.levels[level]
+                if len(items) <= self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind, the others are paired and one of each pair promoted
+                keep, items = (items[-1:], items[:-1]) if len(items) % 2 else (items[:0], items)
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                self.levels[level] = keep
+                compacted = True
+
+class HeavyHitters:
+    """Misra-Gries heavy hitters, mergeable and bounded to `capacity` counters."""
+
+    def __init__(self, capacity: int = TOP_K):
+        self.capacity = capacity
+        self.counts: Counter = Counter()
+
+    def update(self, values: pd.Series):
+        """Add the non-null values of a chunk."""
+        counts = values.value_counts(sort=False)
+        self.counts.update({key: int(count) for key, count in counts[counts > 0].items()})
+        self._prune()
+
+    def merge(self, other: "HeavyHitters"):
+        self.counts.update(other.counts)
+        self._prune()
+
+    def top(self) -> Optional[Any]:
+        return self.counts.most_common(1)[0][0] if self.counts else None
+
+    def _prune(self):
+        if len(self.counts) <= self.capacity:
+            return
+        # Subtract the (capacity + 1)-th largest count and keep what stays positive
+        threshold = sorted(self.counts.values(), reverse=True)[self.capacity]
+        self.counts = Counter({key: count - threshold for key, count in self.counts.items() if count > threshold})
+
+class ColumnSketch:
+    """All sketches of one column."""
+
+    def __init__(self):
+        self.kind: Optional[str] = None
+        self.rows = 0
+        self.nulls = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.distinct = HyperLogLog()
+        self.quantiles = KLLSketch()
+        self.heavy_hitters = HeavyHitters()
+
+    def update(self, series: pd.Series):
+        """Add one chunk of the column."""
+        self.kind = self._merge_kind(self.kind, self._kind_of(series.dtype))
+        self.rows += len(series)
+        values = series.dropna()
+        self.nulls += len(series) - len(values)
+        if values.empty:
+            return
+
+        if self.kind == NUMERIC:
+            # Hash numbers as float64 so an int chunk and a float chunk agree
+            numbers = values.to_numpy(dtype=np.float64)
+            self._update_moments(len(numbers), float(numbers.mean()), float(((numbers - numbers.mean()) ** 2).sum()), float(numbers.min()), float(numbers.max()))
+            self.quantiles.update(numbers)
+            values = pd.Series(numbers)
+
+        self.distinct.update(pd.util.hash_pandas_object(values, index=False).to_numpy())
+        self.heavy_hitters.update(values)
+
+    def merge(self, other: "ColumnSketch"):
+        """Merge the sketch of another part of the same column."""
+        self.kind = self._merge_kind(self.kind, other.kind)
+        self.rows += other.rows
+        self.nulls += other.nulls
+        if other.count:
+            self._update_moments(other.count, other.mean, other.m2, other.min, other.max)
+        self.distinct.merge(other.distinct)
+        self.quantiles.merge(other.quantiles)
+        self.heavy_hitters.merge(other.heavy_hitters)
+
+    def _update_moments(self, count: int, mean: float, m2: float, minimum: float, maximum: float):
+        """Combine running moments with those of another batch (Chan et al. parallel Welford update)."""
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = minimum if self.min is None else min(self.min, minimum)
+        self.max = maximum if self.max is None else max(self.max, maximum)
+
+    @staticmethod
+    def _kind_of(dtype) -> str:
+        if pd.api.types.is_bool_dtype(dtype):
+            return BOOLEAN
+        if pd.api.types.is_numeric_dtype(dtype):
+            return NUMERIC
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return DATETIME
+        return OTHER
+
+    @staticmethod
+    def _merge_kind(current: Optional[str], new: Optional[str]) -> Optional[str]:
+        if current is None or current == new:
+            return new
+        if new is None:
+            return current
+        return OTHER
+
+class ProfileSketch:
+    """
+    Mergeable profile of a dataset, built chunk by chunk.
+    """
+
+    def __init__(self):
+        self.columns: Dict[str, ColumnSketch] = {}
+        self.num_rows = 0
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.DataFrame]) -> "ProfileSketch":
+        """
+        Build a sketch from an iterable of chunks, e.g. a parser's `load_chunks` stream.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): DataFrame chunks of one dataset.
+
+        Returns:
+            ProfileSketch: The sketch of all chunks.
+        """
+        sketch = cls()
+        for chunk in chunks:
+            sketch.update(chunk)
+        return sketch
+
+    def update(self, chunk: pd.DataFrame):
+        """Add a chunk of rows. Columns missing from the chunk count as null."""
+        for col in self.columns:
+            if col not in chunk.columns:
+                self.columns[col].rows += len(chunk)
+                self.columns[col].nulls += len(chunk)
+
+        for col in chunk.columns:
+            if col not in self.columns:
+                # Rows seen before the column first appeared are nulls
+                self.columns[col] = ColumnSketch()
+                self.columns[col].rows = self.columns[col].nulls = self.num_rows
+            self.columns[col].update(chunk[col])
+        self.num_rows += len(chunk)
+
+    def merge(self, other: "ProfileSketch") -> "ProfileSketch":
+        """
+        Merge the sketch of another partition of the same dataset into this one.
+
+        Args:
+            other (ProfileSketch): Sketch of other rows of the dataset.
+
+        Returns:
+            ProfileSketch: This sketch, now covering both partitions.
+        """
+        for col in self.columns:
+            if col not in other.columns:
+                self.columns[col].rows += other.num_rows
+                self.columns[col].nulls += other.num_rows
+
+        for col, column in other.columns.items():
+            if col not in self.columns:
+                self.columns[col] = ColumnSketch()
+                self.columns[col].rows = self.columns[col].nulls = self.num_rows
+            self.columns[col].merge(column)
+        self.num_rows += other.num_rows
+        return self
+
+    def to_column_stats(self, confidence: float = 0.95) -> Dict[str, ColumnSchema]:
+        """
+        Convert the sketches to column statistics. Distinct counts come from
+        HyperLogLog and are flagged as estimates with a confidence interval.
+
+        Args:
+            confidence (float): Confidence level of the distinct count interval.
+
+        Returns:
+            Dict[str, ColumnSchema]: Mapping of column names to their statistics.
+        """
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        column_stats: Dict[str, ColumnSchema] = {}
+
+        for col, sketch in self.columns.items():
+            non_null = sketch.rows - sketch.nulls
+            unique, interval = self._distinct(sketch, non_null, z)
+            col_type = self._col_type(sketch, unique, non_null)
+            top = sketch.heavy_hitters.top()
+            is_numeric = sketch.kind == NUMERIC
+            std = float(np.sqrt(sketch.m2 / (sketch.count - 1))) if is_numeric and sketch.count > 1 else None
+
+            column_stats[col] = ColumnSchema(
+                name=str(col),
+                type=col_type,
+                missing_pct=sketch.nulls / sketch.rows if sketch.rows else 0.0,
+                unique=unique,
+                mean=sketch.mean if is_numeric and sketch.count else None,
+                std=std,
+                min=sketch.min if is_numeric else None,
+                max=sketch.max if is_numeric else None,
+                mode=None if top is None or col_type == ColType.NUMERIC else self._format_mode(top),
+                is_estimate=True,
+                confidence_intervals={"unique": interval},
+            )
+        return column_stats
+
+    def quantiles(self, col: str, probabilities: Dict[str, float] = PROFILE_QUANTILES) -> Dict[str, Optional[float]]:
+        """Approximate quantiles of a numeric column, keyed like `probabilities`."""
+        sketch = self.columns[col]
+        if sketch.kind != NUMERIC:
+            return {}
+        return {key: sketch.quantiles.quantile(q) for key, q in probabilities.items()}
+
+    @staticmethod
+    def _distinct(sketch: ColumnSketch, non_null: int, z: float) -> Tuple[int, Tuple[float, float]]:
+        estimate = min(sketch.distinct.estimate(), non_null)
+        margin = z * sketch.distinct.relative_error() * estimate
+        return int(round(estimate)), (max(estimate - margin, 0.0), min(estimate + margin, float(non_null)))
+
+    @staticmethod
+    def _col_type(sketch: ColumnSketch, unique: int, non_null: int) -> ColType:
+        """Same typing rules as the native profiler."""
+        if sketch.kind == NUMERIC:
+            return ColType.CATEGORICAL if 0 < unique <= LOW_CATEGORICAL_THRESHOLD else ColType.NUMERIC
+        if sketch.kind == BOOLEAN or (sketch.heavy_hitters.counts and unique <= 2 and set(sketch.heavy_hitters.counts) <= {True, False}):
+            return ColType.BOOLEAN
+        if sketch.kind == DATETIME:
+            return ColType.DATETIME
+        return ColType.CATEGORICAL if unique <= CATEGORICAL_MAX_UNIQUE_RATIO * non_null else ColType.TEXT
+
+    @staticmethod
+    def _format_mode(value: Any) -> str:
+        # Numeric values are sketched as floats, show whole numbers without the decimal point
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
@@ -0,0 +1,174 @@
+"""
+Column Statistics Cache
+
+Shares per-column statistics (skewness, quantiles, distinct counts, range)
+between the preprocessing and visualization rules, so each statistic is
+computed once per column per data version instead of once per rule. Values
+are computed lazily on first use. Steps that change a column invalidate
+its entries; a change in row count invalidates every entry.
+"""
+
+#Import libraries
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.stats import skew as population_skew
+
+# Import utils
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Quantiles computed together on the first quantile request of a column
+DEFAULT_QUANTILES = (0.05, 0.25, 0.75, 0.95)
+
+# Columns per batched quantile computation, which copies its columns
+QUANTILE_BATCH_COLUMNS = 32
+
+class ColumnStatsCache:
+    """
+    Lazily populated cache of column statistics of one DataFrame.
+
+    The cache does not watch the data. Whoever changes a column calls
+    `invalidate(col)`, and whoever adds, drops or filters rows calls
+    `invalidate()`. As a safeguard, a DataFrame with a different row count
+    than the cached one clears the cache.
+    """
+
+    def __init__(self):
+        self._values: Dict[str, Dict[Any, Any]] = {}
+        self._num_rows: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, df: pd.DataFrame, col: str) -> int:
+        """Number of non-null values of a column."""
+        return self._get(df, col, "count", lambda: int(df[col].count()))
+
+    def nunique(self, df: pd.DataFrame, col: str) -> int:
+        """Number of distinct non-null values of a column."""
+        return self._get(df, col, "nunique", lambda: int(df[col].nunique()))
+
+    def min_max(self, df: pd.DataFrame, col: str) -> Tuple[Any, Any]:
+        """Minimum and maximum of the non-null values of a column."""
+        return self._get(df, col, "min_max", lambda: (df[col].min(), df[col].max()))
+
+    def skew(self, df: pd.DataFrame, col: str, bias: bool = False) -> float:
+        """
+        Skewness of the non-null values of a column.
+
+        Args:
+            df (pd.DataFrame): Dataset holding the column.
+            col (str): Column name.
+            bias (bool): False for the bias-corrected skewness of pandas, True for the
+                population skewness of `scipy.stats.skew`. Both come from one computation.
+
+        Returns:
+            float: Skewness, NaN when undefined.
+        """
+        adjusted = self.skews(df, [col])[col]
+        if not bias:
+            return adjusted
+        n = self.count(df, col)
+        if n < 3:
+            # The bias-corrected estimate is undefined and cannot be converted
+            return self._get(df, col, "skew_biased", lambda: float(population_skew(df[col].dropna())))
+        return adjusted * (n - 2) / np.sqrt(n * (n - 1))
+
+    def skews(self, df: pd.DataFrame, cols: Sequence[str]) -> Dict[str, float]:
+        """
+        Bias-corrected skewness of several columns, computing the missing ones in one pass.
+
+        Args:
+            df (pd.DataFrame): Dataset holding the columns.
+            cols (Sequence[str]): Column names.
+
+        Returns:
+            Dict[str, float]: Skewness of each column.
+        """
+        self._check_rows(df)
+        missing = [col for col in cols if "skew" not in self._values.get(col, {})]
+        self.hits += len(cols) - len(missing)
+        if missing:
+            self.misses += len(missing)
+            for col, value in df[missing].skew().items():
+                self._values.setdefault(col, {})["skew"] = float(value)
+        return {col: self._values[col]["skew"] for col in cols}
+
+    def quantiles(self, df: pd.DataFrame, col: str, qs: Iterable[float] = DEFAULT_QUANTILES) -> Dict[float, float]:
+        """
+        Quantiles of the non-null values of a column. Quantiles not cached yet are
+        computed together with DEFAULT_QUANTILES, in one pass.
+
+        Args:
+            df (pd.DataFrame): Dataset holding the column.
+            col (str): Column name.
+            qs (Iterable[float]): Quantile levels.
+
+        Returns:
+            Dict[float, float]: Value of each quantile level.
+        """
+        return self.column_quantiles(df, [col], qs)[col]
+
+    def column_quantiles(self, df: pd.DataFrame, cols: Sequence[str], qs: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Dict[float, float]]:
+        """
+        Quantiles of several numeric columns, computing the missing ones together with
+        DEFAULT_QUANTILES in one pass over each batch of QUANTILE_BATCH_COLUMNS columns.
+
+        Args:
+            df (pd.DataFrame): Dataset holding the columns.
+            cols (Sequence[str]): Numeric column names.
+            qs (Iterable[float]): Quantile levels.
+
+        Returns:
+            Dict[str, Dict[float, float]]: Value of each quantile level, by column.
+        """
+        self._check_rows(df)
+        qs = list(qs)
+        missing = [col for col in cols if any(("quantile", q) not in self._values.get(col, {}) for q in qs)]
+        self.hits += len(cols) - len(missing)
+        if missing:
+            self.misses += len(missing)
+            levels = sorted(set(qs) | set(DEFAULT_QUANTILES))
+            for start in range(0, len(missing), QUANTILE_BATCH_COLUMNS):
+                batch = missing[start:start + QUANTILE_BATCH_COLUMNS]
+                table = df[batch].quantile(levels)
+                for col in batch:
+                    entry = self._values.setdefault(col, {})
+                    for q, value in table[col].items():
+                        entry.setdefault(("quantile", q), value)
+        return {col: {q: self._values[col][("quantile", q)] for q in qs} for col in cols}
+
+    def invalidate(self, *cols: str):
+        """
+        Drop cached statistics after the data changed.
+
+        Args:
+            *cols (str): Columns that changed. Every column if none are given.
+        """
+        if not cols:
+            self._values.clear()
+            self._num_rows = None
+            return
+        for col in cols:
+            self._values.pop(col, None)
+
+    def _get(self, df: pd.DataFrame, col: str, stat: str, compute: Callable[[], Any]) -> Any:
+        """Return a cached statistic, computing it on a miss."""
+        self._check_rows(df)
+        entry = self._values.setdefault(col, {})
+        if stat in entry:
+            self.hits += 1
+            return entry[stat]
+        self.misses += 1
+        value = entry[stat] = compute()
+        return value
+
+    def _check_rows(self, df: pd.DataFrame):
+        """Clear the cache when it is used with a different number of rows."""
+        if self._num_rows != len(df):
+            if self._num_rows is not None:
+                logger.debug(f"Row count changed from {self._num_rows} to {len(df)}. Clearing column statistics cache.")
+            self._values.clear()
+            self._num_rows = len(df)
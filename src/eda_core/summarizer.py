@@ -43,7 +43,7 @@ def generate_summary_rule_based(df: pd.DataFrame, column_stats: Dict[str, Column
 
     # Missing data report
     missing_report = {
-        col: f"{stats.missing_pct:.2f}%" for col, stats in column_stats.items() if stats.missing_pct > 0
+        col: f"{stats.missing_pct:.2f}%" for col, stats in column_stats.items() if stats.missing_pct
     }
 
     # Potential issues
@@ -51,7 +51,7 @@ def generate_summary_rule_based(df: pd.DataFrame, column_stats: Dict[str, Column
     for col, stats in column_stats.items():
         if stats.unique == 1:
             potential_issues.append(f"Column '{col}' is constant.")
-        if stats.missing_pct > 50:
+        if stats.missing_pct is not None and stats.missing_pct > 50:
             potential_issues.append(f"Column '{col}' has over 50% missing values.")
 
     summary = {
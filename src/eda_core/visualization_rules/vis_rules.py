@@ -13,30 +13,35 @@ Each recommendation is classified as:
 """
 
 #Import libraries
-from typing import Dict, List
+from typing import Dict, List, Mapping, Optional
 import pandas as pd
 
 #Import util modules
 from src.utils.logging import get_logger
 from src.utils.exceptions import RuleProcessingError
 from src.utils.models import ColumnSchema, ColType, VisualizationLevel
+from src.eda_core.column_stats import as_stats_table
+from src.eda_core.stats_cache import ColumnStatsCache
 
 logger = get_logger(__name__)
 
 def visualization_rules(
     df: pd.DataFrame,
-    column_stats: Dict[str, ColumnSchema],
+    column_stats: Mapping[str, ColumnSchema],
     target_column: str = None,
-    task_type: str = None  # 'regression', 'classification', 'time-series'
+    task_type: str = None,  # 'regression', 'classification', 'time-series'
+    stats_cache: Optional[ColumnStatsCache] = None
 ) -> Dict[str, List[Dict[str, str]]]:
     """
     Determine visualization strategies for the dataset.
 
     Args:
         df (pd.DataFrame): The dataset to analyze.
-        column_stats (Dict[str, ColumnStats]): Column-level statistics.
+        column_stats (Mapping[str, ColumnSchema]): Column-level statistics, as a dict of
+            ColumnSchema or a ColumnStatsTable.
         target_column (str, optional): Target variable name.
         task_type (str, optional): ML task type ('regression', 'classification', 'time-series').
+        stats_cache (Optional[ColumnStatsCache]): Column statistics shared with the preprocessing rules.
 
     Returns:
         Dict[str, List[Dict[str, str]]]: Mapping of column names or column pairs to a list
@@ -49,46 +54,53 @@ def visualization_rules(
     visualizations: Dict[str, List[Dict[str, str]]] = {}
 
     try:
+        stats_table = as_stats_table(column_stats)
+        col_types = dict(zip(stats_table.names.tolist(), stats_table.types.tolist()))
+        num_cols = stats_table.names[stats_table.is_type(ColType.NUMERIC)].tolist()
+        cat_cols = stats_table.names[stats_table.is_type(ColType.CATEGORICAL)].tolist()
+        # Skewness of every numeric column in one pass
+        cache = stats_cache if stats_cache is not None else ColumnStatsCache()
+        skews = cache.skews(df, num_cols)
+
         # --- Univariate Rules ---
-        for col, stats in column_stats.items():
+        for col, col_type in col_types.items():
             if col == target_column:
                 continue
 
             visualizations[col] = []
 
             # For Numeric
-            if stats.type == ColType.NUMERIC:
+            if col_type == ColType.NUMERIC:
                 visualizations[col].append({"chart": "histogram", "level": VisualizationLevel.BASIC})
                 visualizations[col].append({"chart": "histogram_kde", "level": VisualizationLevel.DIAGNOSTIC})
 
-                skewness = df[col].dropna().skew()
-                if abs(skewness) > 1:
+                if abs(skews[col]) > 1:
                     visualizations[col].append({"chart": "histogram_log_scale", "level": VisualizationLevel.ADVANCED})
 
                 visualizations[col].append({"chart": "boxplot", "level": VisualizationLevel.BASIC})
 
             # For Categorical
-            elif stats.type == ColType.CATEGORICAL:
+            elif col_type == ColType.CATEGORICAL:
                 visualizations[col].append({"chart": "barplot", "level": VisualizationLevel.BASIC})
                 visualizations[col].append({"chart": "pareto_chart", "level": VisualizationLevel.DIAGNOSTIC})
                 visualizations[col].append({"chart": "proportion_chart", "level": VisualizationLevel.ADVANCED})
 
             # For Datetime
-            elif stats.type == ColType.DATETIME:
+            elif col_type == ColType.DATETIME:
                 visualizations[col].append({"chart": "lineplot", "level": VisualizationLevel.BASIC})
                 visualizations[col].append({"chart": "seasonal_decompose", "level": VisualizationLevel.DIAGNOSTIC})
                 visualizations[col].append({"chart": "rolling_avg_plot", "level": VisualizationLevel.ADVANCED})
 
             # For Boolean
-            elif stats.type == ColType.BOOLEAN:
+            elif col_type == ColType.BOOLEAN:
                 visualizations[col].append({"chart": "barplot", "level": VisualizationLevel.BASIC})
                 visualizations[col].append({"chart": "class_balance_plot", "level": VisualizationLevel.DIAGNOSTIC})
 
         # --- Bivariate Rules ---
-        if target_column and target_column in column_stats:
-            target_type = column_stats[target_column].type
+        if target_column and target_column in col_types:
+            target_type = col_types[target_column]
 
-            for col, stats in column_stats.items():
+            for col, col_type in col_types.items():
                 if col == target_column:
                     continue
 
@@ -96,32 +108,29 @@ def visualization_rules(
                 visualizations[key] = []
 
                 if task_type == "regression":
-                    if stats.type == ColType.NUMERIC:
+                    if col_type == ColType.NUMERIC:
                         visualizations[key].append({"chart": "scatter", "level": VisualizationLevel.BASIC})
                         visualizations[key].append({"chart": "scatter_trendline", "level": VisualizationLevel.ADVANCED})
                         visualizations[key].append({"chart": "partial_dependence_plot", "level": VisualizationLevel.ADVANCED})
-                    elif stats.type == ColType.CATEGORICAL:
+                    elif col_type == ColType.CATEGORICAL:
                         visualizations[key].append({"chart": "boxplot", "level": VisualizationLevel.BASIC})
                         visualizations[key].append({"chart": "violin_plot", "level": VisualizationLevel.DIAGNOSTIC})
 
                 elif task_type == "classification":
-                    if stats.type == ColType.NUMERIC:
+                    if col_type == ColType.NUMERIC:
                         visualizations[key].append({"chart": "boxplot", "level": VisualizationLevel.BASIC})
                         visualizations[key].append({"chart": "violin_plot", "level": VisualizationLevel.DIAGNOSTIC})
-                    elif stats.type == ColType.CATEGORICAL:
+                    elif col_type == ColType.CATEGORICAL:
                         visualizations[key].append({"chart": "countplot", "level": VisualizationLevel.BASIC})
                         visualizations[key].append({"chart": "stacked_bar", "level": VisualizationLevel.DIAGNOSTIC})
 
                 elif task_type == "time-series":
-                    if stats.type == ColType.NUMERIC:
+                    if col_type == ColType.NUMERIC:
                         visualizations[key].append({"chart": "lineplot", "level": VisualizationLevel.BASIC})
                         visualizations[key].append({"chart": "lag_plot", "level": VisualizationLevel.DIAGNOSTIC})
                         visualizations[key].append({"chart": "acf_pacf", "level": VisualizationLevel.ADVANCED})
 
         # --- Multivariate Rules ---
-        num_cols = [c for c, s in column_stats.items() if s.type == ColType.NUMERIC]
-        cat_cols = [c for c, s in column_stats.items() if s.type == ColType.CATEGORICAL]
-
         if len(num_cols) > 1:
             visualizations["numeric_correlation"] = [{"chart": "heatmap", "level": VisualizationLevel.BASIC}]
             visualizations["clustered_correlation"] = [{"chart": "cluster_heatmap", "level": VisualizationLevel.ADVANCED}]
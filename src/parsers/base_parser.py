@@ -1,19 +1,174 @@
 """
 Base Parser
 
-This module is the base class for all parsers. 
+This module is the base class for all parsers.
 This acts as Factory class to create different parsers based on the input file type.
+It also provides `ChunkStream`, the iterable returned by the chunked loaders.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
 from pandas import DataFrame
-from src.utils.models import DatasetMetaData
+from src.utils.exceptions import FileLoadError, FileEmptyError
+from src.utils.models import DatasetMetaData, DocType
+from src.parsers.dtype_optimizer import optimize_dtypes, memory_usage_bytes
+from src.utils.fingerprint import ColumnHasher, HashingReader, column_fingerprints
+from src.utils.logging import get_logger
 from fastapi import UploadFile
 
+logger = get_logger(__name__)
+
+# Default number of rows per chunk for the streaming loaders.
+DEFAULT_CHUNK_SIZE = 100_000
+
+class ChunkStream:
+    """
+    Iterable over the DataFrame chunks of a dataset.
+
+    Row and column counts are collected while the chunks are consumed, so the
+    `metadata` of the dataset is available once the stream has been exhausted
+    without ever holding the full dataset in memory.
+    """
+
+    def __init__(self, chunks: Iterable[DataFrame], filename: str, file_type: DocType, content_hasher: Optional[HashingReader] = None):
+        """
+        Args:
+            chunks (Iterable[DataFrame]): Lazy source of DataFrame chunks.
+            filename (str): Name of the file being streamed.
+            file_type (DocType): Type of the file being streamed.
+            content_hasher (Optional[HashingReader]): Hasher wrapping the stream
+                the chunks are read from, for the content fingerprint.
+        """
+        self._chunks = chunks
+        self._content_hasher = content_hasher
+        self._column_hasher = ColumnHasher()
+        self.filename = filename
+        self.file_type = file_type
+        self.upload_time = datetime.now(timezone.utc)
+        self.num_rows = 0
+        self.column_names: Optional[List[str]] = None
+        self._metadata: Optional[DatasetMetaData] = None
+        self._consumed = False
+
+    def __iter__(self) -> Iterator[DataFrame]:
+        if self._consumed:
+            raise FileLoadError(f"Stream for '{self.filename}' has already been consumed")
+        self._consumed = True
+
+        for chunk in self._chunks:
+            if self.column_names is None:
+                self.column_names = []
+            # Chunks of semi-structured files may introduce new columns
+            seen = set(self.column_names)
+            self.column_names.extend(str(col) for col in chunk.columns if str(col) not in seen)
+            self.num_rows += len(chunk)
+            self._column_hasher.update(chunk)
+            yield chunk
+
+        if self.num_rows == 0 or not self.column_names:
+            raise FileEmptyError(f"The file '{self.filename}' is empty")
+
+        self._metadata = DatasetMetaData(
+            filename=self.filename,
+            file_type=self.file_type,
+            upload_time=self.upload_time,
+            num_rows=self.num_rows,
+            num_columns=len(self.column_names),
+            column_names=self.column_names,
+            content_hash=self._content_hasher.hexdigest() if self._content_hasher else None,
+            column_hashes=self._column_hasher.hexdigests(),
+        )
+
+    @property
+    def metadata(self) -> DatasetMetaData:
+        """
+        Metadata of the streamed dataset.
+
+        Raises:
+            FileLoadError: If the stream has not been fully consumed yet.
+        """
+        if self._metadata is None:
+            raise FileLoadError(f"Metadata for '{self.filename}' is only available once the stream is consumed")
+        return self._metadata
+
 class BaseParser(ABC):
     """
     Base class for all parsers. This class acts as a factory to create different parsers.
     """
+    # Downcast dtypes of fully loaded frames, see `optimize_dtypes`
+    optimize_memory: bool = False
+
     @abstractmethod
     def load(self, file: UploadFile) -> tuple[DataFrame, DatasetMetaData]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def load_from_path(self, path: Union[str, Path]) -> tuple[DataFrame, DatasetMetaData]:
+        pass
+
+    def load_chunks(self, file: UploadFile, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ChunkStream:
+        """
+        Stream the file as DataFrame chunks of at most `chunk_size` rows.
+
+        Args:
+            file: The file to be streamed.
+            chunk_size (int): Maximum number of rows per chunk.
+
+        Returns:
+            ChunkStream: Iterable of chunks exposing the metadata once consumed.
+
+        Raises:
+            NotImplementedError: If the parser does not support streaming.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support chunked loading")
+
+    def _finalize(self, df: DataFrame, filename: str, file_type: DocType, content_hash: Optional[str] = None, **extra_fields) -> tuple[DataFrame, DatasetMetaData]:
+        """
+        Apply the optional memory optimization to a fully loaded DataFrame and build
+        its metadata, including the content fingerprint and per-column hashes.
+
+        Args:
+            df (DataFrame): The loaded dataset.
+            filename (str): Name of the source file.
+            file_type (DocType): Type of the source file.
+            content_hash (Optional[str]): Fingerprint of the raw file content.
+            **extra_fields: Optional DatasetMetaData fields set by specific parsers.
+
+        Returns:
+            tuple[DataFrame, DatasetMetaData]: The (optimized) dataset and its metadata.
+        """
+        if self.optimize_memory:
+            memory_before = memory_usage_bytes(df)
+            df = optimize_dtypes(df)
+            memory_after = memory_usage_bytes(df)
+            extra_fields.update(memory_bytes_before=memory_before, memory_bytes_after=memory_after)
+            logger.info(f"Optimized dtypes of {filename}: {memory_before / 1024**2:.2f} MB -> {memory_after / 1024**2:.2f} MB")
+
+        extra_fields.update(content_hash=content_hash, column_hashes=column_fingerprints(df))
+        return df, self._build_metadata(df, filename, file_type, **extra_fields)
+
+    @staticmethod
+    def _build_metadata(df: DataFrame, filename: str, file_type: DocType, **extra_fields) -> DatasetMetaData:
+        """
+        Build the dataset metadata for a fully loaded DataFrame.
+
+        Args:
+            df (DataFrame): The loaded dataset.
+            filename (str): Name of the source file.
+            file_type (DocType): Type of the source file.
+            **extra_fields: Optional DatasetMetaData fields set by specific parsers.
+
+        Returns:
+            DatasetMetaData: The metadata of the dataset.
+        """
+        return DatasetMetaData(
+            filename=filename,
+            file_type=file_type,
+            upload_time=datetime.now(timezone.utc),
+            num_rows=df.shape[0],
+            num_columns=df.shape[1],
+            column_names=list(df.columns),
+            **extra_fields,
+        )
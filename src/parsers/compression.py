@@ -0,0 +1,144 @@
+"""
+Compressed Inputs
+
+This module transparently decompresses gzip, bz2, zstd and zip inputs as
+streams, so the parsers read the decompressed bytes directly instead of
+requiring a manual decompress step to disk. The compression is inferred from
+the filename suffix (`data.csv.gz`, `events.json.zst`, `export.zip`).
+"""
+
+#Import required libraries
+import bz2
+import gzip
+import io
+import tempfile
+import zipfile
+from pathlib import Path, PurePath
+from typing import BinaryIO, Optional, Tuple, Union
+
+#Import the util modules
+from src.utils.exceptions import FileLoadError
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Filename suffixes for each supported compression
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+    ".zip": "zip",
+}
+
+# Decompressed data kept in memory before spooling to disk, for formats needing random access
+SPOOL_MAX_BYTES = 64 * 1024**2
+
+# Block size used when spooling decompressed data
+COPY_BLOCK_SIZE = 1 << 20
+
+def detect_compression(filename: str) -> Optional[str]:
+    """
+    Detect the compression of a file from its name.
+
+    Args:
+        filename (str): Name of the file.
+
+    Returns:
+        Optional[str]: 'gzip', 'bz2', 'zstd', 'zip' or None if uncompressed.
+    """
+    return COMPRESSION_SUFFIXES.get(PurePath(filename).suffix.lower())
+
+def inner_filename(filename: str, source: Optional[Union[str, Path, BinaryIO]] = None) -> str:
+    """
+    Name of the data file inside a possibly compressed file, e.g. 'sales.csv'
+    for 'sales.csv.gz'. For zip archives the member name is read from `source`.
+
+    Args:
+        filename (str): Name of the (compressed) file.
+        source: Path or seekable stream of the file, needed for zip archives.
+
+    Returns:
+        str: Name of the decompressed data file.
+    """
+    compression = detect_compression(filename)
+    if compression is None:
+        return filename
+    if compression == "zip" and source is not None:
+        position = source.tell() if hasattr(source, "tell") else None
+        with zipfile.ZipFile(source) as archive:
+            member = _select_member(archive)
+        if position is not None:
+            source.seek(position)
+        return PurePath(member).name
+    return PurePath(filename).stem
+
+def open_decompressed(stream: BinaryIO, filename: str, random_access: bool = False) -> Tuple[BinaryIO, str]:
+    """
+    Wrap a binary stream in a streaming decompressor based on the filename.
+    Uncompressed inputs are returned unchanged.
+
+    Args:
+        stream (BinaryIO): The raw (compressed) stream.
+        filename (str): Name of the file, used to infer the compression.
+        random_access (bool): Whether the reader needs to seek freely (Parquet, xlsx).
+            The decompressed data is then spooled to a temporary file, kept in
+            memory up to SPOOL_MAX_BYTES.
+
+    Returns:
+        Tuple[BinaryIO, str]: The decompressed stream and the name of the data file.
+
+    Raises:
+        FileLoadError: If the compression is not supported or the archive is invalid.
+    """
+    compression = detect_compression(filename)
+    if compression is None:
+        return stream, filename
+
+    try:
+        if compression == "gzip":
+            decompressed, name = gzip.GzipFile(fileobj=stream, mode="rb"), PurePath(filename).stem
+        elif compression == "bz2":
+            decompressed, name = bz2.BZ2File(stream, mode="rb"), PurePath(filename).stem
+        elif compression == "zstd":
+            try:
+                import zstandard
+            except ImportError as e:
+                raise FileLoadError("Reading zstd files requires the 'zstandard' package") from e
+            # The zstd reader only implements raw reads, buffer it for readline and peeking
+            reader = zstandard.ZstdDecompressor().stream_reader(stream)
+            decompressed, name = io.BufferedReader(reader), PurePath(filename).stem
+        else:
+            archive = zipfile.ZipFile(stream)
+            member = _select_member(archive)
+            decompressed, name = archive.open(member), PurePath(member).name
+
+        logger.debug(f"Decompressing {filename} ({compression}) as {name}")
+        if random_access:
+            decompressed = _spool(decompressed)
+        return decompressed, name
+
+    except FileLoadError:
+        raise
+    except Exception as e:
+        logger.error(f"Error decompressing {filename}: {e}")
+        raise FileLoadError(f"Unable to decompress {filename}") from e
+
+def _select_member(archive: zipfile.ZipFile) -> str:
+    """Pick the single data file of a zip archive."""
+    members = [
+        info.filename for info in archive.infolist()
+        if not info.is_dir() and not info.filename.startswith("__MACOSX/")
+    ]
+    if len(members) != 1:
+        raise FileLoadError(f"Expected exactly one data file in the zip archive, found {len(members)}")
+    return members[0]
+
+def _spool(stream: BinaryIO) -> BinaryIO:
+    """Copy a forward-only stream into a seekable spooled temporary file."""
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    for block in iter(lambda: stream.read(COPY_BLOCK_SIZE), b""):
+        spooled.write(block)
+    spooled.seek(0)
+    return spooled
@@ -2,27 +2,81 @@
 CSV Parser 
 
 This module loads the CSV files and parses them into a usable format.
+Two engines are available: the default single-threaded pandas reader and a
+multithreaded Arrow reader producing Arrow-backed dtypes. Compressed files
+(`.csv.gz`, `.csv.bz2`, `.csv.zst`, zip) are decompressed while streaming.
 """
 
 #Import the abstract class
-from src.parsers.base_parser import BaseParser
+from src.parsers.base_parser import BaseParser, ChunkStream, DEFAULT_CHUNK_SIZE
+from src.parsers.compression import detect_compression, open_decompressed
 
 #Import required libraries
 import pandas as pd
-from typing import Tuple
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from pathlib import Path
 from fastapi import UploadFile
-from datetime import datetime, timezone
-import io
 
 #Import the util modules
 from src.utils.exceptions import FileLoadError, FileEmptyError
 from src.utils.logging import get_logger
-from src.utils.models import DatasetMetaData, DocType
+from src.utils.fingerprint import hash_file, open_hashing_stream
+from src.utils.models import ColType, ColumnSchema, DatasetMetaData, DocType
 
 logger = get_logger(__name__)
 
+# Supported CSV engines
+CSV_ENGINES = ("pandas", "pyarrow")
+
+# dtype hints per column type for each engine. Types missing here are left to inference.
+PANDAS_DTYPE_HINTS = {
+    ColType.NUMERIC: "float64",
+    ColType.BOOLEAN: "boolean",
+    ColType.CATEGORICAL: "category",
+    ColType.TEXT: "string",
+}
+ARROW_DTYPE_HINTS = {
+    ColType.NUMERIC: pa.float64(),
+    ColType.BOOLEAN: pa.bool_(),
+    ColType.CATEGORICAL: pa.dictionary(pa.int32(), pa.string()),
+    ColType.TEXT: pa.string(),
+}
+
+def dtype_hints_from_profile(column_stats: Dict[str, ColumnSchema], engine: str = "pandas") -> Dict[str, Any]:
+    """
+    Build explicit dtype hints for `CSVParser` from a previous profile, so that
+    re-reading the same dataset skips type inference.
+
+    Args:
+        column_stats (Dict[str, ColumnSchema]): Column statistics from MetadataExtractor.
+        engine (str): Engine the hints are meant for ('pandas' or 'pyarrow').
+
+    Returns:
+        Dict[str, Any]: Mapping of column names to pandas or Arrow dtypes.
+    """
+    hints = ARROW_DTYPE_HINTS if engine == "pyarrow" else PANDAS_DTYPE_HINTS
+    return {col: hints[stats.type] for col, stats in column_stats.items() if stats.type in hints}
+
 class CSVParser(BaseParser):
     """CSV Parser class."""
+
+    def __init__(self, engine: str = "pandas", usecols: Optional[List[str]] = None, dtype: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            engine (str): 'pandas' for the default reader or 'pyarrow' for the
+                multithreaded Arrow reader with Arrow-backed dtypes.
+            usecols (Optional[List[str]]): Only parse these columns.
+            dtype (Optional[Dict[str, Any]]): Explicit dtypes per column,
+                e.g. from `dtype_hints_from_profile`.
+        """
+        if engine not in CSV_ENGINES:
+            raise ValueError(f"Unsupported CSV engine '{engine}'. Expected one of {CSV_ENGINES}")
+        self.engine = engine
+        self.usecols = usecols
+        self.dtype = dtype
+
     def load(self, file: UploadFile) -> Tuple[pd.DataFrame, DatasetMetaData]:
         """
         This function overrides the load function from the base parser class.
@@ -37,25 +91,133 @@ class CSVParser(BaseParser):
         Raises:
             FileLoadError: If the file is unable to load.
         """
+        # Parse straight from the file handle instead of copying the payload first,
+        # hashing the (compressed) content in the same pass
+        stream, hasher = open_hashing_stream(file.file)
+        stream, _ = open_decompressed(stream, file.filename)
+        return self._parse(stream, file.filename, hasher.hexdigest)
+
+    def load_from_path(self, path: Union[str, Path]) -> Tuple[pd.DataFrame, DatasetMetaData]:
+        """
+        Load a CSV file from the local disk. The file is memory-mapped so pandas
+        parses it directly from the page cache without an intermediate bytes copy.
+        Compressed files are decompressed while they are parsed, and hashed in
+        the same pass. For uncompressed files the content hash is a second,
+        memory-mapped read of the file, served from the page cache the parser
+        just filled: hashing through the parser's reads would give up the memory map.
+
+        Args:
+            path (str | Path): Path to the CSV file.
+
+        Returns:
+            A tuple containing the parsed DataFrame and the metadata of the dataset.
+
+        Raises:
+            FileLoadError: If the file is unable to load.
+        """
+        path = Path(path)
+        if detect_compression(path.name) is None:
+            return self._parse(path, path.name, lambda: hash_file(path), memory_map=True)
+
+        try:
+            with path.open("rb") as f:
+                stream, hasher = open_hashing_stream(f)
+                stream, _ = open_decompressed(stream, path.name)
+                return self._parse(stream, path.name, hasher.hexdigest)
+        except OSError as e:
+            logger.error(f"Error loading CSV File: {e}")
+            raise FileLoadError('Unable to load the CSV File') from e
+
+    def _parse(self, source, filename: str, content_hash: Callable[[], str], memory_map: bool = False) -> Tuple[pd.DataFrame, DatasetMetaData]:
+        """Parse a CSV file handle or path into a DataFrame and its metadata. `content_hash` returns the file fingerprint."""
         try:
-            content = file.file.read()
-            df = pd.read_csv(io.BytesIO(content))
+            df = self._read(source, memory_map=memory_map)
 
             if df.empty:
                 logger.warning('CSV file is Empty')
                 raise FileEmptyError("The CSV file is empty")
 
-            metadata = DatasetMetaData(
-                filename = file.filename,
-                file_type = DocType.CSV,
-                upload_time = datetime.now(timezone.utc),
-                num_rows = df.shape[0],
-                num_columns = df.shape[1],
-                column_names = list(df.columns),
-            )
-            
-            return df, metadata
+            return self._finalize(df, filename, DocType.CSV, content_hash=content_hash())
         
         except Exception as e:
             logger.error(f"Error loading CSV File: {e}")
-            raise FileLoadError('Unable to load the CSV File') from e
\ No newline at end of file
+            raise FileLoadError('Unable to load the CSV File') from e
+
+    def _read(self, source, memory_map: bool = False) -> pd.DataFrame:
+        """Read the whole CSV source with the configured engine."""
+        if self.engine == "pyarrow":
+            if memory_map:
+                with pa.memory_map(str(source)) as mapped:
+                    table = pa_csv.read_csv(mapped, read_options=pa_csv.ReadOptions(use_threads=True), convert_options=self._convert_options())
+            else:
+                table = pa_csv.read_csv(source, read_options=pa_csv.ReadOptions(use_threads=True), convert_options=self._convert_options())
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+        return pd.read_csv(source, usecols=self.usecols, dtype=self.dtype, memory_map=memory_map)
+
+    def _convert_options(self) -> pa_csv.ConvertOptions:
+        """Arrow conversion options carrying the column projection and dtype hints."""
+        return pa_csv.ConvertOptions(
+            include_columns=self.usecols,
+            column_types=self.dtype,
+            # Match pandas, which reads empty fields as missing values
+            strings_can_be_null=True,
+        )
+
+    def load_chunks(self, file: UploadFile, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ChunkStream:
+        """
+        Stream the CSV file as DataFrame chunks read directly from the file handle.
+        Peak memory depends on `chunk_size` instead of the file size, also for
+        compressed files which are decompressed as the chunks are read.
+
+        Args:
+            file: The CSV file to be streamed.
+            chunk_size (int): Maximum number of rows per chunk.
+
+        Returns:
+            ChunkStream: Iterable of chunks. Its metadata is available once consumed.
+
+        Raises:
+            FileLoadError: If the file is unable to load while streaming.
+        """
+        stream, hasher = open_hashing_stream(file.file)
+        stream, _ = open_decompressed(stream, file.filename)
+        return ChunkStream(self._iter_chunks(stream, chunk_size), filename=file.filename, file_type=DocType.CSV, content_hasher=hasher)
+
+    def _iter_chunks(self, stream, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Yield the chunks of the CSV file, wrapping reader errors in FileLoadError."""
+        try:
+            if self.engine == "pyarrow":
+                yield from self._iter_arrow_chunks(stream, chunk_size)
+                return
+
+            with pd.read_csv(stream, chunksize=chunk_size, usecols=self.usecols, dtype=self.dtype) as reader:
+                for chunk in reader:
+                    yield chunk
+
+        except pd.errors.EmptyDataError as e:
+            logger.warning('CSV file is Empty')
+            raise FileEmptyError("The CSV file is empty") from e
+
+        except Exception as e:
+            logger.error(f"Error streaming CSV File: {e}")
+            raise FileLoadError('Unable to stream the CSV File') from e
+
+    def _iter_arrow_chunks(self, source, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Re-batch the Arrow streaming reader's record batches into chunks of `chunk_size` rows."""
+        reader = pa_csv.open_csv(source, read_options=pa_csv.ReadOptions(use_threads=True), convert_options=self._convert_options())
+        pending: List[pa.RecordBatch] = []
+        pending_rows = 0
+
+        for batch in reader:
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            while pending_rows >= chunk_size:
+                table = pa.Table.from_batches(pending)
+                yield table.slice(0, chunk_size).to_pandas(types_mapper=pd.ArrowDtype)
+                rest = table.slice(chunk_size)
+                pending = rest.to_batches()
+                pending_rows = rest.num_rows
+
+        if pending_rows:
+            yield pa.Table.from_batches(pending).to_pandas(types_mapper=pd.ArrowDtype)
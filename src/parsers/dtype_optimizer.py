@@ -0,0 +1,81 @@
+"""
+Dtype Optimizer
+
+This module shrinks the memory footprint of freshly ingested DataFrames:
+integers and floats are downcast to the smallest width that holds every value
+exactly, low-cardinality string columns become `category` and string booleans
+become `bool`.
+"""
+
+#Import required libraries
+import numpy as np
+import pandas as pd
+
+#Import the util modules
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Object columns with at most this ratio of unique values to rows become `category`
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# String values recognised as booleans (compared case-insensitively)
+TRUE_STRINGS = {"true", "yes"}
+FALSE_STRINGS = {"false", "no"}
+
+def optimize_dtypes(df: pd.DataFrame, category_max_unique_ratio: float = CATEGORY_MAX_UNIQUE_RATIO) -> pd.DataFrame:
+    """
+    Return a copy of the DataFrame with memory-efficient dtypes.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to optimize.
+        category_max_unique_ratio (float): Maximum ratio of unique values to
+            non-null rows for an object column to be converted to `category`.
+
+    Returns:
+        pd.DataFrame: The DataFrame with downcast dtypes.
+    """
+    optimized = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            optimized[col] = series
+        elif pd.api.types.is_integer_dtype(series):
+            optimized[col] = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series):
+            optimized[col] = _downcast_float(series)
+        elif pd.api.types.is_object_dtype(series):
+            optimized[col] = _convert_object(series, category_max_unique_ratio)
+        else:
+            optimized[col] = series
+
+    return pd.DataFrame(optimized, index=df.index)
+
+def _downcast_float(series: pd.Series) -> pd.Series:
+    """Downcast to float32 only when every value round-trips exactly."""
+    if series.dtype == np.float32:
+        return series
+    downcast = series.astype(np.float32)
+    exact = (downcast.astype(series.dtype) == series) | series.isna()
+    return downcast if exact.all() else series
+
+def _convert_object(series: pd.Series, category_max_unique_ratio: float) -> pd.Series:
+    """Convert string booleans to bool and low-cardinality strings to category."""
+    non_null = series.dropna()
+    if non_null.empty or not non_null.map(type).eq(str).all():
+        return series
+
+    uniques = non_null.unique()
+    lowered = {value.strip().lower() for value in uniques}
+    if lowered <= TRUE_STRINGS | FALSE_STRINGS and lowered & TRUE_STRINGS and lowered & FALSE_STRINGS:
+        as_bool = series.map(lambda value: value if pd.isna(value) else value.strip().lower() in TRUE_STRINGS)
+        # Nullable boolean keeps missing values, plain bool is used when there are none
+        return as_bool.astype("boolean") if len(non_null) < len(series) else as_bool.astype(bool)
+
+    if len(uniques) <= category_max_unique_ratio * len(non_null):
+        return series.astype("category")
+    return series
+
+def memory_usage_bytes(df: pd.DataFrame) -> int:
+    """Deep memory usage of a DataFrame, including the payload of object columns."""
+    return int(df.memory_usage(deep=True).sum())
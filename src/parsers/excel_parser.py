@@ -1,28 +1,91 @@
 """
-Excel Parser 
+Excel Parser
 
 This module loads the Excel files and parses them into a usable format.
+Workbooks are streamed with openpyxl's read-only mode, which iterates cell
+values without building the full cell object graph. Several sheets can be
+loaded in parallel worker processes. Compressed workbooks (`.xlsx.gz`, ...)
+are decompressed into a spooled temporary file first.
 """
 
 #Import the abstract class
 from src.parsers.base_parser import BaseParser
+from src.parsers.compression import detect_compression, open_decompressed
 
 #Import required libraries
 import pandas as pd
-from typing import Tuple
-from fastapi import UploadFile
-from datetime import datetime, timezone
+from openpyxl import load_workbook
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from pathlib import Path
 import io
+import shutil
+import tempfile
 
 #Import the util modules
 from src.utils.exceptions import FileLoadError, FileEmptyError
 from src.utils.logging import get_logger
+from src.utils.fingerprint import hash_file, open_hashing_stream
 from src.utils.models import DatasetMetaData, DocType
 
 logger = get_logger(__name__)
 
+def _read_sheet(source, sheet_name: Optional[Union[str, int]] = None) -> pd.DataFrame:
+    """
+    Stream one worksheet into a DataFrame using openpyxl's read-only mode.
+    The first row is used as the header. Defined at module level so it can
+    run in worker processes.
+
+    Args:
+        source: Path to the workbook, raw workbook bytes or a seekable file handle.
+        sheet_name (Optional[str | int]): Sheet name or index. Defaults to the first sheet.
+
+    Returns:
+        pd.DataFrame: The sheet contents.
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+    try:
+        if sheet_name is None:
+            sheet = workbook.worksheets[0]
+        elif isinstance(sheet_name, int):
+            sheet = workbook.worksheets[sheet_name]
+        else:
+            sheet = workbook[sheet_name]
+
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+
+        records = list(rows)
+    finally:
+        workbook.close()
+
+    # Read-only mode reports formatted but empty trailing rows, drop them like pandas does
+    while records and all(value is None for value in records[-1]):
+        records.pop()
+
+    columns = [f"Unnamed: {i}" if name is None else name for i, name in enumerate(header)]
+    return pd.DataFrame.from_records(records, columns=columns).infer_objects()
+
 class XLSXParser(BaseParser):
     """XLSX Parser class."""
+
+    def __init__(self, sheet_name: Optional[Union[str, int]] = None, streaming: bool = True):
+        """
+        Args:
+            sheet_name (Optional[str | int]): Sheet loaded by `load` and `load_from_path`.
+                Defaults to the first sheet.
+            streaming (bool): Use openpyxl's read-only streaming mode. If False,
+                the workbook is fully loaded through pandas.
+        """
+        self.sheet_name = sheet_name
+        self.streaming = streaming
+
     def load(self, file) -> Tuple[pd.DataFrame, DatasetMetaData]:
         """
         Load an Excel file into a DataFrame with metadata.
@@ -33,24 +96,149 @@ class XLSXParser(BaseParser):
         Returns:
             Tuple of DataFrame and DatasetMetaData.
         """
+        # Both upload types expose a seekable handle, which openpyxl reads directly
+        handle = file.file if hasattr(file, "file") else file
+        stream, hasher = open_hashing_stream(handle)
+        stream, _ = open_decompressed(stream, file.filename, random_access=True)
+        return self._parse(stream, file.filename, hasher.hexdigest)
+
+    def load_from_path(self, path: Union[str, Path]) -> Tuple[pd.DataFrame, DatasetMetaData]:
+        """
+        Load an Excel file from the local disk. openpyxl opens the workbook
+        directly from the file, without reading it into memory first. It reads
+        the zip archive out of order, so the content hash of an uncompressed
+        workbook is a second, memory-mapped read of the file. Compressed
+        workbooks are hashed while they are decompressed.
+
+        Args:
+            path (str | Path): Path to the Excel file.
+
+        Returns:
+            Tuple of DataFrame and DatasetMetaData.
+        """
+        path = Path(path)
+        if detect_compression(path.name) is None:
+            return self._parse(path, path.name, lambda: hash_file(path))
+
         try:
-            # Read file content
-            content = file.file.read() if hasattr(file, "file") else file.read()
-            df = pd.read_excel(io.BytesIO(content), engine='openpyxl')
+            with path.open("rb") as f:
+                stream, hasher = open_hashing_stream(f)
+                stream, _ = open_decompressed(stream, path.name, random_access=True)
+                return self._parse(stream, path.name, hasher.hexdigest)
+        except OSError as e:
+            logger.error(f"Error loading Excel File: {e}")
+            raise FileLoadError('Unable to load the Excel File') from e
+
+    def load_sheets(self, file, sheet_names: Optional[List[str]] = None, max_workers: Optional[int] = None) -> Dict[str, Tuple[pd.DataFrame, DatasetMetaData]]:
+        """
+        Load several sheets of an uploaded workbook, in parallel worker processes.
+
+        Args:
+            file: Uploaded file object (FastAPI UploadFile or Streamlit UploadedFile).
+            sheet_names (Optional[List[str]]): Sheets to load. Defaults to all sheets.
+            max_workers (Optional[int]): Number of worker processes. 1 loads the sheets sequentially.
+
+        Returns:
+            Dict[str, Tuple[pd.DataFrame, DatasetMetaData]]: DataFrame and metadata per sheet.
+        """
+        handle = file.file if hasattr(file, "file") else file
+        stream, hasher = open_hashing_stream(handle)
+        # Workers cannot share the upload handle; it is streamed, decompressed, to one temporary file they open
+        with tempfile.TemporaryDirectory() as tmp:
+            workbook = self._spool_workbook(stream, file.filename, Path(tmp))
+            return self._parse_sheets(workbook, file.filename, hasher.hexdigest(), sheet_names, max_workers)
+
+    def load_sheets_from_path(self, path: Union[str, Path], sheet_names: Optional[List[str]] = None, max_workers: Optional[int] = None) -> Dict[str, Tuple[pd.DataFrame, DatasetMetaData]]:
+        """
+        Load several sheets of a workbook on the local disk, in parallel worker processes.
+        Each worker opens the workbook itself in read-only mode. The content hash
+        is taken like in `load_from_path`.
+
+        Args:
+            path (str | Path): Path to the Excel file.
+            sheet_names (Optional[List[str]]): Sheets to load. Defaults to all sheets.
+            max_workers (Optional[int]): Number of worker processes. 1 loads the sheets sequentially.
+
+        Returns:
+            Dict[str, Tuple[pd.DataFrame, DatasetMetaData]]: DataFrame and metadata per sheet.
+        """
+        path = Path(path)
+        if detect_compression(path.name) is None:
+            return self._parse_sheets(str(path), path.name, hash_file(path), sheet_names, max_workers)
+
+        # Workers read the decompressed workbook from one temporary file instead of the path
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                with path.open("rb") as f:
+                    stream, hasher = open_hashing_stream(f)
+                    workbook = self._spool_workbook(stream, path.name, Path(tmp))
+                    content_hash = hasher.hexdigest()
+            except OSError as e:
+                logger.error(f"Error loading Excel File: {e}")
+                raise FileLoadError('Unable to load the Excel File') from e
+            return self._parse_sheets(workbook, path.name, content_hash, sheet_names, max_workers)
+
+    @staticmethod
+    def _spool_workbook(stream, filename: str, directory: Path) -> str:
+        """Stream a possibly compressed workbook into a file in `directory`, without holding it in memory, and return its path."""
+        path = directory / "workbook.xlsx"
+        try:
+            with path.open("wb") as f:
+                shutil.copyfileobj(open_decompressed(stream, filename)[0], f)
+        except FileLoadError:
+            raise
+        except Exception as e:
+            logger.error(f"Error loading Excel File: {e}")
+            raise FileLoadError('Unable to load the Excel File') from e
+        return str(path)
+
+    def _parse(self, source, filename: str, content_hash: Callable[[], str]) -> Tuple[pd.DataFrame, DatasetMetaData]:
+        """Parse one sheet of an Excel file handle or path into a DataFrame and its metadata. `content_hash` returns the file fingerprint."""
+        try:
+            if self.streaming:
+                df = _read_sheet(source, self.sheet_name)
+            else:
+                df = pd.read_excel(source, sheet_name=self.sheet_name or 0, engine='openpyxl')
 
             if df.empty:
                 logger.warning('Excel File is Empty')
                 raise FileEmptyError("The Excel file is empty")
 
-            metadata = DatasetMetaData(
-                filename=file.filename,
-                file_type=DocType.XLSX,
-                upload_time=datetime.now(timezone.utc),
-                num_rows=df.shape[0],
-                num_columns=df.shape[1],
-                column_names=list(df.columns),
-            )
-            return df, metadata
+            sheet_name = self.sheet_name if isinstance(self.sheet_name, str) else None
+            return self._finalize(df, filename, DocType.XLSX, content_hash=content_hash(), sheet_name=sheet_name)
+
+        except Exception as e:
+            logger.error(f"Error loading Excel File: {e}")
+            raise FileLoadError('Unable to load the Excel File') from e
+
+    def _parse_sheets(self, source: str, filename: str, content_hash: str, sheet_names: Optional[List[str]], max_workers: Optional[int]) -> Dict[str, Tuple[pd.DataFrame, DatasetMetaData]]:
+        """Load the requested sheets of the workbook at path `source`, fanning out to a process pool when more than one is needed."""
+        try:
+            if sheet_names is None:
+                workbook = load_workbook(source, read_only=True)
+                sheet_names = workbook.sheetnames
+                workbook.close()
+
+            if max_workers == 1 or len(sheet_names) <= 1:
+                frames = [_read_sheet(source, name) for name in sheet_names]
+            else:
+                logger.info(f"Loading {len(sheet_names)} sheets in parallel from '{filename}'")
+                # Workers get a path and open the workbook themselves, instead of each task pickling its bytes
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    frames = list(executor.map(_read_sheet, repeat(source), sheet_names))
+
+            results: Dict[str, Tuple[pd.DataFrame, DatasetMetaData]] = {}
+            for name, df in zip(sheet_names, frames):
+                if df.empty:
+                    logger.warning(f"Excel sheet '{name}' is empty. Skipping.")
+                    continue
+                results[name] = self._finalize(df, filename, DocType.XLSX, content_hash=content_hash, sheet_name=name)
+
+            if not results:
+                logger.warning('Excel File is Empty')
+                raise FileEmptyError("The Excel file is empty")
+
+            return results
 
         except Exception as e:
             logger.error(f"Error loading Excel File: {e}")
@@ -5,40 +5,144 @@ This module is like the hub for all the data parsers
 and chooses the appropriate parser based on the data type.
 """
 
-from fastapi import UploadFile
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
 
 # Import Parsers and utils
 from src.utils.models import DocType
+from src.utils.exceptions import FileLoadError
+from src.parsers.compression import detect_compression, inner_filename, open_decompressed
 from src.parsers.csv_parser import CSVParser
 from src.parsers.excel_parser import XLSXParser
 from src.parsers.json_parser import JSONParser
 from src.parsers.parquet_parser import ParquetParser
 
+# File extensions recognised for each document type
+EXTENSION_TYPES = {
+    ".csv": DocType.CSV,
+    ".json": DocType.JSON,
+    ".jsonl": DocType.JSON,
+    ".ndjson": DocType.JSON,
+    ".xlsx": DocType.XLSX,
+    ".parquet": DocType.PARQUET,
+    ".pq": DocType.PARQUET,
+}
+
+# Legacy binary Excel (BIFF) workbooks; XLSXParser reads OOXML workbooks only
+LEGACY_EXCEL_SUFFIX = ".xls"
+_OLE2_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Number of leading bytes inspected when the extension is unknown
+SNIFF_BYTES = 64
+
 class IngestionFactory:
     """This class is the factory for all ingestion parsers."""
     @staticmethod
-    def get_parser(file_type: DocType):
+    def get_parser(file_type: Union[DocType, str, Path], optimize_memory: bool = False):
         """
         This method returns the appropriate parser based on the file type.
 
         Args:
-            file_type: The type of document being uploaded.
+            file_type: The type of document being uploaded, or a path to the file
+                in which case the type is detected from the file itself.
+            optimize_memory (bool): Downcast numeric dtypes and convert low-cardinality
+                and boolean strings after loading. Memory before and after is recorded
+                in the DatasetMetaData.
 
         Returns:
             Parser : The parser for the given file type.
         """
+        if not isinstance(file_type, DocType):
+            try:
+                file_type = DocType(file_type)
+            except ValueError:
+                file_type = IngestionFactory.detect_doc_type(file_type)
+
         match file_type:
             case DocType.CSV:
-                return CSVParser()
+                parser = CSVParser()
             case DocType.XLSX:
-                return XLSXParser()
+                parser = XLSXParser()
             case DocType.JSON:
-                return JSONParser()
+                parser = JSONParser()
             case DocType.PARQUET:
-                return ParquetParser()
+                parser = ParquetParser()
             case _:
                 raise NotImplementedError(f"No parser available for {file_type}")
-            
+
+        parser.optimize_memory = optimize_memory
+        return parser
+
+    @staticmethod
+    def detect_doc_type(path: Union[str, Path], stream: Optional[BinaryIO] = None) -> DocType:
+        """
+        Detect the document type of a file from its extension, falling back to
+        the magic bytes at the start of the file. Compression suffixes are looked
+        through (`sales.csv.gz` is a CSV), zip archives are typed by their member
+        and compressed files without a known inner extension are sniffed after
+        decompression.
+
+        Args:
+            path: Path to the file, or only its name when `stream` is given.
+            stream (Optional[BinaryIO]): Seekable handle of an uploaded file. It is
+                read instead of `path` and rewound to its position afterwards.
+
+        Returns:
+            DocType: The detected document type.
+
+        Raises:
+            FileLoadError: If the file does not exist, cannot be read or is a legacy .xls workbook.
+        """
+        path = Path(path)
+        compression = detect_compression(path.name)
+        if compression != "zip":
+            suffix = Path(inner_filename(path.name)).suffix.lower()
+            if suffix == LEGACY_EXCEL_SUFFIX:
+                raise FileLoadError(_legacy_excel_message(path.name))
+            doc_type = EXTENSION_TYPES.get(suffix)
+            if doc_type is not None:
+                return doc_type
+
+        try:
+            if stream is not None:
+                position = stream.tell()
+                try:
+                    return IngestionFactory._detect_from_stream(path.name, stream)
+                finally:
+                    stream.seek(position)
+            with path.open("rb") as f:
+                return IngestionFactory._detect_from_stream(path.name, f)
+        except (OSError, zipfile.BadZipFile) as e:
+            raise FileLoadError(f"Unable to read file for type detection: {path}") from e
+
+    @staticmethod
+    def _detect_from_stream(filename: str, stream: BinaryIO) -> DocType:
+        """Detect the document type from the member name of a zip archive or the leading (decompressed) bytes."""
+        if detect_compression(filename) == "zip":
+            suffix = Path(inner_filename(filename, stream)).suffix.lower()
+            if suffix == LEGACY_EXCEL_SUFFIX:
+                raise FileLoadError(_legacy_excel_message(filename))
+            doc_type = EXTENSION_TYPES.get(suffix)
+            if doc_type is not None:
+                return doc_type
+
+        head = open_decompressed(stream, filename)[0].read(SNIFF_BYTES)
+        if head.startswith(_OLE2_MAGIC):
+            raise FileLoadError(_legacy_excel_message(filename))
+        if head.startswith(b"PAR1"):
+            return DocType.PARQUET
+        if head.startswith(b"PK\x03\x04"):
+            # xlsx workbooks are zip archives
+            return DocType.XLSX
+        if head.lstrip()[:1] in (b"{", b"["):
+            return DocType.JSON
+        return DocType.CSV
+
+def _legacy_excel_message(filename: str) -> str:
+    """Error message for legacy binary Excel workbooks, which no parser reads."""
+    return f"Legacy Excel workbook '{filename}' (.xls) is not supported. Save it as .xlsx and upload it again."
+
 """
 Example usage:
 
@@ -51,4 +155,16 @@ def handle_upload(file: UploadFile):
     parser = IngestionFactory.get_parser(file_type)
     df, metadata = parser.load(file)
     return df, metadata
+
+def handle_compressed_upload(file: UploadFile):
+    # e.g. "sales.csv.gz" or "events.json.zst", decompressed while parsing
+    file_type = IngestionFactory.detect_doc_type(file.filename, stream=file.file)
+    parser = IngestionFactory.get_parser(file_type)
+    df, metadata = parser.load(file)
+    return df, metadata
+
+def handle_local_file(path: str):
+    parser = IngestionFactory.get_parser(path)
+    df, metadata = parser.load_from_path(path)
+    return df, metadata
 """
\ No newline at end of file
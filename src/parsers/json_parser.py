@@ -1,32 +1,119 @@
 """
-JSON Parser 
+JSON Parser
 
 This module loads the JSON files and parses them into a usable format.
+The layout (array of records, single object or newline-delimited JSON) is
+sniffed from the first bytes so each file is parsed exactly once. NDJSON is
+read and flattened in bounded-size chunks of records. Compressed files
+(`.json.gz`, `.json.zst`, zip, ...) are decompressed while streaming.
 """
 
 #Import the abstract class
-from src.parsers.base_parser import BaseParser
+from src.parsers.base_parser import BaseParser, ChunkStream, DEFAULT_CHUNK_SIZE
+from src.parsers.compression import open_decompressed
 
 #Import required libraries
+import json
 import pandas as pd
-from typing import Tuple
+from typing import BinaryIO, Callable, Iterator, List, Tuple, Union
+from pathlib import Path
 from fastapi import UploadFile
-from datetime import datetime, timezone
-import io
 
 #Import the util modules
 from src.utils.exceptions import FileLoadError, FileEmptyError
 from src.utils.logging import get_logger
+from src.utils.fingerprint import open_hashing_stream
 from src.utils.models import DatasetMetaData, DocType
 
 logger = get_logger(__name__)
 
+# Number of leading bytes inspected to detect the JSON layout
+SNIFF_BYTES = 1 << 20
+
+# Longest first line read past the sniffed bytes to tell NDJSON from a single object.
+# A longer first line is taken for a single object.
+SNIFF_LINE_LIMIT = 16 * SNIFF_BYTES
+
+# JSON layouts recognised by the sniffer
+JSON_ARRAY = "array"
+JSON_OBJECT = "object"
+JSON_LINES = "ndjson"
+
+class _ReplayStream:
+    """Binary reader that replays already consumed leading bytes before the rest of a non-seekable stream."""
+
+    def __init__(self, prefix: bytes, stream: BinaryIO):
+        self._prefix = prefix
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._prefix:
+            return self._stream.read(size)
+        if size is None or size < 0:
+            data, self._prefix = self._prefix + self._stream.read(), b""
+            return data
+        data, self._prefix = self._prefix[:size], self._prefix[size:]
+        return data
+
+    def readline(self) -> bytes:
+        if not self._prefix:
+            return self._stream.readline()
+        newline = self._prefix.find(b"\n")
+        if newline >= 0:
+            line, self._prefix = self._prefix[:newline + 1], self._prefix[newline + 1:]
+            return line
+        line, self._prefix = self._prefix + self._stream.readline(), b""
+        return line
+
+def sniff_json_layout(stream: BinaryIO) -> Tuple[str, BinaryIO]:
+    """
+    Detect whether a JSON stream holds an array of records, a single object or NDJSON.
+
+    Args:
+        stream (BinaryIO): Binary stream positioned at the start of the document.
+
+    Returns:
+        Tuple[str, BinaryIO]: The detected layout and a stream positioned at the start again.
+
+    Raises:
+        FileLoadError: If the content does not look like JSON.
+    """
+    seekable = hasattr(stream, "seekable") and stream.seekable()
+    start = stream.tell() if seekable else 0
+    head = stream.read(SNIFF_BYTES)
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if text.startswith(b"{") and len(head) == SNIFF_BYTES and b"\n" not in head:
+        # The first line is longer than the sniffed bytes: complete it, up to a bound, and peek past it
+        head += stream.readline(SNIFF_LINE_LIMIT)
+        if head.endswith(b"\n"):
+            head += stream.read(SNIFF_BYTES)
+        text = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+    if seekable:
+        stream.seek(start)
+    else:
+        stream = _ReplayStream(head, stream)
+
+    if text.startswith(b"["):
+        return JSON_ARRAY, stream
+    if not text.startswith(b"{"):
+        raise FileLoadError("The file does not contain JSON data")
+
+    first_line, _, rest = text.partition(b"\n")
+    if rest.strip():
+        try:
+            json.loads(first_line)
+            # A complete object on the first line followed by more content is NDJSON
+            return JSON_LINES, stream
+        except ValueError:
+            pass
+    return JSON_OBJECT, stream
+
 class JSONParser(BaseParser):
     """JSON Parser class."""
     def load(self, file: UploadFile) -> Tuple[pd.DataFrame, DatasetMetaData]:
         """
         This function overrides the load function from the base parser class.
-        It stores the metadata and parses the csv into a pandas DataFrame.
+        It stores the metadata and parses the json into a pandas DataFrame.
 
         Args:
             file: The JSON file to be loaded.
@@ -37,30 +124,118 @@ class JSONParser(BaseParser):
         Raises:
             FileLoadError: If the file is unable to load.
         """
+        stream, hasher = open_hashing_stream(file.file)
+        stream, _ = open_decompressed(stream, file.filename)
+        return self._parse(stream, file.filename, hasher.hexdigest)
+
+    def load_from_path(self, path: Union[str, Path]) -> Tuple[pd.DataFrame, DatasetMetaData]:
+        """
+        Load a JSON file from the local disk. The file is parsed directly from
+        disk, without the payload being copied into an upload buffer first.
+
+        Args:
+            path (str | Path): Path to the JSON file.
+
+        Returns:
+            A tuple containing the parsed DataFrame and the metadata of the dataset.
+
+        Raises:
+            FileLoadError: If the file is unable to load.
+        """
+        path = Path(path)
+        try:
+            with path.open("rb") as f:
+                stream, hasher = open_hashing_stream(f)
+                stream, _ = open_decompressed(stream, path.name)
+                return self._parse(stream, path.name, hasher.hexdigest)
+        except OSError as e:
+            logger.error(f"Error loading file: {e}")
+            raise FileLoadError('Unable to load the file') from e
+
+    def load_chunks(self, file: UploadFile, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ChunkStream:
+        """
+        Stream the JSON file as DataFrame chunks of flattened records. NDJSON is
+        read `chunk_size` records at a time; arrays and objects have to be
+        parsed as a whole and are then split into chunks.
+
+        Args:
+            file: The JSON file to be streamed.
+            chunk_size (int): Maximum number of rows per chunk.
+
+        Returns:
+            ChunkStream: Iterable of chunks. Its metadata is available once consumed.
+        """
+        stream, hasher = open_hashing_stream(file.file)
+        stream, _ = open_decompressed(stream, file.filename)
+        return ChunkStream(self._iter_chunks(stream, chunk_size), filename=file.filename, file_type=DocType.JSON, content_hasher=hasher)
+
+    def _parse(self, stream: BinaryIO, filename: str, content_hash: Callable[[], str]) -> Tuple[pd.DataFrame, DatasetMetaData]:
+        """Parse a JSON stream into a DataFrame and its metadata with a single pass. `content_hash` returns the file fingerprint."""
         try:
-            content = file.file.read()
-            try:
-                df = pd.read_json(io.BytesIO(content))
-            except ValueError:
-                # If the json file is nested
-                df = pd.read_json(io.BytesIO(content), lines=True)
+            layout, stream = sniff_json_layout(stream)
+            logger.debug(f"Detected JSON layout '{layout}' for {filename}")
+
+            if layout == JSON_LINES:
+                chunks = list(self._iter_lines(stream, DEFAULT_CHUNK_SIZE))
+                df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+            else:
+                df = self._read_document(stream, layout)
 
             # If there is no columns
             if df.shape[1] == 0:
                 logger.warning("JSON file has no columns.")
                 raise FileEmptyError("JSON file has no columns.")
 
-            metadata = DatasetMetaData(
-                filename = file.filename,
-                file_type = DocType.JSON,
-                upload_time = datetime.now(timezone.utc),
-                num_rows = df.shape[0],
-                num_columns = df.shape[1],
-                column_names = list(df.columns),
-            )
-            
-            return df, metadata
-        
+            return self._finalize(df, filename, DocType.JSON, content_hash=content_hash())
+
         except Exception as e:
             logger.error(f"Error loading file: {e}")
-            raise FileLoadError('Unable to load the file') from e
\ No newline at end of file
+            raise FileLoadError('Unable to load the file') from e
+
+    def _iter_chunks(self, stream: BinaryIO, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Yield flattened chunks of the JSON stream, wrapping reader errors in FileLoadError."""
+        try:
+            layout, stream = sniff_json_layout(stream)
+            if layout == JSON_LINES:
+                yield from self._iter_lines(stream, chunk_size)
+                return
+
+            df = self._read_document(stream, layout)
+            for start in range(0, len(df), chunk_size):
+                yield df.iloc[start:start + chunk_size]
+
+        except Exception as e:
+            logger.error(f"Error streaming JSON file: {e}")
+            raise FileLoadError('Unable to stream the file') from e
+
+    @staticmethod
+    def _read_document(stream: BinaryIO, layout: str) -> pd.DataFrame:
+        """Parse a whole JSON array or object document."""
+        if layout == JSON_OBJECT:
+            document = json.load(stream)
+            if not any(isinstance(value, (dict, list)) for value in document.values()):
+                # A single flat record
+                return pd.DataFrame([document])
+            return pd.DataFrame(document)
+
+        records = json.load(stream)
+        if records and all(isinstance(record, dict) for record in records):
+            # Flatten nested records into dotted column names
+            return pd.json_normalize(records)
+        return pd.DataFrame(records)
+
+    @staticmethod
+    def _iter_lines(stream: BinaryIO, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Read NDJSON `chunk_size` records at a time, flattening each chunk on its own."""
+        records: List[dict] = []
+        for line in iter(stream.readline, b""):
+            line = line.strip()
+            if not line:
+                continue
+            records.append(json.loads(line))
+            if len(records) >= chunk_size:
+                yield pd.json_normalize(records)
+                records = []
+
+        if records:
+            yield pd.json_normalize(records)
@@ -2,34 +2,76 @@
 Parquet Parser
 
 This module loads Parquet files and parses them into a usable format.
+Column subsets and row filters are pushed down to the Parquet reader, so
+unselected columns and row groups excluded by their statistics are never decoded.
+Footer statistics can also be read on their own to seed a profile without
+scanning any data pages. Compressed or zipped files are decompressed into a
+spooled temporary file, since the reader needs random access.
 """
 
 # Import the abstract base class
 from src.parsers.base_parser import BaseParser
+from src.parsers.compression import detect_compression, open_decompressed
 
 #Import required libraries
 import pandas as pd
-from typing import Tuple
+import pyarrow as pa
+import pyarrow.dataset as pa_ds
+import pyarrow.parquet as pq
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from pathlib import Path
 from fastapi import UploadFile
-from datetime import datetime, timezone
-import io
 
 #Import the util modules
 from src.utils.exceptions import FileLoadError, FileEmptyError
 from src.utils.logging import get_logger
-from src.utils.models import DatasetMetaData, DocType
+from src.utils.fingerprint import hash_file, open_hashing_stream
+from src.utils.models import ColType, ColumnSchema, DatasetMetaData, DocType
 
 logger = get_logger(__name__)
 
+# Row filters in pyarrow's DNF form: [("col", "op", value), ...] (AND) or a list of such lists (OR).
+ParquetFilters = Union[List[Tuple[str, str, Any]], List[List[Tuple[str, str, Any]]]]
+
 class ParquetParser(BaseParser):
     """Parquet Parser class."""
 
-    def load(self, file: UploadFile) -> Tuple[pd.DataFrame, DatasetMetaData]:
+    def load(self, file: UploadFile, columns: Optional[List[str]] = None, filters: Optional[ParquetFilters] = None) -> Tuple[pd.DataFrame, DatasetMetaData]:
         """
         Loads and parses a Parquet file into a DataFrame and generates metadata.
 
         Args:
             file (UploadFile): The Parquet file to be loaded.
+            columns (Optional[List[str]]): Only decode these columns.
+            filters (Optional[ParquetFilters]): Row filters, e.g. [("year", ">=", 2020)].
+                Row groups whose statistics cannot match are skipped.
+
+        Returns:
+            Tuple[pd.DataFrame, DatasetMetaData]: The parsed DataFrame and dataset metadata.
+
+        Raises:
+            FileEmptyError: If the file is empty or has no columns.
+            FileLoadError: If the file cannot be read as a Parquet file.
+        """
+        # The upload handle is seekable, so pyarrow reads the footer and the
+        # selected column chunks from it without copying the whole payload.
+        # Bytes pyarrow skips are hashed once parsing is done.
+        stream, hasher = open_hashing_stream(file.file)
+        stream, _ = open_decompressed(stream, file.filename, random_access=True)
+        return self._parse(stream, file.filename, hasher.hexdigest, columns=columns, filters=filters)
+
+    def load_from_path(self, path: Union[str, Path], columns: Optional[List[str]] = None, filters: Optional[ParquetFilters] = None) -> Tuple[pd.DataFrame, DatasetMetaData]:
+        """
+        Loads a Parquet file from the local disk. pyarrow memory-maps the file,
+        so column chunks are decoded straight from the page cache. For the same
+        reason the content hash of an uncompressed file is a second, memory-mapped
+        read rather than a hash of the parser's reads, which skip around the file.
+        Compressed files are hashed while they are decompressed.
+
+        Args:
+            path (str | Path): Path to the Parquet file.
+            columns (Optional[List[str]]): Only decode these columns.
+            filters (Optional[ParquetFilters]): Row filters, e.g. [("year", ">=", 2020)].
 
         Returns:
             Tuple[pd.DataFrame, DatasetMetaData]: The parsed DataFrame and dataset metadata.
@@ -38,27 +80,124 @@ class ParquetParser(BaseParser):
             FileEmptyError: If the file is empty or has no columns.
             FileLoadError: If the file cannot be read as a Parquet file.
         """
+        path = Path(path)
+        if detect_compression(path.name) is None:
+            return self._parse(path, path.name, lambda: hash_file(path), columns=columns, filters=filters, memory_map=True)
+
         try:
-            content = file.file.read()
-            buffer = io.BytesIO(content)
+            with path.open("rb") as f:
+                stream, hasher = open_hashing_stream(f)
+                stream, _ = open_decompressed(stream, path.name, random_access=True)
+                return self._parse(stream, path.name, hasher.hexdigest, columns=columns, filters=filters)
+        except OSError as e:
+            logger.error(f"Error loading Parquet file: {e}")
+            raise FileLoadError("Unable to load the Parquet file.") from e
 
-            df = pd.read_parquet(buffer)
+    def _parse(self, source, filename: str, content_hash: Callable[[], str], **read_kwargs) -> Tuple[pd.DataFrame, DatasetMetaData]:
+        """Parse a Parquet file handle or path into a DataFrame and its metadata. `content_hash` returns the file fingerprint."""
+        try:
+            df = pd.read_parquet(source, **read_kwargs)
 
             if df.empty or df.shape[1] == 0:
                 logger.warning("Parquet file is empty or has no columns.")
                 raise FileEmptyError("The Parquet file is empty or invalid.")
 
-            metadata = DatasetMetaData(
-                filename = file.filename,
-                file_type=DocType.PARQUET,
-                upload_time=datetime.now(timezone.utc),
-                num_rows=df.shape[0],
-                num_columns=df.shape[1],
-                column_names=list(df.columns),
-            )
-
-            return df, metadata
+            return self._finalize(df, filename, DocType.PARQUET, content_hash=content_hash())
 
         except Exception as e:
             logger.error(f"Error loading Parquet file: {e}")
             raise FileLoadError("Unable to load the Parquet file.") from e
+
+    def read_footer_stats(self, source) -> Tuple[int, Dict[str, ColumnSchema]]:
+        """
+        Build column statistics from the Parquet footers only, without decoding
+        any data pages. Row count, missing fraction, min and max come from the
+        per-row-group statistics; unique, mean, std and mode are left as None.
+
+        Args:
+            source: Path to a Parquet file or a directory of Parquet files
+                (partitioned dataset), or a seekable file handle.
+
+        Returns:
+            Tuple[int, Dict[str, ColumnSchema]]: Total row count and column statistics.
+
+        Raises:
+            FileLoadError: If the footers cannot be read.
+        """
+        try:
+            if isinstance(source, (str, Path)):
+                dataset = pa_ds.dataset(str(source), format="parquet")
+                footers = [fragment.metadata for fragment in dataset.get_fragments()]
+                schema = dataset.schema
+            else:
+                footers = [pq.ParquetFile(source).metadata]
+                schema = footers[0].schema.to_arrow_schema()
+
+            num_rows = sum(footer.num_rows for footer in footers)
+            null_counts: Dict[str, Optional[int]] = {}
+            minimums: Dict[str, Any] = {}
+            maximums: Dict[str, Any] = {}
+
+            for footer in footers:
+                for rg_index in range(footer.num_row_groups):
+                    row_group = footer.row_group(rg_index)
+                    for col_index in range(row_group.num_columns):
+                        column = row_group.column(col_index)
+                        name = column.path_in_schema
+                        stats = column.statistics
+
+                        # A single row group without null counts makes the total unknown
+                        if stats is None or not stats.has_null_count:
+                            null_counts[name] = None
+                        elif null_counts.get(name, 0) is not None:
+                            null_counts[name] = null_counts.get(name, 0) + stats.null_count
+
+                        if stats is not None and stats.has_min_max:
+                            minimums[name] = stats.min if name not in minimums else min(minimums[name], stats.min)
+                            maximums[name] = stats.max if name not in maximums else max(maximums[name], stats.max)
+
+            column_stats: Dict[str, ColumnSchema] = {}
+            for field in schema:
+                if field.name.startswith("__index_level_"):
+                    continue
+
+                col_type = self._footer_col_type(field.type)
+                null_count = null_counts.get(field.name)
+                # Same scale as the profiler's p_missing (fraction of rows); None when a row group has no null count
+                if null_count is None:
+                    missing_pct = None
+                else:
+                    missing_pct = null_count / num_rows if num_rows else 0.0
+                is_numeric = col_type == ColType.NUMERIC
+
+                column_stats[field.name] = ColumnSchema(
+                    name=field.name,
+                    type=col_type,
+                    missing_pct=missing_pct,
+                    unique=None,
+                    mean=None,
+                    std=None,
+                    min=minimums.get(field.name) if is_numeric else None,
+                    max=maximums.get(field.name) if is_numeric else None,
+                    mode=None,
+                )
+
+            logger.info(f"Read footer statistics for {len(column_stats)} columns and {num_rows} rows.")
+            return num_rows, column_stats
+
+        except Exception as e:
+            logger.error(f"Error reading Parquet footer statistics: {e}")
+            raise FileLoadError("Unable to read the Parquet footer statistics.") from e
+
+    @staticmethod
+    def _footer_col_type(arrow_type: pa.DataType) -> ColType:
+        """Map an Arrow field type to the standardized column type."""
+        if pa.types.is_boolean(arrow_type):
+            return ColType.BOOLEAN
+        if pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+            return ColType.NUMERIC
+        if pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+            return ColType.DATETIME
+        if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type) or pa.types.is_dictionary(arrow_type):
+            return ColType.CATEGORICAL
+        return ColType.UNKNOWN
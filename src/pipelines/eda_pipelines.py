@@ -44,15 +44,15 @@ class EDAPipeline:
             df, metadata = parser.load_from_path(file_path)
             logger.info(f"✅ Data loaded: shape={df.shape}, filename={metadata.filename}")
 
-            # Step 2: Generate profile report
+            # Step 2: Generate profile report, handing the column stats over in memory
             logger.info("Running profiler...")
-            profile_json_path = self.profiler.generate_profile(df, report_name=metadata.filename)
+            column_stats = self.profiler.profile_columns(df, report_name=metadata.filename, persist=True)
 
             # Step 3: Run EDA Engine
             logger.info("Running EDA Engine...")
             results = self.eda_engine.run(
                 df=df,
-                profile_json_path=profile_json_path,
+                column_stats=column_stats,
                 target_column=target_column,
                 task_type=task_type,
                 model=model
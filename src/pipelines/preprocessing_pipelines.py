@@ -6,62 +6,238 @@ Orchestrates the dataset preprocessing steps:
     - Outlier detection/handling
     - Encoding/scaling
     - Transformations
+
+`fit` learns every parameter of these steps (fill values, outlier bounds,
+categories, target encodings, scaling parameters) into a versioned,
+serializable PreprocessingPlan. `transform` applies a plan to new batches
+as vectorized operations, without recomputing any statistic. `compile`
+turns a plan into a CompiledPlan for low-latency transforms of single
+records and micro-batches.
 """
 
 from pathlib import Path
+from typing import Optional, Union
 import pandas as pd
-from src.eda_core.preprocessing_rules.missing_values import handle_missing_values
-from src.eda_core.preprocessing_rules.outliers import handle_outliers
-from src.eda_core.preprocessing_rules.encodings import encode_and_scale
-from src.eda_core.preprocessing_rules.transformations import apply_transformations
+from src.eda_core.profiler import Profiler
+from src.eda_core.preprocessing_rules.missing_values import handle_missing_values, apply_missing_value_plan
+from src.eda_core.preprocessing_rules.outliers import handle_outliers, apply_outlier_plan
+from src.eda_core.preprocessing_rules.encodings import encode_and_scale, apply_encoding_plan
+from src.eda_core.preprocessing_rules.transformations import apply_transformations, apply_transformation_plan
+from src.eda_core.stats_cache import ColumnStatsCache
+from src.eda_core.compiled_plan import CompiledPlan
 from src.utils.logging import get_logger
 from src.utils.exceptions import PreprocessingError
+from src.utils.models import OutlierRemovalReport, PreprocessingPlan
 
 logger = get_logger(__name__)
 
+# Version written to new plans; plans of newer versions are rejected
+PLAN_VERSION = 1
+
 class PreprocessingPipeline:
-    def __init__(self, artifacts_dir: str = "artifacts"):
+    def __init__(self, artifacts_dir: str = "artifacts", profiler: Optional[Profiler] = None):
         self.artifacts_dir = Path(artifacts_dir)
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
+        # Profiles the data in memory when run without column stats
+        self.profiler = profiler
+        # Plan fitted by the last `fit` or `run`, or loaded with `load_plan`
+        self.plan: Optional[PreprocessingPlan] = None
+        # Rows removed by the outlier step of the last `fit` or `run`
+        self.outlier_report: Optional[OutlierRemovalReport] = None
         logger.info(f"Initialized PreprocessingPipeline. Artifacts dir: {self.artifacts_dir}")
 
-    def run(self, df: pd.DataFrame, column_stats: dict, save_output: bool = True) -> pd.DataFrame:
+    def fit(
+        self,
+        df: pd.DataFrame,
+        column_stats: Optional[dict] = None,
+        stats_cache: Optional[ColumnStatsCache] = None,
+        target_column: Optional[str] = None,
+    ) -> PreprocessingPlan:
+        """
+        Fit the preprocessing steps on a dataset and record their parameters.
+
+        Args:
+            df (pd.DataFrame): Training dataset.
+            column_stats (Optional[dict]): Metadata from MetadataExtractor or
+                `Profiler.profile_columns`. If None, the dataset is profiled in memory first.
+            stats_cache (Optional[ColumnStatsCache]): Column statistics shared by the steps.
+            target_column (Optional[str]): Target variable, required for target encoding.
+
+        Returns:
+            PreprocessingPlan: The fitted plan, also kept as `self.plan`.
+
+        Raises:
+            PreprocessingError: If fitting fails.
+        """
+        self._fit_transform(df, column_stats, stats_cache, target_column)
+        return self.plan
+
+    def transform(self, df: pd.DataFrame, plan: Optional[PreprocessingPlan] = None, remove_outliers: bool = True) -> pd.DataFrame:
+        """
+        Apply a fitted plan to new data. Only the recorded parameters are used;
+        no statistic of the new data is computed.
+
+        Args:
+            df (pd.DataFrame): New dataset with the columns the plan was fitted on.
+                The target column may be missing.
+            plan (Optional[PreprocessingPlan]): Plan to apply. Defaults to `self.plan`.
+            remove_outliers (bool): Whether to drop rows outside the fitted outlier bounds.
+                Pass False to keep every row when scoring.
+
+        Returns:
+            pd.DataFrame: Preprocessed dataset with the columns of the fitted output.
+
+        Raises:
+            PreprocessingError: If no plan is available, columns are missing or a step fails.
+        """
+        plan = plan if plan is not None else self.plan
+        if plan is None:
+            raise PreprocessingError("No preprocessing plan. Call fit or load_plan first.")
+
+        missing = [col for col in plan.input_columns if col not in df.columns and col != plan.target_column]
+        if missing:
+            raise PreprocessingError(f"Columns missing from the data to transform: {missing}")
+
+        try:
+            logger.info(f"Applying preprocessing plan to {len(df)} rows...")
+            df = apply_missing_value_plan(df[[col for col in plan.input_columns if col in df.columns]], plan.missing_values)
+            df = apply_outlier_plan(df, plan.outliers, remove_outliers)
+            df = apply_encoding_plan(df, plan.encodings)
+            df = apply_transformation_plan(df, plan.transformations)
+            return df[[col for col in plan.output_columns if col in df.columns]]
+
+        except Exception as e:
+            logger.error(f"Applying preprocessing plan failed: {e}")
+            raise PreprocessingError(f"Preprocessing failed: {e}") from e
+
+    def compile(self, plan: Optional[PreprocessingPlan] = None) -> CompiledPlan:
+        """
+        Compile a plan for low-latency transforms of records and micro-batches.
+
+        Args:
+            plan (Optional[PreprocessingPlan]): Plan to compile. Defaults to `self.plan`.
+
+        Returns:
+            CompiledPlan: The compiled plan.
+
+        Raises:
+            PreprocessingError: If no plan is available.
+        """
+        plan = plan if plan is not None else self.plan
+        if plan is None:
+            raise PreprocessingError("No preprocessing plan. Call fit or load_plan first.")
+        return CompiledPlan(plan)
+
+    def save_plan(self, path: Optional[Union[str, Path]] = None, plan: Optional[PreprocessingPlan] = None) -> str:
+        """
+        Save a plan as JSON.
+
+        Args:
+            path (Optional[str | Path]): Output path. Defaults to 'preprocessing_plan.json' in the artifacts dir.
+            plan (Optional[PreprocessingPlan]): Plan to save. Defaults to `self.plan`.
+
+        Returns:
+            str: Path to the saved plan.
+        """
+        plan = plan if plan is not None else self.plan
+        if plan is None:
+            raise PreprocessingError("No preprocessing plan to save.")
+        path = Path(path) if path is not None else self.artifacts_dir / "preprocessing_plan.json"
+        path.write_text(plan.model_dump_json(indent=2), encoding="utf-8")
+        logger.info(f"Preprocessing plan saved to: {path}")
+        return str(path)
+
+    def load_plan(self, path: Union[str, Path]) -> PreprocessingPlan:
         """
-        Execute the preprocessing pipeline.
+        Load a plan saved with `save_plan` and make it the pipeline's plan.
+
+        Args:
+            path (str | Path): Path to the plan JSON.
+
+        Returns:
+            PreprocessingPlan: The loaded plan.
+
+        Raises:
+            PreprocessingError: If the file is not a valid plan or was written by a newer version.
+        """
+        try:
+            plan = PreprocessingPlan.model_validate_json(Path(path).read_text(encoding="utf-8"))
+        except Exception as e:
+            raise PreprocessingError(f"Invalid preprocessing plan {path}: {e}") from e
+        if plan.version > PLAN_VERSION:
+            raise PreprocessingError(f"Preprocessing plan version {plan.version} is newer than the supported version {PLAN_VERSION}")
+        self.plan = plan
+        return plan
+
+    def run(self, df: pd.DataFrame, column_stats: Optional[dict] = None, save_output: bool = True, stats_cache: Optional[ColumnStatsCache] = None) -> pd.DataFrame:
+        """
+        Execute the preprocessing pipeline: fit it on the dataset and return the
+        preprocessed dataset. The fitted plan is kept as `self.plan`.
 
         Args:
             df (pd.DataFrame): Input dataset.
-            column_stats (dict): Metadata from MetadataExtractor (ColumnSchema).
-            save_output (bool): Whether to save the processed dataset.
+            column_stats (Optional[dict]): Metadata from MetadataExtractor or
+                `Profiler.profile_columns` (ColumnSchema). If None, the dataset is
+                profiled in memory first, without writing a profiling JSON.
+            save_output (bool): Whether to save the processed dataset and the fitted plan.
+            stats_cache (Optional[ColumnStatsCache]): Column statistics shared by the steps, so each
+                is computed once per column until a step changes the column. Pass the cache
+                used by `EDAEngine.run` on the same data to reuse its statistics.
 
         Returns:
             pd.DataFrame: Preprocessed dataset.
         """
+        df = self._fit_transform(df, column_stats, stats_cache)
+
+        # Save processed dataset
+        if save_output:
+            output_path = self.artifacts_dir / "preprocessed_dataset.csv"
+            df.to_csv(output_path, index=False)
+            logger.info(f"✅ Preprocessed dataset saved to: {output_path}")
+            self.save_plan()
+        return df
+
+    def _fit_transform(
+        self,
+        df: pd.DataFrame,
+        column_stats: Optional[dict],
+        stats_cache: Optional[ColumnStatsCache],
+        target_column: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Run every step on the dataset, recording the fitted parameters in a new `self.plan`."""
         try:
             logger.info("🚀 Starting preprocessing pipeline...")
 
+            if column_stats is None:
+                logger.info("Profiling dataset in memory...")
+                if self.profiler is None:
+                    self.profiler = Profiler(output_dir=self.artifacts_dir / "profiles")
+                column_stats = self.profiler.profile_columns(df)
+
+            if stats_cache is None:
+                stats_cache = ColumnStatsCache()
+
+            plan = PreprocessingPlan(version=PLAN_VERSION, input_columns=list(df.columns), target_column=target_column)
+
             # Step 1: Missing value handling
             logger.info("Handling missing values...")
-            df = handle_missing_values(df, column_stats)
+            df = handle_missing_values(df, column_stats, stats_cache, plan.missing_values)
 
             # Step 2: Outlier detection & handling
             logger.info("Detecting and handling outliers...")
-            df = handle_outliers(df, column_stats)
+            self.outlier_report = OutlierRemovalReport()
+            df = handle_outliers(df, column_stats, stats_cache, plan.outliers, self.outlier_report)
 
             # Step 3: Encoding & Scaling
             logger.info("Applying encoding and scaling...")
-            df = encode_and_scale(df, column_stats)
+            df = encode_and_scale(df, column_stats, target_column, stats_cache, plan.encodings)
 
             # Step 4: Additional transformations
             logger.info("Applying transformations...")
-            df = apply_transformations(df, column_stats)
-
-            # Save processed dataset
-            if save_output:
-                output_path = self.artifacts_dir / "preprocessed_dataset.csv"
-                df.to_csv(output_path, index=False)
-                logger.info(f"✅ Preprocessed dataset saved to: {output_path}")
+            df = apply_transformations(df, column_stats, stats_cache, plan.transformations)
 
+            plan.output_columns = list(df.columns)
+            self.plan = plan
             logger.info("✅ Preprocessing pipeline completed successfully.")
             return df
 
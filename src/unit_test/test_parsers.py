@@ -0,0 +1,351 @@
+"""
+Unit tests for the ingestion parsers.
+"""
+
+import io
+import json
+
+import pandas as pd
+import pytest
+from fastapi import UploadFile
+
+from src.parsers.csv_parser import CSVParser, dtype_hints_from_profile
+from src.parsers.excel_parser import XLSXParser
+from src.parsers.ingestor import IngestionFactory
+from src.parsers.json_parser import JSONParser, JSON_ARRAY, JSON_LINES, JSON_OBJECT, sniff_json_layout
+from src.parsers.parquet_parser import ParquetParser
+from src.utils.exceptions import FileEmptyError, FileLoadError
+from src.utils.fingerprint import hash_file
+from src.utils.models import ColType, ColumnSchema, DocType
+
+IRIS_CSV = "src/unit_test/iris.csv"
+
+def make_upload(content: bytes, filename: str) -> UploadFile:
+    return UploadFile(filename=filename, file=io.BytesIO(content))
+
+def test_csv_load_chunks_yields_bounded_chunks():
+    with open(IRIS_CSV, "rb") as f:
+        stream = CSVParser().load_chunks(UploadFile(filename="iris.csv", file=f), chunk_size=40)
+        chunks = list(stream)
+
+    assert [len(chunk) for chunk in chunks] == [40, 40, 40, 30]
+    assert stream.metadata.num_rows == 150
+    assert stream.metadata.num_columns == 5
+    assert stream.metadata.column_names == list(pd.read_csv(IRIS_CSV).columns)
+
+def test_csv_load_chunks_metadata_requires_consumed_stream():
+    stream = CSVParser().load_chunks(make_upload(b"a,b\n1,2\n", "small.csv"))
+    with pytest.raises(FileLoadError):
+        _ = stream.metadata
+
+def test_csv_load_chunks_empty_file():
+    stream = CSVParser().load_chunks(make_upload(b"", "empty.csv"))
+    with pytest.raises(FileEmptyError):
+        list(stream)
+
+@pytest.mark.parametrize("suffix, writer", [
+    (".csv", lambda df, path: df.to_csv(path, index=False)),
+    (".json", lambda df, path: df.to_json(path, orient="records")),
+    (".parquet", lambda df, path: df.to_parquet(path, index=False)),
+    (".xlsx", lambda df, path: df.to_excel(path, index=False)),
+])
+def test_load_from_path_for_every_parser(tmp_path, suffix, writer):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    path = tmp_path / f"data{suffix}"
+    writer(df, path)
+
+    loaded, metadata = IngestionFactory.get_parser(path).load_from_path(path)
+
+    pd.testing.assert_frame_equal(loaded, df)
+    assert metadata.filename == path.name
+    assert metadata.num_rows == 3
+
+def test_detect_doc_type_from_magic_bytes(tmp_path):
+    df = pd.DataFrame({"a": [1, 2]})
+    df.to_parquet(tmp_path / "blob1", index=False)
+    df.to_json(tmp_path / "blob2", orient="records")
+    df.to_csv(tmp_path / "blob3", index=False)
+
+    assert IngestionFactory.detect_doc_type(tmp_path / "blob1") == DocType.PARQUET
+    assert IngestionFactory.detect_doc_type(tmp_path / "blob2") == DocType.JSON
+    assert IngestionFactory.detect_doc_type(tmp_path / "blob3") == DocType.CSV
+    assert isinstance(IngestionFactory.get_parser("csv"), CSVParser)
+
+def test_legacy_xls_workbooks_are_rejected(tmp_path):
+    (tmp_path / "old.xls").write_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + bytes(64))
+    (tmp_path / "unnamed").write_bytes((tmp_path / "old.xls").read_bytes())
+
+    for path in (tmp_path / "old.xls", tmp_path / "unnamed"):
+        with pytest.raises(FileLoadError, match="xlsx"):
+            IngestionFactory.get_parser(path)
+
+def test_csv_arrow_engine_projection_and_dtype_hints():
+    stats = {
+        "setosa": ColumnSchema(name="setosa", type=ColType.NUMERIC, missing_pct=0.0, unique=None,
+                               mean=None, std=None, min=None, max=None, mode=None),
+    }
+    parser = CSVParser(engine="pyarrow", usecols=["150", "setosa"], dtype=dtype_hints_from_profile(stats, engine="pyarrow"))
+
+    df, metadata = parser.load_from_path(IRIS_CSV)
+
+    assert list(df.columns) == ["150", "setosa"]
+    assert isinstance(df["setosa"].dtype, pd.ArrowDtype)
+    assert str(df["setosa"].dtype) == "double[pyarrow]"
+    assert metadata.num_rows == 150
+
+def test_csv_arrow_engine_chunks_match_pandas_engine():
+    with open(IRIS_CSV, "rb") as f:
+        chunks = list(CSVParser(engine="pyarrow").load_chunks(UploadFile(filename="iris.csv", file=f), chunk_size=64))
+
+    assert [len(chunk) for chunk in chunks] == [64, 64, 22]
+    merged = pd.concat(chunks, ignore_index=True).astype("float64")
+    pd.testing.assert_frame_equal(merged, pd.read_csv(IRIS_CSV).astype("float64"))
+
+def test_parquet_column_projection_and_row_filters(tmp_path):
+    df = pd.DataFrame({"year": [2018, 2019, 2020, 2021], "sales": [1.0, 2.0, 3.0, 4.0], "region": list("abcd")})
+    path = tmp_path / "sales.parquet"
+    df.to_parquet(path, index=False, row_group_size=1)
+
+    loaded, metadata = ParquetParser().load_from_path(path, columns=["year", "sales"], filters=[("year", ">=", 2020)])
+
+    assert list(loaded.columns) == ["year", "sales"]
+    assert loaded["year"].tolist() == [2020, 2021]
+    assert metadata.num_rows == 2
+
+    with open(path, "rb") as f:
+        uploaded, _ = ParquetParser().load(UploadFile(filename="sales.parquet", file=f), columns=["sales"], filters=[("year", "<", 2019)])
+    assert uploaded["sales"].tolist() == [1.0]
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "finance.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"q": [1, 2], "revenue": [10.5, 20.0]}).to_excel(writer, sheet_name="Q1", index=False)
+        pd.DataFrame({"q": [3, 4, 5], "revenue": [1.0, 2.0, 3.0]}).to_excel(writer, sheet_name="Q2", index=False)
+    return path
+
+def test_excel_streaming_sheet_selection(workbook):
+    df, metadata = XLSXParser(sheet_name="Q2").load_from_path(workbook)
+
+    pd.testing.assert_frame_equal(df, pd.read_excel(workbook, sheet_name="Q2"))
+    assert metadata.sheet_name == "Q2"
+
+def test_excel_load_sheets_in_parallel(workbook):
+    sheets = XLSXParser().load_sheets_from_path(workbook, max_workers=2)
+
+    assert list(sheets) == ["Q1", "Q2"]
+    assert sheets["Q2"][1].num_rows == 3
+    with open(workbook, "rb") as f:
+        uploaded = XLSXParser().load_sheets(UploadFile(filename="finance.xlsx", file=f), max_workers=2)
+    for name in ("Q1", "Q2"):
+        pd.testing.assert_frame_equal(uploaded[name][0], sheets[name][0])
+
+def test_compressed_workbook_sheets_are_streamed_to_workers(tmp_path, workbook):
+    import gzip
+
+    gz_path = tmp_path / "finance.xlsx.gz"
+    gz_path.write_bytes(gzip.compress(workbook.read_bytes()))
+    with open(gz_path, "rb") as f:
+        uploaded = XLSXParser().load_sheets(UploadFile(filename=gz_path.name, file=f), max_workers=2)
+    local = XLSXParser().load_sheets_from_path(gz_path, max_workers=1)
+
+    assert list(uploaded) == list(local) == ["Q1", "Q2"]
+    pd.testing.assert_frame_equal(uploaded["Q2"][0], pd.read_excel(workbook, sheet_name="Q2"))
+    assert uploaded["Q1"][1].content_hash == local["Q1"][1].content_hash == hash_file(gz_path)
+
+@pytest.mark.parametrize("content, layout", [
+    (b'[{"a": 1}, {"a": 2}]', JSON_ARRAY),
+    (b'{"a": {"0": 1, "1": 2}}', JSON_OBJECT),
+    (b'{\n  "a": [1, 2]\n}', JSON_OBJECT),
+    (b'{"a": 1}\n{"a": 2}\n', JSON_LINES),
+])
+def test_sniff_json_layout(content, layout):
+    detected, stream = sniff_json_layout(io.BytesIO(content))
+
+    assert detected == layout
+    assert stream.read() == content
+
+@pytest.mark.parametrize("content", [b'{"a": 1, "b": "x"}\n', b'{"a": 1, "b": "x"}'])
+def test_single_flat_record_loads_as_one_row(content):
+    df, metadata = JSONParser().load(make_upload(content, "record.json"))
+
+    assert df.to_dict("records") == [{"a": 1, "b": "x"}]
+    assert metadata.num_rows == 1
+
+def test_ndjson_with_lines_longer_than_the_sniffed_bytes(monkeypatch):
+    import src.parsers.json_parser as json_parser
+
+    monkeypatch.setattr(json_parser, "SNIFF_BYTES", 16)
+    lines = b'{"id": 1, "note": "a fairly long first record"}\n{"id": 2, "note": "b"}\n'
+    detected, stream = sniff_json_layout(io.BytesIO(lines))
+    assert detected == JSON_LINES
+    assert stream.read() == lines
+
+    df, _ = JSONParser().load(make_upload(lines, "events.jsonl"))
+    assert df["id"].tolist() == [1, 2]
+
+def test_sniffing_minified_documents_reads_a_bounded_prefix(monkeypatch):
+    import src.parsers.json_parser as json_parser
+
+    class ForwardOnly(io.BytesIO):
+        def seekable(self):
+            return False
+
+    monkeypatch.setattr(json_parser, "SNIFF_BYTES", 16)
+    monkeypatch.setattr(json_parser, "SNIFF_LINE_LIMIT", 32)
+    array = ForwardOnly(b"[" + b", ".join(b'{"a": %d}' % i for i in range(100)) + b"]")
+    detected, stream = sniff_json_layout(array)
+    assert detected == JSON_ARRAY and array.tell() == 16
+    assert json.load(stream) == [{"a": i} for i in range(100)]
+
+    document = ForwardOnly(b'{"a": [' + b", ".join(b"%d" % i for i in range(100)) + b"]}")
+    detected, stream = sniff_json_layout(document)
+    assert detected == JSON_OBJECT and document.tell() == 16 + 32
+    assert JSONParser._read_document(stream, detected)["a"].tolist() == list(range(100))
+
+def test_ndjson_streamed_in_flattened_chunks():
+    lines = b"\n".join(f'{{"id": {i}, "user": {{"name": "u{i}", "age": {20 + i}}}}}'.encode() for i in range(5))
+    stream = JSONParser().load_chunks(make_upload(lines, "events.jsonl"), chunk_size=2)
+
+    chunks = list(stream)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert list(chunks[0].columns) == ["id", "user.name", "user.age"]
+    assert stream.metadata.num_rows == 5
+
+    df, metadata = JSONParser().load(make_upload(lines, "events.jsonl"))
+    assert df["user.age"].tolist() == [20, 21, 22, 23, 24]
+    assert metadata.num_columns == 3
+
+def test_optimize_memory_downcasts_and_records_memory(tmp_path):
+    n = 200
+    df = pd.DataFrame({
+        "small_int": list(range(n)),
+        "exact_float": [0.5] * n,
+        "inexact_float": [0.1] * n,
+        "city": ["paris", "rome"] * (n // 2),
+        "active": ["True", "False", "false", "TRUE"] * (n // 4),
+        "free_text": [f"note {i}" for i in range(n)],
+    })
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    loaded, metadata = IngestionFactory.get_parser(path, optimize_memory=True).load_from_path(path)
+
+    assert str(loaded["small_int"].dtype) == "int16"
+    assert str(loaded["exact_float"].dtype) == "float32"
+    assert str(loaded["inexact_float"].dtype) == "float64"
+    assert str(loaded["city"].dtype) == "category"
+    assert loaded["active"].dtype == bool
+    assert loaded["active"].tolist()[:4] == [True, False, False, True]
+    assert loaded["free_text"].dtype == object
+    assert metadata.memory_bytes_after < metadata.memory_bytes_before
+
+@pytest.mark.parametrize("suffix, writer", [
+    (".csv", lambda df, path: df.to_csv(path, index=False)),
+    (".json", lambda df, path: df.to_json(path, orient="records", lines=True)),
+    (".parquet", lambda df, path: df.to_parquet(path, index=False)),
+    (".xlsx", lambda df, path: df.to_excel(path, index=False)),
+])
+def test_content_fingerprint_matches_across_upload_and_path(tmp_path, suffix, writer):
+    df = pd.DataFrame({"a": range(50), "b": [f"v{i % 7}" for i in range(50)]})
+    path = tmp_path / f"data{suffix}"
+    writer(df, path)
+    parser = IngestionFactory.get_parser(path)
+
+    with open(path, "rb") as f:
+        _, uploaded = parser.load(UploadFile(filename=path.name, file=f))
+    _, local = parser.load_from_path(path)
+
+    assert uploaded.content_hash == local.content_hash == hash_file(path)
+    assert uploaded.column_hashes == local.column_hashes
+    assert set(local.column_hashes) == {"a", "b"}
+
+def test_chunked_stream_fingerprints_match_full_load():
+    with open(IRIS_CSV, "rb") as f:
+        stream = CSVParser().load_chunks(UploadFile(filename="iris.csv", file=f), chunk_size=32)
+        list(stream)
+    _, metadata = CSVParser().load_from_path(IRIS_CSV)
+
+    assert stream.metadata.content_hash == metadata.content_hash
+    assert stream.metadata.column_hashes == metadata.column_hashes
+
+def test_chunk_fingerprints_ignore_dtype_drift_across_chunks():
+    # Chunk 1 reads 'x' as int and 'flag' as bool; chunk 2 as float and object because of the gaps
+    content = b"x,flag,note\n1,True,a\n2,False,b\n3,,\n,True,c\n"
+    stream = CSVParser().load_chunks(make_upload(content, "drift.csv"), chunk_size=2)
+    chunks = list(stream)
+    _, metadata = CSVParser().load(make_upload(content, "drift.csv"))
+
+    assert chunks[0]["x"].dtype != chunks[1]["x"].dtype
+    assert stream.metadata.column_hashes == metadata.column_hashes
+
+def test_compressed_uploads_are_decompressed_while_streaming(tmp_path):
+    import gzip
+    import zipfile
+    import zstandard
+
+    with open(IRIS_CSV, "rb") as f:
+        raw_csv = f.read()
+    expected = pd.read_csv(IRIS_CSV)
+
+    gz_upload = make_upload(gzip.compress(raw_csv), "iris.csv.gz")
+    chunks = CSVParser().load_chunks(gz_upload, chunk_size=40)
+    assert pd.concat(list(chunks), ignore_index=True).equals(expected)
+    assert chunks.metadata.content_hash is not None
+
+    ndjson = b'{"a": 1, "b": {"c": 2}}\n{"a": 3, "b": {"c": 4}}\n'
+    zst_path = tmp_path / "events.json.zst"
+    zst_path.write_bytes(zstandard.ZstdCompressor().compress(ndjson))
+    df, metadata = JSONParser().load_from_path(zst_path)
+    assert list(df.columns) == ["a", "b.c"] and len(df) == 2
+    assert metadata.content_hash == hash_file(zst_path)
+
+    parquet_buffer = io.BytesIO()
+    expected.to_parquet(parquet_buffer)
+    zip_path = tmp_path / "export.zip"
+    with zipfile.ZipFile(zip_path, "w") as archive:
+        archive.writestr("iris.parquet", parquet_buffer.getvalue())
+    assert IngestionFactory.detect_doc_type(zip_path) == DocType.PARQUET
+    df, _ = IngestionFactory.get_parser(zip_path).load(make_upload(zip_path.read_bytes(), "export.zip"))
+    assert df.equals(expected)
+
+@pytest.mark.parametrize("suffix, writer", [
+    (".csv", lambda df, path: df.to_csv(path, index=False)),
+    (".parquet", lambda df, path: df.to_parquet(path, index=False)),
+    (".xlsx", lambda df, path: df.to_excel(path, index=False)),
+])
+def test_compressed_files_are_hashed_while_decompressed(tmp_path, monkeypatch, suffix, writer):
+    import gzip
+    import src.parsers.csv_parser as csv_parser
+    import src.parsers.excel_parser as excel_parser
+    import src.parsers.parquet_parser as parquet_parser
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    plain = tmp_path / f"data{suffix}"
+    writer(df, plain)
+    path = tmp_path / f"data{suffix}.gz"
+    path.write_bytes(gzip.compress(plain.read_bytes()))
+    expected_hash = hash_file(path)
+
+    def fail(path):
+        raise AssertionError("compressed files should not be read again to be hashed")
+    for module in (csv_parser, excel_parser, parquet_parser):
+        monkeypatch.setattr(module, "hash_file", fail)
+
+    loaded, metadata = IngestionFactory.get_parser(path).load_from_path(path)
+    pd.testing.assert_frame_equal(loaded, df)
+    assert metadata.content_hash == expected_hash
+
+def test_detect_doc_type_through_compression(tmp_path):
+    import gzip
+
+    assert IngestionFactory.detect_doc_type("sales.csv.gz") == DocType.CSV
+    assert IngestionFactory.detect_doc_type("events.ndjson.bz2") == DocType.JSON
+
+    unnamed = tmp_path / "export.gz"
+    unnamed.write_bytes(gzip.compress(b'[{"a": 1}]'))
+    assert IngestionFactory.detect_doc_type(unnamed) == DocType.JSON
+
+    stream = io.BytesIO(unnamed.read_bytes())
+    assert IngestionFactory.detect_doc_type("upload.gz", stream=stream) == DocType.JSON
+    assert stream.tell() == 0
@@ -0,0 +1,234 @@
+"""
+Unit tests for the preprocessing rules and pipeline.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.eda_core.profiler import Profiler
+from src.eda_core.stats_cache import ColumnStatsCache
+from src.utils.models import ColType, OutlierRemovalReport
+
+@pytest.fixture
+def mixed_frame():
+    rng = np.random.default_rng(11)
+    num_rows = 400
+    df = pd.DataFrame({
+        "price": rng.lognormal(sigma=1.5, size=num_rows) * 1000,
+        "score": rng.normal(5000, 1000, size=num_rows),
+        "level": rng.uniform(200, 700, size=num_rows),
+        "ratio": rng.random(num_rows),
+        "visits": rng.integers(0, 15, size=num_rows),
+        "record_id": np.arange(num_rows),
+        "city": rng.choice(["a", "b", "c"], size=num_rows),
+    })
+    df.loc[::25, "score"] = np.nan
+    df.loc[::40, "city"] = None
+    df.loc[::50, "level"] = 5000.0
+    return df
+
+def test_transformation_rules_use_cached_statistics(tmp_path, mixed_frame):
+    from src.eda_core.preprocessing_rules.transformations import transformation_rules
+
+    column_stats = Profiler(use_cache=False, engine="native", output_dir=tmp_path).profile_columns(mixed_frame)
+    rules = transformation_rules(mixed_frame, column_stats, ColumnStatsCache())
+    assert rules == {
+        "price": "log-transform",
+        "score": "standard-scaling",
+        "level": "log-transform",
+        # Values in [0, 1] are caught by the age range check first
+        "ratio": "no-transform (age-like)",
+        "visits": "no-transform (count-like)",
+        "record_id": "drop (identifier-like)",
+        "city": "one-hot-encode",
+    }
+
+def test_statistics_are_computed_once_and_invalidated_on_change(tmp_path, mixed_frame, monkeypatch):
+    from src.eda_core.preprocessing_rules.missing_values import handle_missing_values, missing_value_rules
+    from src.eda_core.preprocessing_rules.outliers import handle_outliers
+    from src.eda_core.visualization_rules.vis_rules import visualization_rules
+
+    column_stats = Profiler(use_cache=False, engine="native", output_dir=tmp_path).profile_columns(mixed_frame)
+    # The rules compare missing_pct on the percentage scale
+    column_stats = {name: stats.model_copy(update={"missing_pct": stats.missing_pct * 100}) for name, stats in column_stats.items()}
+    cache = ColumnStatsCache()
+
+    skew_calls = []
+    original_skew = pd.DataFrame.skew
+    monkeypatch.setattr(pd.DataFrame, "skew", lambda self, *args, **kwargs: skew_calls.append(list(self.columns)) or original_skew(self, *args, **kwargs))
+    missing_value_rules(mixed_frame, column_stats, cache)
+    visualization_rules(mixed_frame, column_stats, stats_cache=cache)
+    numeric = [col for col, stats in column_stats.items() if stats.type == ColType.NUMERIC]
+    # The missing value rules computed the skew of 'score'; the visualization rules only the rest
+    assert skew_calls == [["score"], [col for col in numeric if col != "score"]]
+
+    quantile_calls = []
+    original_quantile = pd.DataFrame.quantile
+    monkeypatch.setattr(pd.DataFrame, "quantile", lambda self, *args, **kwargs: quantile_calls.append(list(self.columns)) or original_quantile(self, *args, **kwargs))
+    report = OutlierRemovalReport()
+    handled = handle_outliers(mixed_frame.copy(), column_stats, cache, report=report)
+    # Bounds and caps of every numeric column come from one quantile pass
+    assert quantile_calls == [numeric]
+    assert report.rows_before == len(mixed_frame) and report.rows_after == len(handled) < len(mixed_frame)
+    # One mask removes the rows outside the bounds of any column, regardless of column order
+    assert 0 < max(report.removed_per_column.values()) <= report.rows_removed <= sum(report.removed_per_column.values())
+    reordered = handle_outliers(mixed_frame.copy(), dict(reversed(list(column_stats.items()))))
+    pd.testing.assert_index_equal(reordered.index, handled.index)
+
+    filled = handle_missing_values(mixed_frame.copy(), column_stats, cache)
+    assert filled["score"].notna().all()
+    assert cache.skew(filled, "score") == pytest.approx(filled["score"].skew())
+
+def test_fitted_plan_replays_on_new_batches(tmp_path, mixed_frame):
+    from src.pipelines.preprocessing_pipelines import PLAN_VERSION, PreprocessingPipeline
+    from src.utils.exceptions import PreprocessingError
+
+    # A non-contiguous index checks that encoded columns stay aligned with their rows
+    mixed_frame.index = mixed_frame.index * 3
+    pipeline = PreprocessingPipeline(artifacts_dir=tmp_path, profiler=Profiler(use_cache=False, engine="native", output_dir=tmp_path))
+    fitted = pipeline.run(mixed_frame.copy())
+    assert fitted.notna().all().all()
+    assert {"city_a", "city_b", "city_c"} <= set(fitted.columns)
+
+    # Replaying the plan, also after a JSON round trip, reproduces the fitted data
+    pd.testing.assert_frame_equal(pipeline.transform(mixed_frame), fitted)
+    loaded = PreprocessingPipeline(artifacts_dir=tmp_path)
+    plan = loaded.load_plan(tmp_path / "preprocessing_plan.json")
+    assert plan == pipeline.plan
+    pd.testing.assert_frame_equal(loaded.transform(mixed_frame), fitted)
+
+    # New rows are scored with the fitted parameters: unseen categories get no indicator
+    batch = mixed_frame.head(5).copy()
+    batch["city"] = ["a", "zzz", None, "c", "b"]
+    scored = loaded.transform(batch, remove_outliers=False)
+    assert len(scored) == 5
+    assert scored.loc[batch.index[1], ["city_a", "city_b", "city_c"]].tolist() == [0.0, 0.0, 0.0]
+    assert scored.loc[batch.index[2], "city_c"] == 1.0  # filled with the fitted mode
+    with pytest.raises(PreprocessingError):
+        loaded.transform(batch.drop(columns=["price"]))
+
+    (tmp_path / "newer.json").write_text(plan.model_copy(update={"version": PLAN_VERSION + 1}).model_dump_json())
+    with pytest.raises(PreprocessingError):
+        loaded.load_plan(tmp_path / "newer.json")
+
+def test_compiled_plan_matches_pandas_transform(tmp_path, mixed_frame):
+    from src.pipelines.preprocessing_pipelines import PreprocessingPipeline
+
+    mixed_frame["joined"] = pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(len(mixed_frame)) * 7, unit="h")
+    mixed_frame.loc[::30, "joined"] = pd.NaT
+    # Complete when fitted, so it has no fill value and NaT reaches the date parts
+    mixed_frame["renewed"] = mixed_frame["joined"].max() + pd.to_timedelta(np.arange(len(mixed_frame)) * 5, unit="h")
+    pipeline = PreprocessingPipeline(artifacts_dir=tmp_path, profiler=Profiler(use_cache=False, engine="native", output_dir=tmp_path))
+    pipeline.fit(mixed_frame.copy())
+    compiled = pipeline.compile()
+
+    mixed_frame.loc[1::20, "renewed"] = pd.NaT
+    records = mixed_frame.astype(object).where(mixed_frame.notna(), None).to_dict("records")
+    expected = pipeline.transform(mixed_frame)
+    compiled_rows = pd.DataFrame(compiled.transform(records), index=expected.index)
+    assert expected["renewed_year"].isna().any()
+    pd.testing.assert_frame_equal(compiled_rows, expected, check_dtype=False)
+
+    # A single record with an outlier, an unseen category and a missing value is scored like the pandas path
+    record = dict(records[1], price=1e9, city="zzz", score=None)
+    [scored] = compiled.transform(record, remove_outliers=False)
+    row = mixed_frame.iloc[[1]].assign(price=1e9, city="zzz", score=np.nan)
+    [expected_row] = pipeline.transform(row, remove_outliers=False).to_dict("records")
+    assert scored.pop("joined") == expected_row.pop("joined")
+    # A missing date comes back as None, and its parts as NaN
+    assert scored.pop("renewed") is None and expected_row.pop("renewed") is pd.NaT
+    assert scored == pytest.approx(expected_row, nan_ok=True)
+    assert np.isnan(scored["renewed_year"])
+    assert [scored["city_a"], scored["city_b"], scored["city_c"]] == [0.0, 0.0, 0.0]
+    assert compiled.transform(record) == []
+
+def test_compiled_plan_scores_records_without_an_encoded_target(tmp_path, mixed_frame):
+    from src.pipelines.preprocessing_pipelines import PreprocessingPipeline
+
+    mixed_frame["y"] = (mixed_frame["ratio"] > 0.5).astype(int)
+    pipeline = PreprocessingPipeline(artifacts_dir=tmp_path, profiler=Profiler(use_cache=False, engine="native", output_dir=tmp_path))
+    pipeline.fit(mixed_frame.copy(), target_column="y")
+    assert {"y_0", "y_1"} <= set(pipeline.plan.output_columns)
+    compiled = pipeline.compile()
+
+    features = mixed_frame.drop(columns=["y"])
+    records = features.astype(object).where(features.notna(), None).to_dict("records")
+    expected = pipeline.transform(features)
+    assert not {"y", "y_0", "y_1"} & set(expected.columns)
+    compiled_rows = pd.DataFrame(compiled.transform(records), index=expected.index)
+    pd.testing.assert_frame_equal(compiled_rows, expected, check_dtype=False)
+
+def test_apply_outlier_plan_leaves_its_input_unchanged():
+    from src.eda_core.preprocessing_rules.outliers import apply_outlier_plan
+    from src.utils.models import OutlierBounds, OutlierPlan
+
+    plan = OutlierPlan(steps=[
+        OutlierBounds(column="x", action="cap-at-percentiles", lower=0.0, upper=10.0),
+        OutlierBounds(column="y", action="remove-outliers", lower=0.0, upper=5.0),
+    ])
+    df = pd.DataFrame({"x": [-5.0, 5.0, 50.0], "y": [1.0, 9.0, 2.0]})
+    original = df.copy()
+
+    result = apply_outlier_plan(df, plan)
+    pd.testing.assert_frame_equal(df, original)
+    assert result["x"].tolist() == [0.0, 10.0]
+    assert apply_outlier_plan(df, plan, remove_outliers=False)["x"].tolist() == [0.0, 5.0, 10.0]
+
+def test_target_encoding_gives_unseen_categories_the_prior():
+    from src.eda_core.compiled_plan import CompiledPlan
+    from src.eda_core.preprocessing_rules.encodings import apply_encoding_plan, encode_and_scale
+    from src.utils.models import ColumnSchema, EncodingPlan, PreprocessingPlan
+
+    rng = np.random.default_rng(5)
+    codes = [f"c{i}" for i in range(20)]
+    df = pd.DataFrame({"code": rng.choice(codes, size=600).astype(object), "y": rng.integers(0, 2, size=600)})
+    # Missing codes mostly come with a positive target, so their encoding is far from the prior
+    df.loc[df.index[::10], ["code", "y"]] = [None, 1]
+    column_stats = {"code": ColumnSchema(name="code", type=ColType.CATEGORICAL, missing_pct=10.0, unique=20, mean=None, std=None, min=None, max=None, mode=None)}
+    plan = EncodingPlan()
+    encode_and_scale(df.copy(), column_stats, target_column="y", plan=plan)
+
+    encoding = plan.target["code"]
+    assert encoding.default == pytest.approx(df["y"].mean())
+    assert encoding.missing > encoding.default
+
+    batch = pd.DataFrame({"code": ["c3", "unseen", None], "y": [0, 0, 0]})
+    encoded = apply_encoding_plan(batch.copy(), plan)["code"].tolist()
+    assert encoded == pytest.approx([encoding.values[encoding.categories.index("c3")], encoding.default, encoding.missing])
+
+    compiled = CompiledPlan(PreprocessingPlan(version=1, input_columns=["code", "y"], output_columns=["code", "y"], target_column="y", encodings=plan))
+    scored = compiled.transform([{"code": code} for code in batch["code"]])
+    assert [row["code"] for row in scored] == pytest.approx(encoded)
+
+def test_unknown_missing_share_is_counted_from_the_data(mixed_frame):
+    from src.eda_core.preprocessing_rules.missing_values import missing_value_rules
+    from src.utils.models import ColumnSchema
+
+    mixed_frame["sparse"] = np.where(np.arange(len(mixed_frame)) % 4 == 0, 1.0, np.nan)
+    # Footer profiles without null counts leave missing_pct unknown
+    column_stats = {
+        name: ColumnSchema(name=name, type=ColType.NUMERIC, missing_pct=None, unique=None, mean=None, std=None, min=None, max=None, mode=None)
+        for name in ("price", "score", "sparse")
+    }
+    assert missing_value_rules(mixed_frame, column_stats) == {"price": "no-action", "score": "impute-mean", "sparse": "drop-column"}
+
+def test_missing_values_are_imputed_in_bulk_and_in_place(mixed_frame):
+    from src.eda_core.preprocessing_rules.missing_values import handle_missing_values
+    from src.utils.models import ColumnSchema, MissingValuePlan
+
+    mixed_frame["sparse"] = np.where(np.arange(len(mixed_frame)) % 4 == 0, 1.0, np.nan)
+    column_stats = {
+        name: ColumnSchema(name=name, type=col_type, missing_pct=mixed_frame[name].isna().mean() * 100, unique=None, mean=None, std=None, min=None, max=None, mode=None)
+        for name, col_type in [("score", ColType.NUMERIC), ("city", ColType.CATEGORICAL), ("sparse", ColType.NUMERIC), ("price", ColType.NUMERIC)]
+    }
+    copied = handle_missing_values(mixed_frame, column_stats)
+    assert "sparse" in mixed_frame and mixed_frame["score"].isna().any()
+
+    plan = MissingValuePlan()
+    result = handle_missing_values(mixed_frame, column_stats, plan=plan, inplace=True)
+    assert result is mixed_frame
+    pd.testing.assert_frame_equal(result, copied)
+    assert plan.drop_columns == ["sparse"]
+    assert plan.fill_values == {"score": pytest.approx(result["score"].mean()), "city": result["city"].mode()[0]}
+    assert not result[["score", "city"]].isna().any().any()
@@ -0,0 +1,405 @@
+"""
+Unit tests for the profiler and the metadata extractor.
+"""
+
+import pandas as pd
+import pytest
+
+from src.eda_core.metadata_extractor import MetadataExtractor
+from src.eda_core.profile_cache import ProfileCache
+from src.eda_core.profiler import Profiler
+from src.utils.exceptions import HTMLProfilingError
+from src.utils.models import ColType
+
+@pytest.fixture
+def parquet_dataset(tmp_path):
+    df = pd.DataFrame({
+        "amount": [5.0, None, 12.5, -3.0, 7.0, None],
+        "city": ["a", "b", None, "a", "c", "b"],
+        "flag": [True, False, True, True, False, True],
+    })
+    path = tmp_path / "sales.parquet"
+    df.to_parquet(path, index=False, row_group_size=2)
+    return path
+
+def test_footer_profile_seeds_column_schema(tmp_path, parquet_dataset):
+    json_path = Profiler(output_dir=tmp_path / "profiles").generate_footer_profile(parquet_dataset, report_name="sales")
+    stats = MetadataExtractor().extract_col_data(json_path)
+
+    assert stats["amount"].type == ColType.NUMERIC
+    assert stats["amount"].missing_pct == pytest.approx(2 / 6)
+    assert (stats["amount"].min, stats["amount"].max) == (-3.0, 12.5)
+    assert stats["amount"].mean is None
+    assert stats["city"].type == ColType.CATEGORICAL
+    assert stats["city"].min is None
+    assert stats["flag"].type == ColType.BOOLEAN
+
+def test_footer_without_null_counts_leaves_missing_fraction_unknown(tmp_path):
+    from src.parsers.parquet_parser import ParquetParser
+
+    path = tmp_path / "nostats.parquet"
+    pd.DataFrame({"amount": [5.0, None, 12.5]}).to_parquet(path, index=False, write_statistics=False)
+    _, stats = ParquetParser().read_footer_stats(path)
+
+    assert stats["amount"].missing_pct is None
+    json_path = Profiler(output_dir=tmp_path / "profiles", use_cache=False).generate_footer_profile(path, report_name="nostats")
+    assert MetadataExtractor().extract_col_data(json_path)["amount"].missing_pct is None
+    assert MetadataExtractor().extract_col_data(json_path, as_table=True)["amount"].missing_pct is None
+
+def test_generate_profile_reuses_cached_reports(tmp_path, monkeypatch):
+    import src.eda_core.profiler as profiler_module
+
+    df = pd.DataFrame({"x": [1.0, 2.0, 3.0, 4.0], "y": ["a", "b", "a", "b"]})
+    cache = ProfileCache(tmp_path / "cache")
+    first = Profiler(output_dir=tmp_path / "profiles", cache=cache).generate_profile(df, report_name="first")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("ydata-profiling should not run on a cache hit")
+    monkeypatch.setattr(profiler_module, "ProfileReport", fail)
+
+    second = Profiler(output_dir=tmp_path / "profiles", cache=cache).generate_profile(df.copy(), report_name="second")
+    with open(first) as f1, open(second) as f2:
+        assert f1.read() == f2.read()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_profile_columns_without_persisting_fills_the_cache(tmp_path, monkeypatch):
+    import src.eda_core.profiler as profiler_module
+
+    df = pd.DataFrame({"x": [1.0, 2.0, None, 4.0], "y": ["a", "b", "a", "b"]})
+    cache = ProfileCache(tmp_path / "cache")
+    first = Profiler(output_dir=tmp_path / "profiles", cache=cache).profile_columns(df)
+    assert not (tmp_path / "profiles" / "report.json").exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("ydata-profiling should not run on a cache hit")
+    monkeypatch.setattr(profiler_module, "ProfileReport", fail)
+
+    second = Profiler(output_dir=tmp_path / "profiles", cache=cache).profile_columns(df.copy())
+    assert second == first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_profile_cache_evicts_least_recently_used(tmp_path):
+    import os
+
+    report = tmp_path / "report.json"
+    report.write_text("x" * 100)
+    cache = ProfileCache(tmp_path / "cache", max_bytes=250)
+
+    cache.put("a", {"json": report})
+    cache.put("b", {"json": report})
+    os.utime(cache.cache_dir / "a", (0, 0))
+    os.utime(cache.cache_dir / "b", (1, 1))
+    assert cache.get("a") is not None  # a becomes the most recently used entry
+    cache.put("c", {"json": report})
+
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    stats = cache.stats()
+    assert (stats.entries, stats.evictions, stats.hits, stats.misses) == (2, 1, 2, 1)
+
+def test_native_engine_matches_pandas_statistics(tmp_path):
+    df = pd.DataFrame({
+        "amount": [5.0, None, 12.5, -3.0, 7.0, None, 1.0, 2.0],
+        "count": [1, 2, 3, 4, 5, 6, 7, 8],
+        "grade": [1, 2, 1, 2, 1, 2, 1, 3],
+        "city": ["a", "b", None, "a", "a", "b", "a", "b"],
+        "comment": [f"note {i}" for i in range(8)],
+        "flag": [True, False, True, True, False, True, True, True],
+        "when": pd.date_range("2024-01-01", periods=8),
+    })
+    json_path = Profiler(output_dir=tmp_path, use_cache=False, engine="native").generate_profile(df, report_name="native")
+    stats = MetadataExtractor().extract_col_data(json_path)
+
+    assert not (tmp_path / "native.html").exists()
+    for col in ["amount", "count"]:
+        assert stats[col].type == ColType.NUMERIC
+        assert stats[col].missing_pct == pytest.approx(df[col].isna().mean())
+        assert stats[col].unique == df[col].nunique()
+        assert stats[col].mean == pytest.approx(df[col].mean())
+        assert stats[col].std == pytest.approx(df[col].std())
+        assert (stats[col].min, stats[col].max) == (df[col].min(), df[col].max())
+
+    assert stats["grade"].type == ColType.CATEGORICAL
+    assert (stats["grade"].unique, stats["grade"].mode) == (3, "1")
+    assert stats["city"].type == ColType.CATEGORICAL
+    assert (stats["city"].unique, stats["city"].mode) == (2, "a")
+    assert stats["comment"].type == ColType.TEXT
+    assert stats["flag"].type == ColType.BOOLEAN
+    assert stats["when"].type == ColType.DATETIME
+
+def test_html_report_is_rendered_on_demand_and_cached(tmp_path, monkeypatch):
+    import src.eda_core.profiler as profiler_module
+
+    df = pd.DataFrame({"x": [1.0, 2.0, 3.0, 4.0], "y": ["a", "b", "a", "b"]})
+    cache = ProfileCache(tmp_path / "cache")
+    profiler = Profiler(output_dir=tmp_path / "profiles", cache=cache)
+    profiler.generate_profile(df, report_name="data")
+    assert not (tmp_path / "profiles" / "data.html").exists()
+
+    html_path = profiler.render_html_async("data").result(timeout=120)
+    assert html_path.endswith("data.html") and (tmp_path / "profiles" / "data.html").exists()
+    assert profiler.render_html("data") == html_path
+
+    # A later profile of the same data gets the rendered HTML from the cache
+    monkeypatch.setattr(profiler_module, "ProfileReport", None)
+    other = Profiler(output_dir=tmp_path / "other", cache=cache)
+    other.generate_profile(df, report_name="data")
+    assert (tmp_path / "other" / "data.html").exists()
+
+def test_render_html_without_profile_raises(tmp_path):
+    with pytest.raises(HTMLProfilingError):
+        Profiler(output_dir=tmp_path, use_cache=False).render_html("missing")
+
+def test_pending_html_reports_are_bounded(tmp_path, monkeypatch):
+    import src.eda_core.profiler as profiler_module
+
+    monkeypatch.setattr(profiler_module, "PENDING_HTML_LIMIT", 2)
+    profiler = Profiler(output_dir=tmp_path, use_cache=False, engine="native")
+    frames = {name: pd.DataFrame({"x": [float(i), 2.0, 3.0]}) for i, name in enumerate(["a", "b", "c"])}
+    for name, df in frames.items():
+        profiler.generate_profile(df, report_name=name)
+
+    assert list(profiler._pending_html) == ["b", "c"]
+    with pytest.raises(HTMLProfilingError):
+        profiler.render_html("a")
+    assert profiler.render_html("a", df=frames["a"]).endswith("a.html")
+
+def test_sampled_ydata_report_applies_estimates_once(tmp_path, monkeypatch):
+    import json
+    import numpy as np
+    import src.eda_core.profiler as profiler_module
+
+    calls = []
+    apply_sample_estimates = profiler_module.apply_sample_estimates
+    monkeypatch.setattr(profiler_module, "apply_sample_estimates", lambda *args: calls.append(1) or apply_sample_estimates(*args))
+
+    df = pd.DataFrame({"x": np.arange(500, dtype=float)})
+    profiler = Profiler(output_dir=tmp_path, use_cache=False, sample_threshold=100, sample_size=50)
+    with open(profiler.generate_profile(df, report_name="sampled")) as f:
+        report = json.load(f)
+
+    assert len(calls) == 1
+    assert report["table"]["n"] == 500 and report["table"]["sample_size"] == 50
+    assert report["variables"]["x"]["is_estimate"]
+    assert (report["variables"]["x"]["min"], report["variables"]["x"]["max"]) == (0.0, 499.0)
+
+def test_sampled_profile_labels_estimates_and_keeps_exact_counts(tmp_path):
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    n = 50_000
+    df = pd.DataFrame({
+        "value": rng.normal(10.0, 2.0, size=n),
+        "group": rng.choice(["a", "b", "c", "rare"], size=n, p=[0.5, 0.3, 0.199, 0.001]),
+        "key": np.arange(n),
+    })
+    df.loc[df.sample(frac=0.1, random_state=1).index, "value"] = np.nan
+
+    profiler = Profiler(output_dir=tmp_path, use_cache=False, engine="native", sample_threshold=10_000, sample_size=5_000, stratify_by="group")
+    stats = MetadataExtractor().extract_col_data(profiler.generate_profile(df, report_name="sampled"))
+
+    value = stats["value"]
+    assert value.is_estimate
+    assert value.missing_pct == pytest.approx(df["value"].isna().mean())
+    assert (value.min, value.max) == (df["value"].min(), df["value"].max())
+    low, high = value.confidence_intervals["mean"]
+    assert low <= df["value"].mean() <= high
+    assert value.confidence_intervals["std"][0] <= value.std <= value.confidence_intervals["std"][1]
+
+    # Stratification keeps even the rarest group in the sample
+    assert stats["group"].unique == 4
+    assert stats["key"].unique == n
+    low, high = stats["key"].confidence_intervals["unique"]
+    assert low <= n <= high
+
+def test_stratified_sample_keeps_every_group():
+    from src.eda_core.sampling import draw_sample
+
+    df = pd.DataFrame({"group": ["common"] * 9_990 + ["rare"] * 9 + [None], "value": range(10_000)})
+    sample = draw_sample(df, 100, stratify_by="group")
+
+    counts = sample["group"].value_counts(dropna=False)
+    assert counts["common"] == 100
+    assert counts["rare"] == 1 and counts[None] == 1
+    assert sample.index.is_unique
+
+def test_small_dataset_is_profiled_exactly(tmp_path):
+    df = pd.DataFrame({"x": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]})
+    profiler = Profiler(output_dir=tmp_path, use_cache=False, engine="native", sample_threshold=100)
+    stats = MetadataExtractor().extract_col_data(profiler.generate_profile(df, report_name="exact"))
+    assert not stats["x"].is_estimate
+    assert stats["x"].confidence_intervals == {}
+
+def test_sketch_profile_from_chunks_and_merged_partitions(tmp_path):
+    import numpy as np
+    from src.eda_core.sketches import ProfileSketch
+
+    rng = np.random.default_rng(3)
+    n = 40_000
+    df = pd.DataFrame({
+        "value": rng.normal(5.0, 3.0, size=n),
+        "id": np.arange(n),
+        "level": rng.choice(["low", "mid", "high"], size=n, p=[0.6, 0.3, 0.1]),
+    })
+    df.loc[::10, "value"] = np.nan
+    chunks = [df.iloc[start:start + 7_000] for start in range(0, n, 7_000)]
+
+    # Two workers sketch half of the chunks each, then merge
+    left = ProfileSketch.from_chunks(chunks[:3])
+    right = ProfileSketch.from_chunks(chunks[3:])
+    json_path = Profiler(output_dir=tmp_path, use_cache=False).generate_sketch_profile(left.merge(right), report_name="sketch")
+    stats = MetadataExtractor().extract_col_data(json_path)
+
+    value = stats["value"]
+    assert value.type == ColType.NUMERIC
+    assert value.missing_pct == pytest.approx(0.1)
+    assert value.mean == pytest.approx(df["value"].mean())
+    assert value.std == pytest.approx(df["value"].std())
+    assert (value.min, value.max) == (df["value"].min(), df["value"].max())
+    assert stats["id"].unique == pytest.approx(n, rel=0.03)
+    assert stats["id"].is_estimate
+    assert (stats["level"].type, stats["level"].unique, stats["level"].mode) == (ColType.CATEGORICAL, 3, "low")
+
+    sketch = ProfileSketch.from_chunks(chunks)
+    median = sketch.quantiles("value")["50%"]
+    assert (df["value"].dropna() <= median).mean() == pytest.approx(0.5, abs=0.03)
+
+def test_parallel_native_profile_matches_serial():
+    import numpy as np
+    from src.eda_core.native_profiler import NativeProfiler
+
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({f"num_{i}": rng.normal(size=200) for i in range(10)})
+    df["grade"] = rng.integers(0, 3, size=200)
+    df["city"] = rng.choice(["a", "b", "c"], size=200)
+    df.loc[::7, "num_3"] = np.nan
+
+    serial = NativeProfiler().profile(df)
+    parallel = NativeProfiler(max_workers=2, batch_size=4).profile(df)
+    assert list(parallel) == list(df.columns)
+    assert parallel == serial
+
+@pytest.mark.parametrize("engine", ["native", "ydata"])
+def test_profile_columns_hands_over_stats_in_memory(tmp_path, engine):
+    df = pd.DataFrame({"x": [1.0, 2.0, None, 4.0, 5.0, 6.0], "y": ["a", "b", "a", "b", "a", "a"]})
+
+    in_memory = Profiler(output_dir=tmp_path / "memory", use_cache=False, engine=engine).profile_columns(df, report_name="data")
+    assert not (tmp_path / "memory" / "data.json").exists()
+
+    json_path = Profiler(output_dir=tmp_path / "disk", use_cache=False, engine=engine).generate_profile(df, report_name="data")
+    from_disk = MetadataExtractor().extract_col_data(json_path)
+    assert in_memory.keys() == from_disk.keys()
+    for col in from_disk:
+        assert in_memory[col] == from_disk[col]
+    assert MetadataExtractor().extract_col_data(json_path, streaming=True) == from_disk
+
+def test_streaming_extraction_reads_only_variables(tmp_path, monkeypatch):
+    import json
+    from src.eda_core import profile_stream
+
+    profile = {
+        "analysis": {"title": "report", "notes": "braces } and [ inside \"quotes\""},
+        "variables": {
+            "price": {"type": "Numeric", "p_missing": 0.25, "n_unique": 3, "mean": 1.5e3, "std": 2.0,
+                      "min": -1, "max": 1e10, "histogram": {"counts": list(range(500))}, "value_counts": {"1": 2}},
+            "naïve \"city\"\\": {"type": "Categorical", "p_missing": 0.0, "n_unique": 2, "mode": "São {Paulo}",
+                                        "samples": ["x" * 300, {"nested": [[], {}]}]},
+            "flag": {"type": "Boolean", "p_missing": 0.0, "n_unique": 2, "is_estimate": True,
+                     "confidence_intervals": {"n_unique": [2, 3]}},
+        },
+        "samples": {"head": "x" * 1000},
+    }
+    path = tmp_path / "profile.json"
+    path.write_text(json.dumps(profile, indent=2), encoding="utf-8")
+
+    loaded = MetadataExtractor().extract_col_data(path, streaming=False)
+    # Tiny blocks make tokens and strings straddle block boundaries
+    monkeypatch.setattr(profile_stream, "READ_BLOCK_CHARS", 7)
+    streamed = MetadataExtractor().extract_col_data(path, streaming=True)
+    assert streamed == loaded
+    assert streamed["flag"].confidence_intervals == {"n_unique": (2, 3)}
+
+    columns = dict(profile_stream.iter_profile_variables(path))
+    assert "histogram" not in columns["price"] and "samples" not in columns["naïve \"city\"\\"]
+
+    (tmp_path / "empty.json").write_text('{"analysis": {}}', encoding="utf-8")
+    assert MetadataExtractor().extract_col_data(tmp_path / "empty.json", streaming=True) == {}
+
+    (tmp_path / "broken.json").write_text('{"variables": {"a": {"type": "Numeric"', encoding="utf-8")
+    from src.utils.exceptions import RuleProcessingError
+    with pytest.raises(RuleProcessingError):
+        MetadataExtractor().extract_col_data(tmp_path / "broken.json", streaming=True)
+
+@pytest.mark.parametrize("engine", ["native", "ydata"])
+def test_binary_report_format_round_trips(tmp_path, engine):
+    import json
+    from src.eda_core import profile_format
+
+    df = pd.DataFrame({"x": [1.0, 2.0, None, 4.0, 5.0, 6.0], "y": ["a", "b", "a", "b", "a", "a"]})
+    json_path = Profiler(output_dir=tmp_path / "json", use_cache=False, engine=engine).generate_profile(df, report_name="data")
+    arrow_path = Profiler(output_dir=tmp_path / "arrow", engine=engine, report_format="arrow").generate_profile(df, report_name="data")
+    assert arrow_path.endswith(".arrow")
+    assert MetadataExtractor().extract_col_data(arrow_path) == MetadataExtractor().extract_col_data(json_path)
+
+    exported = profile_format.export_profile_json(arrow_path)
+    with open(exported, encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["format_version"] == profile_format.PROFILE_FORMAT_VERSION
+    assert report["table"]["n"] == len(df)
+    assert MetadataExtractor().extract_col_data(exported) == MetadataExtractor().extract_col_data(arrow_path)
+
+def test_binary_profile_keeps_sketch_quantiles_and_rejects_newer_versions(tmp_path, monkeypatch):
+    from src.eda_core import profile_format
+    from src.utils.exceptions import RuleProcessingError
+
+    df = pd.DataFrame({"x": range(1000), "y": ["a", "b"] * 500})
+    arrow_path = Profiler(output_dir=tmp_path, use_cache=False, report_format="arrow").generate_sketch_profile([df[:400], df[400:]])
+    variables = profile_format.read_binary_profile(arrow_path)["variables"]
+    assert variables["x"]["50%"] == pytest.approx(500, rel=0.05)
+    assert variables["x"]["is_estimate"] is True
+
+    monkeypatch.setattr(profile_format, "PROFILE_FORMAT_VERSION", 2)
+    newer = profile_format.write_binary_profile(tmp_path / "newer.arrow", MetadataExtractor().extract_col_data(arrow_path))
+    monkeypatch.setattr(profile_format, "PROFILE_FORMAT_VERSION", 1)
+    with pytest.raises(RuleProcessingError):
+        MetadataExtractor().extract_col_data(newer)
+
+def test_column_stats_table_filters_and_matches_schema_dict(tmp_path):
+    import numpy as np
+    from src.eda_core.column_stats import ColumnStatsTable
+    from src.eda_core.preprocessing_rules.encodings import encoding_rules
+    from src.eda_core.preprocessing_rules.missing_values import missing_value_rules
+    from src.eda_core.preprocessing_rules.outliers import outlier_rules
+    from src.eda_core.visualization_rules.vis_rules import visualization_rules
+
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        "skewed": rng.exponential(size=300) ** 3,
+        "normal": rng.normal(size=300),
+        "sparse": rng.normal(size=300),
+        "city": rng.choice(["a", "b", "c"], size=300),
+    })
+    df.loc[:9, ["skewed", "normal", "city"]] = np.nan
+    df.loc[20:, "sparse"] = np.nan
+
+    profiler = Profiler(output_dir=tmp_path, use_cache=False, engine="native")
+    as_dict = profiler.profile_columns(df)
+    table = profiler.profile_columns(df, as_table=True)
+    assert isinstance(table, ColumnStatsTable) and table == as_dict
+    assert "city" in table and table["normal"] == as_dict["normal"]
+
+    mostly_missing = table.filter(table.is_type(ColType.NUMERIC) & (table.missing_pct > 0.5))
+    assert list(mostly_missing) == ["sparse"]
+
+    json_path = Profiler(output_dir=tmp_path, use_cache=False, engine="native").generate_profile(df, report_name="data")
+    assert MetadataExtractor().extract_col_data(json_path, as_table=True) == as_dict
+    assert MetadataExtractor().extract_col_data(json_path, streaming=True, as_table=True) == as_dict
+    arrow_path = Profiler(output_dir=tmp_path, use_cache=False, engine="native", report_format="arrow").generate_profile(df, report_name="data")
+    assert MetadataExtractor().extract_col_data(arrow_path, as_table=True) == as_dict
+
+    # The rules give the same answers for both containers
+    missing_dict = {name: stats.model_copy(update={"missing_pct": stats.missing_pct * 100}) for name, stats in as_dict.items()}
+    for rule in (missing_value_rules, outlier_rules, encoding_rules):
+        assert rule(df, ColumnStatsTable.from_column_stats(missing_dict)) == rule(df, missing_dict)
+    assert missing_value_rules(df, missing_dict)["skewed"] == "impute-median"
+    assert visualization_rules(df, table, target_column="city", task_type="classification") == visualization_rules(df, as_dict, target_column="city", task_type="classification")
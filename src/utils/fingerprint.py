@@ -0,0 +1,200 @@
+"""
+Dataset Fingerprints
+
+This module computes content hashes that identify a dataset independently of
+its filename. The raw file is hashed while the parser reads it, in the same
+pass, and each column of the loaded frame gets its own hash so downstream
+caches can key on exactly the data they consume.
+"""
+
+#Import libraries
+import hashlib
+import io
+import mmap
+from pathlib import Path
+from typing import BinaryIO, Dict, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Digest size in bytes of the BLAKE2b fingerprints (32 hex characters)
+DIGEST_SIZE = 16
+
+# Block size used when the remaining bytes of a stream have to be hashed
+HASH_BLOCK_SIZE = 1 << 20
+
+def new_hash() -> "hashlib.blake2b":
+    """Create an empty fingerprint hash object."""
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+class HashingReader(io.RawIOBase):
+    """
+    Raw reader that hashes the bytes of the wrapped stream as they are read.
+
+    Sequential readers (CSV, JSON) are hashed entirely in the parsing pass.
+    Readers that seek around (Parquet footers, xlsx zip directories) leave gaps;
+    `hexdigest` hashes whatever has not been read contiguously from the start.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        """
+        Args:
+            stream (BinaryIO): The binary stream to read from.
+        """
+        super().__init__()
+        self._stream = stream
+        self._hash = new_hash()
+        self._seekable = hasattr(stream, "seekable") and stream.seekable()
+        self._position = stream.tell() if self._seekable else 0
+        self._hashed_upto = self._position
+        self._digest = None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._seekable
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._position = self._stream.seek(offset, whence)
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        self._update(self._position, data)
+        self._position += size
+        return size
+
+    def _update(self, position: int, data: bytes):
+        """Hash the part of `data` that extends the contiguously hashed prefix."""
+        end = position + len(data)
+        if position <= self._hashed_upto < end:
+            self._hash.update(memoryview(data)[self._hashed_upto - position:])
+            self._hashed_upto = end
+
+    def hexdigest(self) -> str:
+        """
+        Finish hashing the stream and return the fingerprint. Bytes the parser
+        did not read contiguously are read here, so the digest always covers
+        the whole stream.
+        """
+        if self._digest is None:
+            if self.seekable():
+                self._stream.seek(self._hashed_upto)
+            for block in iter(lambda: self._stream.read(HASH_BLOCK_SIZE), b""):
+                self._hash.update(block)
+            self._digest = self._hash.hexdigest()
+        return self._digest
+
+def open_hashing_stream(stream: BinaryIO) -> Tuple[io.BufferedReader, HashingReader]:
+    """
+    Wrap a binary stream so that it is hashed while being parsed.
+
+    Args:
+        stream (BinaryIO): The upload handle.
+
+    Returns:
+        Tuple[io.BufferedReader, HashingReader]: A buffered stream to hand to the
+            parser, and the hasher whose `hexdigest` gives the content fingerprint.
+    """
+    hasher = HashingReader(stream)
+    return io.BufferedReader(hasher), hasher
+
+def hash_bytes(content: bytes) -> str:
+    """Fingerprint of an in-memory payload."""
+    digest = new_hash()
+    digest.update(content)
+    return digest.hexdigest()
+
+def hash_file(path: Union[str, Path]) -> str:
+    """Fingerprint of a file on disk, hashed from a memory map without copying it."""
+    digest = new_hash()
+    with open(path, "rb") as f:
+        if Path(path).stat().st_size == 0:
+            return digest.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            digest.update(mapped)
+    return digest.hexdigest()
+
+# Hash of every missing value, whatever the dtype of the column holding it
+_NULL_HASH = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+def _value_hashes(series: pd.Series) -> np.ndarray:
+    """
+    Hash the values of a column independently of the dtype a reader inferred
+    for it: integral numbers hash alike whether stored as int or float,
+    booleans alike whether stored as bool or object, and missing values alike
+    in every dtype. A chunk then hashes the same as the rows of a full load.
+    """
+    if pd.api.types.is_bool_dtype(series):
+        series = series.astype(object)
+    missing = series.isna().to_numpy()
+
+    if pd.api.types.is_integer_dtype(series) and not missing.any():
+        hashes = pd.util.hash_array(series.to_numpy(dtype=np.int64))
+    elif pd.api.types.is_numeric_dtype(series):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        hashes = pd.util.hash_array(values)
+        with np.errstate(invalid="ignore"):
+            integral = np.isfinite(values) & (values == np.floor(values)) & (np.abs(values) < 2.0 ** 63)
+        hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64))
+    else:
+        hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    hashes[missing] = _NULL_HASH
+    return hashes
+
+class ColumnHasher:
+    """
+    Incremental per-column fingerprints. Feeding a frame in chunks gives the
+    same digests as feeding it at once, even when the chunks were read with
+    different dtypes for a column (e.g. int in one chunk and float in another).
+    """
+
+    def __init__(self):
+        self._hashes: Dict[str, "hashlib.blake2b"] = {}
+
+    def update(self, df: pd.DataFrame):
+        """Add the rows of `df` to the column fingerprints."""
+        for col in df.columns:
+            self._hashes.setdefault(str(col), new_hash()).update(_value_hashes(df[col]).tobytes())
+
+    def hexdigests(self) -> Dict[str, str]:
+        """Fingerprint of every column seen so far."""
+        return {col: digest.hexdigest() for col, digest in self._hashes.items()}
+
+def column_fingerprints(df: pd.DataFrame) -> Dict[str, str]:
+    """
+    Fingerprint every column of a DataFrame.
+
+    Args:
+        df (pd.DataFrame): The loaded dataset.
+
+    Returns:
+        Dict[str, str]: Mapping of column names to their content hash.
+    """
+    hasher = ColumnHasher()
+    hasher.update(df)
+    return hasher.hexdigests()
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Fingerprint a whole DataFrame from its column names, dtypes and values.
+    Two frames with the same fingerprint are profiled identically.
+
+    Args:
+        df (pd.DataFrame): The dataset.
+
+    Returns:
+        str: Content hash of the frame.
+    """
+    digest = new_hash()
+    digest.update(str(df.shape).encode())
+    column_hashes = column_fingerprints(df)
+    for col, dtype in df.dtypes.items():
+        digest.update(f"{col}\0{dtype}\0{column_hashes[str(col)]}\n".encode())
+    return digest.hexdigest()
@@ -8,7 +8,7 @@ for type safety and validation
 from pydantic import BaseModel, Field, EmailStr
 from uuid import UUID, uuid4
 from datetime import datetime
-from typing import Optional, List, Literal, Any, Dict, Union
+from typing import Optional, List, Literal, Any, Dict, Tuple, Union
 from enum import Enum
 
 #Enums
@@ -91,18 +91,26 @@ class DatasetMetaData(BaseModel):
     num_rows: int
     num_columns: int
     column_names: list[str]
+    sheet_name: Optional[str] = None
+    memory_bytes_before: Optional[int] = None
+    memory_bytes_after: Optional[int] = None
+    content_hash: Optional[str] = None
+    column_hashes: Dict[str, str] = Field(default_factory=dict)
 
 class ColumnSchema(BaseModel):
     """Base model for Column Schema"""
     name: str
     type: ColType
-    missing_pct: float
+    # None when the missing share is unknown, e.g. Parquet footers without null counts
+    missing_pct: Optional[float]
     unique: Optional[int]
     mean: Optional[float]
     std: Optional[float]
     min: Optional[float]
     max: Optional[float]
     mode: Optional[str]
+    is_estimate: bool = False
+    confidence_intervals: Dict[str, Tuple[float, float]] = Field(default_factory=dict)
 
 class QualityCheck(BaseModel):
     """Base model for Quality Check"""
@@ -120,6 +128,81 @@ class DataProfile(BaseModel):
     recommendations: List[str] = Field(default_factory=list)
     quality_checks: List[QualityCheck] = Field(default_factory=list)
 
+class ProfileCacheStats(BaseModel):
+    """Base model for Profile Cache Statistics"""
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+class MissingValuePlan(BaseModel):
+    """Base model for fitted missing value handling"""
+    drop_columns: List[str] = Field(default_factory=list)
+    fill_values: Dict[str, Any] = Field(default_factory=dict)
+
+class OutlierBounds(BaseModel):
+    """Base model for fitted outlier bounds of a column"""
+    column: str
+    action: Literal["remove-outliers", "cap-at-percentiles"]
+    lower: float
+    upper: float
+
+class OutlierRemovalReport(BaseModel):
+    """Base model for the rows removed by outlier handling"""
+    rows_before: int = 0
+    rows_after: int = 0
+    rows_removed: int = 0
+    removed_per_column: Dict[str, int] = Field(default_factory=dict)
+    capped_columns: List[str] = Field(default_factory=list)
+
+class OutlierPlan(BaseModel):
+    """Base model for fitted outlier handling, in the order the steps were fitted"""
+    steps: List[OutlierBounds] = Field(default_factory=list)
+
+class TargetEncoding(BaseModel):
+    """Base model for a fitted target encoding of a column"""
+    categories: List[Any]
+    values: List[float]
+    # Encoding of unseen categories: the target prior
+    default: float
+    # Encoding of missing values, which differs from the prior when the training column had missing values
+    missing: Optional[float] = None
+
+class ScalingParams(BaseModel):
+    """Base model for fitted scaling parameters: (x - center) / scale"""
+    center: float
+    scale: float
+
+class EncodingPlan(BaseModel):
+    """Base model for fitted encoding and scaling"""
+    one_hot: Dict[str, List[Any]] = Field(default_factory=dict)
+    target: Dict[str, TargetEncoding] = Field(default_factory=dict)
+    scaling: Dict[str, ScalingParams] = Field(default_factory=dict)
+
+class TransformationStep(BaseModel):
+    """Base model for a fitted transformation of a column"""
+    column: str
+    action: Literal["drop", "log1p", "scale", "to-int", "date-parts"]
+    params: Optional[ScalingParams] = None
+
+class TransformationPlan(BaseModel):
+    """Base model for fitted transformations, in the order the steps were fitted"""
+    steps: List[TransformationStep] = Field(default_factory=list)
+
+class PreprocessingPlan(BaseModel):
+    """Base model for a fitted, serializable preprocessing plan"""
+    version: int
+    created_at: datetime = Field(default_factory=datetime.now)
+    input_columns: List[str]
+    output_columns: List[str] = Field(default_factory=list)
+    target_column: Optional[str] = None
+    missing_values: MissingValuePlan = Field(default_factory=MissingValuePlan)
+    outliers: OutlierPlan = Field(default_factory=OutlierPlan)
+    encodings: EncodingPlan = Field(default_factory=EncodingPlan)
+    transformations: TransformationPlan = Field(default_factory=TransformationPlan)
+
 class TaskStatus(BaseModel):
     """Base model for Task Status"""
     task_id: UUID